@@ -0,0 +1,62 @@
+"""
+time of splitting long multi-byte notes into CONC chunks,
+utf8_chunksplit against the previous quadratic (re-encode every candidate slice) chunker.
+
+    python benchmarks/bench_chunksplit.py --chars 32767
+"""
+import argparse
+import json
+import logging
+import timeit
+
+from genealogy.gedcomish.common import utf8_chunksplit
+
+SAFE_CHUNKSIZE = 255 - len("99") - len(" ") - len("NOTE") - len("\n") - len(" ")
+
+ALPHABETS = {
+    "ascii": "Bosatt i Skovde, flyttade till Goteborg. ",
+    "swedish": "Bosatt i Skövde, flyttade till Göteborg år 1850, sedan Västerås och Örebro. Åker ",
+    "cjk": "他出生于斯德哥尔摩，后来移居哥德堡。",
+    "mixed": "Född i Åmål 1823. 生于瑞典。 Död i Västerås. ",
+}
+
+
+def quadratic_chunksplit(slicable, safe_chunksize: int):
+    from_char = 0
+    while from_char < len(slicable):
+        for to_char in range(from_char + safe_chunksize, from_char, -1):
+            if len(slicable[from_char:to_char].encode("utf-8")) <= safe_chunksize:
+                yield slicable[from_char:to_char]
+                from_char = to_char
+                break
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chars", type=int, default=32767, help="length of each note (TEXT allows 32767)")
+    parser.add_argument("--repeat", type=int, default=5)
+    pargs = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = dict()
+    for name, alphabet in ALPHABETS.items():
+        note = (alphabet * (pargs.chars // len(alphabet) + 1))[0 : pargs.chars]
+        expected = list(quadratic_chunksplit(note, SAFE_CHUNKSIZE))
+        assert list(utf8_chunksplit(note, SAFE_CHUNKSIZE)) == expected
+        quadratic = min(
+            timeit.repeat(lambda: list(quadratic_chunksplit(note, SAFE_CHUNKSIZE)), number=1, repeat=pargs.repeat)
+        )
+        linear = min(timeit.repeat(lambda: list(utf8_chunksplit(note, SAFE_CHUNKSIZE)), number=1, repeat=pargs.repeat))
+        results[name] = {
+            "chars": len(note),
+            "bytes": len(note.encode("utf-8")),
+            "chunks": len(expected),
+            "quadratic_s": quadratic,
+            "linear_s": linear,
+            "speedup": quadratic / linear,
+        }
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":
+    main()
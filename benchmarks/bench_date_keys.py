@@ -0,0 +1,108 @@
+"""
+range queries ("born 1840-1860") over the dates of a synthetic GEDCOM file: a full scan re-parsing every date per query
+against a date_index (julian day number bounds in numpy int32 arrays, sorted) built once and searched with select,
+checking that both find the same events.
+
+    python benchmarks/bench_date_keys.py --individuals 100000 --queries 20
+"""
+import argparse
+import io
+import json
+import logging
+import random
+import time
+
+from genealogy.gedcomish.gedcom555ish.dates import date_index, date_key, iter_dates, parse_date_value, select
+from genealogy.gedcomish.gedcom555ish.reader import iter_nodes
+
+MONTHS = ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+
+
+def gedcom_date(rng: random.Random) -> str:
+    year, month, day = rng.randint(1600, 1950), rng.choice(MONTHS), rng.randint(1, 28)
+    return rng.choice(
+        (
+            f"{day} {month} {year}",
+            f"{day} {month} {year}",
+            f"{month} {year}",
+            f"{year}",
+            f"ABT {year}",
+            f"BEF {year}",
+            f"BET {year} AND {year + 5}",
+            f"@#DJULIAN@ {day} {month} {year}",
+            f"(omkring {year})",
+        )
+    )
+
+
+def synthetic(individuals: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = ["0 HEAD", "1 GEDC", "2 VERS 5.5.5", "2 FORM LINEAGE-LINKED", "3 VERS 5.5.5", "1 CHAR UTF-8"]
+    for no in range(individuals):
+        lines.extend((f"0 @I{no}@ INDI", "1 BIRT", f"2 DATE {gedcom_date(rng)}", "2 PLAC Skövde"))
+        lines.extend(("1 DEAT", f"2 DATE {gedcom_date(rng)}"))
+    lines.append("0 TRLR")
+    return "\n".join(lines) + "\n"
+
+
+def scan(nodes, lower: int, upper: int) -> list:
+    date_key.cache_clear()
+    parse_date_value.cache_clear()
+    found = list()
+    for xref_id, tag, text in iter_dates(nodes):
+        key = date_key(text)
+        if key.lower <= upper and key.upper >= lower:
+            found.append((xref_id, tag))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    nodes = list(iter_nodes(io.StringIO(synthetic(pargs.individuals))))
+    rng = random.Random(1)
+    queries = [date_key(f"BET {year} AND {year + 20}")[0:2] for year in (rng.randint(1600, 1930) for _ in range(20))]
+    queries = (queries * (pargs.queries // len(queries) + 1))[0 : pargs.queries]
+
+    start = time.perf_counter()
+    scanned = [scan(nodes, lower, upper) for lower, upper in queries]
+    scan_time = time.perf_counter() - start
+
+    date_key.cache_clear()
+    parse_date_value.cache_clear()
+    start = time.perf_counter()
+    index = date_index(nodes)
+    index_time = time.perf_counter() - start
+    start = time.perf_counter()
+    selected = [select(index, lower, upper) for lower, upper in queries]
+    select_time = time.perf_counter() - start
+
+    identical = all(
+        sorted(found) == sorted((index.xref_ids[no], index.tags[no]) for no in positions)
+        for found, positions in zip(scanned, selected)
+    )
+    print(
+        json.dumps(
+            {
+                "individuals": pargs.individuals,
+                "dates": len(index.xref_ids),
+                "queries": len(queries),
+                "scan_per_query_s": scan_time / len(queries),
+                "index_s": index_time,
+                "select_per_query_s": select_time / len(queries),
+                "found_per_query": sum(len(positions) for positions in selected) / len(queries),
+                "identical": identical,
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
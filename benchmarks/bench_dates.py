@@ -0,0 +1,118 @@
+"""
+time of turning register dates (many of them repeated) into DATE_VALUE line values: the previous path (strptime with
+up to three formats per helper, PARTIAL, FULL and INTERPRETED in turn, an exception and a warning per miss) against
+gedcom_date_value (one compiled regex, memoized), cold and warm, checking that both agree where the previous path
+recognized a date.
+
+    python benchmarks/bench_dates.py --dates 200000 --distinct 5000
+"""
+import argparse
+import datetime
+import json
+import logging
+import random
+import time
+
+from genealogy.gedcomish.common import get_gedcom_date, get_month, try_strptime
+from genealogy.gedcomish.gedcom555ish.dates import gedcom_date_value, parse_date_value
+
+logger = logging.getLogger(__name__)
+
+
+def legacy_date_value(text: str) -> str:
+    """
+    DATE_VALUE("...").__str__ as it was.
+    """
+    try:
+        datestr = text.strip().rstrip(".xX-")
+        fmts = [r"%Y-%m-%d", r"%Y-%m", r"%Y"]
+        for fmt in fmts:
+            try:
+                date = datetime.datetime.strptime(datestr, fmt)
+                if fmt == fmts[0]:
+                    return " ".join((str(date.day), get_month(date), str(date.year)))
+                elif fmt == fmts[1]:
+                    return " ".join((get_month(date), str(date.year)))
+                elif fmt == fmts[2]:
+                    return str(date.year)
+            except Exception as _:
+                pass
+        raise ValueError(f"get_date failed: locals()={locals()}")
+    except Exception as e:
+        logger.warning(f"{e}")
+    try:
+        date = try_strptime(text)
+        if isinstance(date, datetime.datetime):
+            return " ".join((str(date.day), get_month(date), str(date.year)))
+        raise ValueError(f"get_date failed: locals()={locals()}")
+    except Exception as e:
+        logger.warning(f"{e}")
+    return get_gedcom_date(text)
+
+
+def register_date(rng: random.Random) -> str:
+    year, month, day = rng.randint(1600, 1950), rng.randint(1, 12), rng.randint(1, 28)
+    return rng.choice(
+        (
+            f"{year}-{month:02d}-{day:02d}",
+            f"{year}-{month:02d}-{day:02d}",
+            f"{year}-{month:02d}-{day:02d}",
+            f"{year}-{month:02d}",
+            f"{year}",
+            f"{year}-xx-xx",
+            f"ABT {year}",
+            f"BET {year} AND {year + 5}",
+            f"FROM {day} {get_month(datetime.date(1, month, 1))} {year} TO {year + 1}",
+            f"@#DJULIAN@ {day} {get_month(datetime.date(1, month, 1))} {year}",
+            f"omkring {year}",
+        )
+    )
+
+
+def measure(function, texts) -> dict:
+    start = time.perf_counter()
+    values = [function(text) for text in texts]
+    return values, {"s": time.perf_counter() - start}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dates", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=5000)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    rng = random.Random(0)
+    distinct = [register_date(rng) for _ in range(pargs.distinct)]
+    texts = [rng.choice(distinct) for _ in range(pargs.dates)]
+
+    legacy, legacy_time = measure(legacy_date_value, texts)
+    gedcom_date_value.cache_clear()
+    parse_date_value.cache_clear()
+    values, cold = measure(gedcom_date_value, texts)
+    _, warm = measure(gedcom_date_value, texts)
+    # NOTE: where the previous path made a phrase of text, the grammar may recognize a date value
+    recognized = [(old, new) for old, new in zip(legacy, values) if not old.startswith("(")]
+    print(
+        json.dumps(
+            {
+                "dates": pargs.dates,
+                "distinct": len(set(texts)),
+                "legacy": legacy_time,
+                "cold": cold,
+                "warm": warm,
+                "speedup_cold": legacy_time["s"] / cold["s"],
+                "agree": sum(old == new for old, new in recognized),
+                "recognized_by_legacy": len(recognized),
+                "date_values": sum(not value.startswith("(") for value in values),
+                "cache": gedcom_date_value.cache_info()._asdict(),
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+memory and time of filling and rendering GEDCOM_LINES for a synthetic tree.
+
+    python benchmarks/bench_gedcom_lines.py --individuals 5000
+"""
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+
+from synthetic import iter_individuals
+
+from genealogy.gedcomish.common import GEDCOM_LINES
+from genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file import FORM_RECORDS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=5000)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    records = FORM_RECORDS()
+    records.LINEAGE_LINKED_RECORDs = list(iter_individuals(pargs.individuals))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    lines = records(lines=GEDCOM_LINES(), delta_level=0)
+    filled = time.perf_counter()
+    buffer_bytes, _ = tracemalloc.get_traced_memory()
+    result = lines(0)
+    rendered = time.perf_counter()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    nof_lines = result.count("\n")
+    print(
+        json.dumps(
+            {
+                "individuals": pargs.individuals,
+                "lines": nof_lines,
+                "fill_s": filled - start,
+                "render_s": rendered - filled,
+                "buffer_bytes": buffer_bytes,
+                "buffer_bytes_per_line": buffer_bytes / nof_lines,
+                "peak_bytes": peak_bytes,
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+the cost of finding out which lines may appear below which: reflecting over the schema classes (reflect_routes, what
+every fresh process did before reading its first records) against looking the routes up in the generated GRAMMAR
+(routes), for every context; and checking the tags of a synthetic GEDCOM file with GRAMMAR lookups only
+(validate_tags) against reading it into the schema classes (iter_records).
+
+    python benchmarks/bench_grammar.py --individuals 20000
+"""
+import argparse
+import io
+import json
+import logging
+import time
+
+from synthetic import gedcom_file
+
+from genealogy.gedcomish.common import _nested_orders, _serialization_plans
+from genealogy.gedcomish.gedcom555ish.grammar_table import GRAMMAR
+from genealogy.gedcomish.gedcom555ish.reader import _routes, iter_records, reflect_routes, resolve, routes
+from genealogy.gedcomish.gedcom555ish.validator import validate_tags
+
+
+def cold(function, contexts) -> float:
+    _serialization_plans.clear()
+    _nested_orders.clear()
+    _routes.clear()
+    start = time.perf_counter()
+    for context in contexts:
+        function(context)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=20000)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    contexts = [resolve(context) for context in GRAMMAR]
+    reflect_time = cold(reflect_routes, contexts)
+    table_time = cold(routes, contexts)
+    identical = all(routes(context) == reflect_routes(context) for context in contexts)
+
+    text = "".join(gedcom_file(pargs.individuals).iter_lines())
+    nof_lines = text.count("\n")
+    start = time.perf_counter()
+    violations = sum(1 for _ in validate_tags(io.StringIO(text)))
+    tags_time = time.perf_counter() - start
+    start = time.perf_counter()
+    records = sum(1 for _ in iter_records(io.StringIO(text)))
+    read_time = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "contexts": len(contexts),
+                "rules": sum(len(rules) for tags in GRAMMAR.values() for rules in tags.values()),
+                "reflect_routes_s": reflect_time,
+                "grammar_routes_s": table_time,
+                "speedup": reflect_time / table_time,
+                "identical": identical,
+                "lines": nof_lines,
+                "records": records,
+                "validate_tags_lines_per_s": nof_lines / tags_time,
+                "iter_records_lines_per_s": nof_lines / read_time,
+                "tag_violations": violations,
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
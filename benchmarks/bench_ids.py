@@ -0,0 +1,76 @@
+"""
+scaling of finding the registry persons of every family person (as get_gedcom_individual does for each of them):
+Ids.registry_persons against the previous search of all ids, over the number of persons,
+filling the ids as add_reg_person_info and add_family_info do and checking that both find the same.
+
+    python benchmarks/bench_ids.py --persons 1000 10000 100000 --previous-max 3000
+"""
+import argparse
+import json
+import logging
+import time
+
+from genealogy.holgerish.html import FAMILY_PERSON_REGEX, FamilyAdult, FamilyChild, Ids, RegistryPerson
+
+
+def fill(n: int) -> tuple:
+    """
+    n registry persons (every tenth registered twice, as in two families) and a family person sharing the id of each.
+    """
+    ids = Ids()
+    fields = dict.fromkeys(FAMILY_PERSON_REGEX.groupindex)
+    fam_persons = list()
+    for no in range(n):
+        registered = [
+            RegistryPerson(("Per",), (f"Andersson{no}",), "1800", ("Skövde",), (no // 10 + offset,))
+            for offset in range(1 + (no % 10 == 0))
+        ]
+        for reg_person in registered:
+            ids[reg_person]
+        fam_person = (FamilyChild if no % 3 else FamilyAdult)(**dict(fields, FIRSTNAMES=f"Per{no}"))
+        ids[fam_person] = ids[registered[0]]
+        for reg_person in registered[1:]:
+            ids[reg_person] = ids[fam_person]
+        fam_persons.append(fam_person)
+    return ids, fam_persons
+
+
+def previous_registry_persons(ids, person):
+    return [
+        reg_person
+        for reg_person, reg_person_id in ids.items()
+        if (reg_person_id == ids[person]) and isinstance(reg_person, RegistryPerson)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--persons", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--previous-max", type=int, default=3000, help="skip the previous search above this")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    results = list()
+    for n in pargs.persons:
+        start = time.perf_counter()
+        ids, fam_persons = fill(n)
+        fill_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        current = [ids.registry_persons(ids[person]) for person in fam_persons]
+        current_s = time.perf_counter() - start
+        result = {"persons": n, "ids": len(ids), "fill_s": fill_s, "registry_persons_s": current_s}
+
+        if n <= pargs.previous_max:
+            start = time.perf_counter()
+            previous = [previous_registry_persons(ids, person) for person in fam_persons]
+            previous_s = time.perf_counter() - start
+            result.update(previous_s=previous_s, speedup=previous_s / current_s, identical=previous == current)
+        results.append(result)
+    print(json.dumps({"results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
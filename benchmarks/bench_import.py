@@ -0,0 +1,97 @@
+"""
+startup cost of fresh processes: the wall time of importing the modules (and of html.py --help), with the modules
+taking the most import time themselves (python -X importtime), optionally against another revision checked out in a
+temporary git worktree (--baseline). the target is a fraction of the baseline wall time of html.py --help (--target).
+
+    python benchmarks/bench_import.py --repeat 20 --baseline HEAD~1 --target 0.5
+"""
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+TARGETS = {
+    "interpreter": ["-c", "pass"],
+    "html": ["-c", "import genealogy.holgerish.html"],
+    "html --help": ["-m", "genealogy.holgerish.html", "--help"],
+    "reader": ["-c", "import genealogy.gedcomish.gedcom555ish.reader"],
+}
+
+
+def run(args, root: pathlib.Path, cwd: str):
+    """
+    the wall time (s) and the import times (self, cumulative, in s) by module of one fresh process.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env={"PYTHONPATH": str(root), "PATH": ""},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    imports = dict()
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "[us]" not in line:
+            own, cumulative, module = line[len("import time:") :].split("|")
+            imports[module.strip()] = (int(own) / 1e6, int(cumulative) / 1e6)
+    return wall, imports
+
+
+def git(*args):
+    subprocess.run(["git", "-C", str(ROOT), *args], check=True, capture_output=True)
+
+
+def measure(root: pathlib.Path, repeat: int, top: int):
+    results = dict()
+    with tempfile.TemporaryDirectory() as cwd:
+        for target, args in TARGETS.items():
+            runs = [run(args, root, cwd) for _ in range(repeat)]
+            imports = runs[len(runs) // 2][1]
+            results[target] = {
+                "wall_s": statistics.median(wall for wall, _ in runs),
+                "import_s": statistics.median(sum(own for own, _ in imports.values()) for _, imports in runs),
+                "modules": len(imports),
+                "top_self_s": dict(sorted(((m, own) for m, (own, _) in imports.items()), key=lambda x: -x[1])[:top]),
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10, help="number of modules by own import time to show")
+    parser.add_argument("--baseline", help="git revision to compare with (checked out in a temporary worktree)")
+    parser.add_argument("--target", type=float, default=0.5, help="fraction of the baseline html.py --help wall time")
+    pargs = parser.parse_args()
+
+    report = {"current": measure(ROOT, pargs.repeat, pargs.top)}
+    if pargs.baseline:
+        with tempfile.TemporaryDirectory() as directory:
+            worktree = pathlib.Path(directory) / "baseline"
+            git("worktree", "add", "--detach", str(worktree), pargs.baseline)
+            try:
+                report["baseline"] = measure(worktree, pargs.repeat, pargs.top)
+            finally:
+                git("worktree", "remove", "--force", str(worktree))
+        # NOTE: the interpreter itself is the same either way, so it is left out of the fraction
+        interpreter = report["current"]["interpreter"]["wall_s"]
+        report["fraction"] = {
+            target: (report["current"][target]["wall_s"] - interpreter)
+            / (report["baseline"][target]["wall_s"] - interpreter)
+            for target in list(TARGETS)[1:]
+        }
+        report["target"] = pargs.target
+        report["meets_target"] = report["fraction"]["html --help"] <= pargs.target
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
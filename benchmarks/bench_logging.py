@@ -0,0 +1,76 @@
+"""
+time of converting a synthetic Holger export (split_sections and parsed_to_gedcom) under each logging configuration:
+disabled, the synchronous handlers of logging.json, the same handlers behind bounded queues, and both with the levels
+of the chattiest modules raised; with the time until the queued records are written and the bytes logged.
+the console handler writes to os.devnull and the log files to a temporary directory.
+
+    python benchmarks/bench_logging.py --families 300
+"""
+import argparse
+import contextlib
+import json
+import logging
+import logging.config
+import os
+import pathlib
+import tempfile
+import time
+
+from synthetic_holger import export
+
+from genealogy.holgerish.configure import configure
+from genealogy.holgerish.html import Ids, parsed_to_gedcom, split_sections
+
+LEVELS = {"gedcomish.common": "WARNING", "holgerish.html": "INFO"}
+
+CONFIGURATIONS = {
+    "disabled": None,
+    "sync": dict(backend="sync"),
+    "queue": dict(backend="queue"),
+    "sync_levels": dict(backend="sync", levels=LEVELS),
+    "queue_levels": dict(backend="queue", levels=LEVELS),
+}
+
+
+def run(text: str, configuration: dict, maxsize: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            with contextlib.redirect_stdout(devnull):
+                if configuration is None:
+                    configure()
+                    logging.disable(logging.CRITICAL)
+                    listeners = list()
+                else:
+                    logging.disable(logging.NOTSET)
+                    listeners = configure(maxsize=maxsize, **configuration)
+                start = time.perf_counter()
+                parsed_to_gedcom(pathlib.Path(directory) / "synthetic.htm", split_sections(text, dict()), ids=Ids())
+                elapsed = time.perf_counter() - start
+                for listener in listeners:
+                    listener.stop()
+                flushed = time.perf_counter() - start
+                # NOTE: closes the log files, so they can be measured (and removed)
+                logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})
+        finally:
+            os.chdir(cwd)
+        logged = sum(path.stat().st_size for path in pathlib.Path(directory).glob("level-*.log*"))
+    return {"s": elapsed, "flushed_s": flushed, "logged_bytes": logged}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", type=int, default=300)
+    parser.add_argument("--children", type=int, default=6, help="children per family")
+    parser.add_argument("--maxsize", type=int, default=10000, help="records per queue")
+    parser.add_argument("--configurations", nargs="+", choices=CONFIGURATIONS, default=list(CONFIGURATIONS))
+    pargs = parser.parse_args()
+
+    text = export(pargs.families, children=pargs.children)
+    results = {name: run(text, CONFIGURATIONS[name], pargs.maxsize) for name in pargs.configurations}
+    print(json.dumps({"families": pargs.families, "maxsize": pargs.maxsize, "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+time of matching the paragraphs of large synthetic family sections:
+lookahead_matches (one pass for every kind of entry) against the previous lookahead_match (once per entry regex),
+checking that both classify every paragraph the same.
+
+    python benchmarks/bench_lookahead.py --children 10 100 400 --notes 20
+"""
+import argparse
+import functools
+import itertools
+import json
+import logging
+import time
+
+from synthetic_holger import family_section
+
+from genealogy.holgerish.html import (
+    FAMILY_PERSON_REGEX,
+    FAMILY_RELATION_REGEX,
+    FAMILY_UNION_REGEX,
+    IGNORE,
+    lookahead_matches,
+    split_section,
+    trim,
+    unrecognized,
+)
+
+
+def previous_unrecognized(text):
+    return not any(
+        [
+            FAMILY_PERSON_REGEX.match(text),
+            FAMILY_UNION_REGEX.match(text),
+            FAMILY_RELATION_REGEX.match(text),
+            IGNORE.match(text),
+        ]
+    )
+
+
+def previous_lookahead_match(*, part_no, parts, current, regex):
+    merge = None
+    merge_match = None
+    merge_lookahead = None
+
+    if (part_no + 1 == len(parts)) and (match := regex.match(current)):
+        merge = current
+        merge_match = match
+        merge_lookahead = part_no + 1
+    else:
+        for end in range(part_no + 1, len(parts)):
+            trial_merge = trim(" ".join((current, " ".join(parts[part_no + 1 : end]))))
+            remains = trim(" ".join(parts[end:]))
+            if match := regex.match(trial_merge):
+                merge = trial_merge
+                merge_match = match
+                merge_lookahead = end
+                if previous_unrecognized(remains):
+                    continue
+                else:
+                    break
+    if merge and merge_match:
+        value = merge_match.groupdict()
+        remains = trim(merge[0 : merge_match.start()] + merge[merge_match.end() :])
+        nof_lookahead = merge_lookahead - (part_no + 1)
+        return remains, value, nof_lookahead
+    else:
+        return None
+
+
+def paragraphs(source):
+    # NOTE: as split_section splits them
+    return [
+        trim(part)
+        for part in itertools.chain.from_iterable(
+            subpart.splitlines() for part in source.split("<P>") for subpart in part.split("<BR>")
+        )
+        if trim(part)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--children", type=int, nargs="+", default=[10, 100, 400])
+    parser.add_argument("--notes", type=int, default=20, help="free text paragraphs per family")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    results = list()
+    for children in pargs.children:
+        source = family_section(1, children=children, notes=pargs.notes)
+        parts = paragraphs(source)
+
+        start = time.perf_counter()
+        previous = [
+            {
+                kind: previous_lookahead_match(part_no=part_no, parts=parts, current=parts[part_no], regex=regex)
+                for kind, regex in (
+                    ("PERSON", FAMILY_PERSON_REGEX),
+                    ("RELATION", FAMILY_RELATION_REGEX),
+                    ("UNION", FAMILY_UNION_REGEX),
+                )
+            }
+            for part_no in range(len(parts))
+        ]
+        previous_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        recognized = functools.lru_cache(maxsize=None)(lambda end: not unrecognized(" ".join(parts[end:])))
+        current = [
+            lookahead_matches(part_no=part_no, parts=parts, recognized=recognized) for part_no in range(len(parts))
+        ]
+        current_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        split_section(1, source)
+        split_section_s = time.perf_counter() - start
+
+        results.append(
+            {
+                "children": children,
+                "paragraphs": len(parts),
+                "lookahead_match_s": previous_s,
+                "lookahead_matches_s": current_s,
+                "speedup": previous_s / current_s,
+                "identical": previous == current,
+                "split_section_s": split_section_s,
+            }
+        )
+    print(json.dumps({"notes": pargs.notes, "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+time and accuracy of matching the family persons of synthetic sections to their registry persons:
+one score matrix and an optimal assignment per family (person_similarities and match)
+against the previous SequenceMatcher scores of every pair and greedy assignment (adults first),
+with the number of matches that are ambiguous (margin below AMBIGUOUS_MARGIN).
+
+    python benchmarks/bench_matching.py --families 200 --children 2 8 16
+"""
+import argparse
+import json
+import logging
+import random
+import time
+from difflib import SequenceMatcher
+
+from genealogy.holgerish import matching
+from genealogy.holgerish.html import (
+    AMBIGUOUS_MARGIN,
+    FAMILY_PERSON_REGEX,
+    PERSON_SIMILARITY_FIELDS,
+    FamilyAdult,
+    FamilyChild,
+    RegistryPerson,
+    person_similarities,
+)
+
+FIRSTNAMES = ("Per", "Pehr", "Anna", "Anna Maria", "Maria", "Johan", "Johannes", "Lisa", "Elisabet", "Karl", "Carl")
+PLACES = ("Skövde", "Hova", "Tidaholm", "Mariestad")
+
+
+def family(rng: random.Random, fam_id: int, children: int):
+    """
+    the registry persons of a family (shuffled) and its family persons (adults, children) as written in the section,
+    with the odd misspelling, missing birthday and corrupt birthday.
+    """
+    surname = f"Andersson{fam_id}"
+    truth = list()
+    for no in range(2 + children):
+        firstnames = rng.choice(FIRSTNAMES)
+        birthday = f"{1800 + rng.randrange(60)}-{1 + rng.randrange(12):02}-{1 + rng.randrange(28):02}"
+        place = rng.choice(PLACES)
+        reg_person = RegistryPerson(tuple(firstnames.split()), (surname,), birthday, (place,), (fam_id,))
+        fields = dict.fromkeys(FAMILY_PERSON_REGEX.groupindex)
+        fields.update(FIRSTNAMES=surname, SECONDNAMES=firstnames, BIRTHPLACE=place)
+        if rng.random() < 0.1:
+            fields.update(SECONDNAMES=firstnames.replace("e", "ä").replace("C", "K"))
+        if rng.random() < 0.1:
+            fields.update(BIRTHDAY_CORRUPT=birthday.replace("-", "/"))
+        elif rng.random() < 0.9:
+            fields.update(BIRTHDAY=birthday)
+        fam_person = FamilyAdult(**fields) if no < 2 else FamilyChild(**dict(fields, IS_CHILD="*"))
+        truth.append((fam_person, reg_person))
+    reg_persons = [reg_person for _, reg_person in truth]
+    rng.shuffle(reg_persons)
+    return reg_persons, [fam_person for fam_person, _ in truth], dict(truth)
+
+
+def previous_person_similarity(reg_person, fam_person, weight=2.0):
+    return sum(
+        SequenceMatcher(
+            None,
+            v if (v := getattr(fam_person, fam_field)) else "",
+            "".join(v) if (v := getattr(reg_person, reg_field)) else "",
+        ).ratio()
+        * (weight if weighted else 1.0)
+        for fam_field, reg_field, weighted in PERSON_SIMILARITY_FIELDS
+    )
+
+
+def previous_match(reg_persons, fam_persons):
+    matched = dict()
+    for fam_person in fam_persons:
+        persons_descending = [
+            person
+            for person in sorted(reg_persons, key=lambda person: previous_person_similarity(person, fam_person))
+            if person not in matched.values()
+        ]
+        if persons_descending:
+            matched[fam_person] = persons_descending.pop()
+    return matched
+
+
+def current_match(reg_persons, fam_persons):
+    found = matching.match(person_similarities(reg_persons, fam_persons), priority=2)
+    return {fam_persons[m.row]: reg_persons[m.column] for m in found}, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", type=int, default=200)
+    parser.add_argument("--children", type=int, nargs="+", default=[2, 8, 16])
+    parser.add_argument("--no-numpy", action="store_true", help="score without numpy (as if it was not installed)")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+    if pargs.no_numpy:
+        matching.numpy = None
+
+    results = list()
+    for children in pargs.children:
+        rng = random.Random(children)
+        families = [family(rng, fam_id, children) for fam_id in range(pargs.families)]
+
+        start = time.perf_counter()
+        previous = [previous_match(reg_persons, fam_persons) for reg_persons, fam_persons, _ in families]
+        previous_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        current = [current_match(reg_persons, fam_persons) for reg_persons, fam_persons, _ in families]
+        current_s = time.perf_counter() - start
+
+        nof_persons = sum(len(truth) for _, _, truth in families)
+        results.append(
+            {
+                "children": children,
+                "persons": nof_persons,
+                "previous_s": previous_s,
+                "matrix_s": current_s,
+                "speedup": previous_s / current_s,
+                "previous_correct": sum(
+                    matched.get(fam_person) == reg_person
+                    for matched, (_, _, truth) in zip(previous, families)
+                    for fam_person, reg_person in truth.items()
+                )
+                / nof_persons,
+                "matrix_correct": sum(
+                    matched.get(fam_person) == reg_person
+                    for (matched, _), (_, _, truth) in zip(current, families)
+                    for fam_person, reg_person in truth.items()
+                )
+                / nof_persons,
+                "ambiguous": sum(
+                    m.margin is not None and m.margin < AMBIGUOUS_MARGIN for _, found in current for m in found
+                ),
+            }
+        )
+    print(json.dumps({"numpy": matching.numpy is not None, "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
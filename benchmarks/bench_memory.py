@@ -0,0 +1,51 @@
+"""
+memory held per individual of a synthetic tree (traced by tracemalloc), and the time it takes to build it.
+
+    python benchmarks/bench_memory.py --individuals 100000
+"""
+import argparse
+import json
+import logging
+import time
+import tracemalloc
+
+from synthetic import iter_individuals
+
+from genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file import FORM_RECORDS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=100000)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    # warm up (class level caches, interned strings) outside of the traced window
+    "".join(next(iter_individuals(1)).iter_lines())
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = FORM_RECORDS()
+    records.LINEAGE_LINKED_RECORDs = list(iter_individuals(pargs.individuals))
+    built = time.perf_counter()
+    tree_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        json.dumps(
+            {
+                "individuals": pargs.individuals,
+                "build_s": built - start,
+                "tree_bytes": tree_bytes,
+                "tree_bytes_per_individual": tree_bytes / pargs.individuals,
+                "peak_bytes": peak_bytes,
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
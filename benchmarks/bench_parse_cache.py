@@ -0,0 +1,59 @@
+"""
+split_sections of a synthetic Holger export with a ParseCache: cold (every family parsed), warm (none parsed)
+and after editing a few families (only those parsed), with the hits and misses of each run,
+checking that every run splits the sections the same as without the cache.
+
+    python benchmarks/bench_parse_cache.py --families 5000 --edited 10
+"""
+import argparse
+import json
+import logging
+import tempfile
+import time
+
+from synthetic_holger import export
+
+from genealogy.holgerish.cache import ParseCache
+from genealogy.holgerish.html import parser_version, split_sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", type=int, default=5000)
+    parser.add_argument("--children", type=int, default=6, help="children per family")
+    parser.add_argument("--edited", type=int, default=10, help="families edited before the last run")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    text = export(pargs.families, children=pargs.children)
+    sections = text.split("<HR WIDTH=500>")
+    for no in range(pargs.edited):
+        sections[no] = sections[no].replace("i Skövde", "i Hova", 1)
+    edited = "<HR WIDTH=500>".join(sections)
+
+    start = time.perf_counter()
+    expected = split_sections(text, dict())
+    results = [{"run": "uncached", "s": time.perf_counter() - start}]
+    version = parser_version()
+    with tempfile.TemporaryDirectory() as directory:
+        for run, source in (("cold", text), ("warm", text), ("edited", edited)):
+            cache = ParseCache(directory, version)
+            start = time.perf_counter()
+            sections = split_sections(source, dict(), cache=cache)
+            elapsed = time.perf_counter() - start
+            results.append(
+                {
+                    "run": run,
+                    "s": elapsed,
+                    "hits": cache.hits,
+                    "misses": cache.misses,
+                    "identical": sections == expected if source is text else len(sections) == len(expected),
+                }
+            )
+    print(json.dumps({"families": pargs.families, "results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+scaling of parse_parallel over the number of workers for a synthetic (multi-million line) GEDCOM file.
+
+    python benchmarks/bench_parse_parallel.py --individuals 250000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+
+from synthetic import iter_individuals
+
+from genealogy.gedcomish.gedcom555ish.reader import iter_records, parse_parallel
+
+
+def write_synthetic(path: pathlib.Path, n: int):
+    """
+    writes n individuals, rendered once from iter_individuals(1) and renumbered, between a minimal header and trailer.
+    """
+    template = "".join(next(iter_individuals(1)).iter_lines())
+    template = template.replace("@I0@", "@I{no}@").replace("dotter0", "dotter{no}")
+    with path.open("w", encoding="utf-8", newline="") as stream:
+        stream.write("0 HEAD\n1 GEDC\n2 VERS 5.5.5\n2 FORM LINEAGE-LINKED\n3 VERS 5.5.5\n1 CHAR UTF-8\n")
+        for no in range(n):
+            stream.write(template.format(no=no))
+        stream.write("0 TRLR\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=250000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=1 << 22)
+    parser.add_argument("--serial", action="store_true", help="also time iter_records in this process")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "synthetic.ged"
+        write_synthetic(path, pargs.individuals)
+        with path.open("rb") as stream:
+            nof_lines = sum(1 for _ in stream)
+        results = list()
+        if pargs.serial:
+            start = time.perf_counter()
+            with path.open("rb") as stream:
+                nof_records = sum(1 for _ in iter_records(stream))
+            elapsed = time.perf_counter() - start
+            results.append({"workers": 0, "records": nof_records, "s": elapsed, "lines_per_s": nof_lines / elapsed})
+        for workers in pargs.workers:
+            start = time.perf_counter()
+            nof_records = sum(1 for _ in parse_parallel(path, workers, chunk_size=pargs.chunk_size))
+            elapsed = time.perf_counter() - start
+            results.append(
+                {"workers": workers, "records": nof_records, "s": elapsed, "lines_per_s": nof_lines / elapsed}
+            )
+        print(
+            json.dumps(
+                {
+                    "individuals": pargs.individuals,
+                    "lines": nof_lines,
+                    "bytes": os.path.getsize(path),
+                    "cpus": os.cpu_count(),
+                    "results": results,
+                },
+                indent=4,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+time and peak (python) memory of finding the sections of a large synthetic Holger export file:
+read_sections (memory-mapped, one section decoded at a time) against read_text and find_sections,
+checking that both find the same sections.
+
+    python benchmarks/bench_read_sections.py --families 20000 --encoding cp1252
+"""
+import argparse
+import json
+import logging
+import pathlib
+import tempfile
+import time
+import tracemalloc
+
+from synthetic_holger import export
+
+from genealogy.holgerish.html import find_sections, read_sections
+
+
+def measure(function):
+    """
+    the result of function, its time and (in a second run, as tracing slows it down) its peak traced memory.
+    """
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {"s": elapsed, "peak_bytes": peak}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", type=int, default=20000)
+    parser.add_argument("--children", type=int, default=6, help="children per family")
+    parser.add_argument("--encoding", default="cp1252")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "synthetic.htm"
+        path.write_text(export(pargs.families, children=pargs.children), encoding=pargs.encoding, newline="\r\n")
+        expected, read_text = measure(lambda: find_sections(path.read_text(encoding=pargs.encoding)))
+        found, streamed = measure(lambda: read_sections(path, pargs.encoding))
+        print(
+            json.dumps(
+                {
+                    "families": pargs.families,
+                    "bytes": path.stat().st_size,
+                    "encoding": pargs.encoding,
+                    "read_text": read_text,
+                    "read_sections": streamed,
+                    "identical": found == expected,
+                },
+                indent=4,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
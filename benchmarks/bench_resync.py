@@ -0,0 +1,91 @@
+"""
+time of finding where an unrecognized paragraph becomes recognizable (what split_section adds as unknown and remains):
+resync (one scan) against the previous scan (unrecognized(text[start:]) at every offset),
+over a corpus of long free text notes with entries, false leads and anchors after them,
+checking that both find the same offset for every paragraph.
+
+    python benchmarks/bench_resync.py --lengths 100 1000 5000
+"""
+import argparse
+import json
+import logging
+import random
+import time
+
+from synthetic_holger import person
+
+from genealogy.holgerish.html import resync, unrecognized
+
+WORDS = (
+    "enligt husförhörslängden flyttade familjen till Göteborg men återkom efter några år och tog över gården "
+    "Giftermålet Barnen Sambon Relationen Partnern * <I> i Skövde 1852 <A HREF=#12>12</A>"
+).split()
+
+TAILS = (
+    lambda no: person(f"Andersson{no}", "Per", no),
+    lambda no: person(f"Andersson{no}", "Per", no, child=True),
+    lambda no: f"Gift {1820 + no % 50}-05-06 i Skövde med",
+    lambda no: "Barn:",
+    lambda no: f"<A NAME={no}>",
+    lambda no: "",
+)
+
+
+def corpus(length: int, size: int, seed: int = 0):
+    """
+    size paragraphs of about length characters of free text, each followed by one of TAILS.
+    """
+    rng = random.Random(seed + length)
+    for no in range(size):
+        words = list()
+        while sum(len(word) + 1 for word in words) < length:
+            words.append(rng.choice(WORDS))
+        yield " ".join((" ".join(words), TAILS[no % len(TAILS)](no))).strip()
+
+
+def previous_resync(text):
+    for start in range(0, len(text)):
+        if unrecognized(text[start:]):
+            continue
+        else:
+            return start
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--size", type=int, default=60, help="paragraphs per length")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    results = list()
+    for length in pargs.lengths:
+        texts = list(corpus(length, pargs.size))
+
+        start = time.perf_counter()
+        previous = [previous_resync(text) for text in texts]
+        previous_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        current = [resync(text) for text in texts]
+        current_s = time.perf_counter() - start
+
+        results.append(
+            {
+                "length": length,
+                "paragraphs": len(texts),
+                "unknowns": sum(offset is not None for offset in current),
+                "previous_s": previous_s,
+                "resync_s": current_s,
+                "speedup": previous_s / current_s,
+                "identical": previous == current,
+            }
+        )
+    print(json.dumps({"results": results}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+serializer benchmark suite: times building a synthetic tree, Substructure.__call__ (filling GEDCOM_LINES),
+GEDCOM_LINES.__call__ (rendering) and writing the file, for each size given.
+reports wall time, lines/s and the peak RSS (so far) of every phase as JSON.
+
+    python benchmarks/bench_serializer.py --individuals 1000 10000 --families-per-individual 0.33 --output result.json
+"""
+import argparse
+import json
+import logging
+import os
+import pathlib
+import platform
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from synthetic import gedcom_file
+
+from genealogy.gedcomish.common import GEDCOM_LINES
+
+try:
+    import resource
+except ImportError:  # e.g. Windows
+    resource = None
+
+
+def peak_rss() -> Optional[int]:
+    """
+    the peak resident set size of this process in bytes (None where it is not available).
+    """
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NOTE: kilobytes on Linux, bytes on macOS
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def phase(name: str, start: float, nof_lines: Optional[int]) -> dict:
+    elapsed = time.perf_counter() - start
+    return {
+        "phase": name,
+        "s": elapsed,
+        "lines_per_s": nof_lines / elapsed if nof_lines and elapsed else None,
+        "peak_rss_bytes": peak_rss(),
+    }
+
+
+def run(individuals: int, families: int, notes: int, citations: int, name_pieces: bool) -> dict:
+    phases = list()
+    start = time.perf_counter()
+    ex = gedcom_file(individuals, families, notes=notes, citations=citations, name_pieces=name_pieces)
+    phases.append(phase("construct", start, None))
+
+    start = time.perf_counter()
+    lines = ex(lines=GEDCOM_LINES(), delta_level=0)
+    nof_lines = len(lines)
+    phases.append(phase("substructure_call", start, nof_lines))
+
+    start = time.perf_counter()
+    text = lines(0)
+    phases.append(phase("gedcom_lines_call", start, nof_lines))
+    del lines, text
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "synthetic.ged"
+        start = time.perf_counter()
+        with path.open("wb") as stream:
+            ex.write_to(stream, encoding="utf-8-sig")
+        phases.append(phase("write", start, nof_lines))
+        nof_bytes = path.stat().st_size
+
+    return {
+        "individuals": individuals,
+        "families": families,
+        "notes": notes,
+        "citations": citations,
+        "name_pieces": name_pieces,
+        "lines": nof_lines,
+        "bytes": nof_bytes,
+        "phases": phases,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--families-per-individual", type=float, default=1 / 3)
+    parser.add_argument("--notes", type=int, default=1, help="notes per individual")
+    parser.add_argument("--citations", type=int, default=1, help="source citations per individual")
+    parser.add_argument("--no-name-pieces", action="store_true")
+    parser.add_argument("--output", type=pathlib.Path, help="also write the result to this file")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "runs": [
+            run(
+                individuals,
+                int(individuals * pargs.families_per_individual),
+                pargs.notes,
+                pargs.citations,
+                not pargs.no_name_pieces,
+            )
+            for individuals in pargs.individuals
+        ],
+    }
+    text = json.dumps(result, indent=4)
+    if pargs.output:
+        pargs.output.write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+scaling of split_sections over the number of workers for a synthetic (multi-thousand family) Holger export,
+checking that every number of workers splits the sections the same.
+
+    python benchmarks/bench_split_sections.py --families 5000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import logging
+import os
+import time
+
+from synthetic_holger import export
+
+from genealogy.holgerish.html import split_sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", type=int, default=5000)
+    parser.add_argument("--children", type=int, default=6, help="children per family")
+    parser.add_argument("--notes", type=int, default=2, help="free text paragraphs per family")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    text = export(pargs.families, children=pargs.children, notes=pargs.notes)
+    results = list()
+    expected = None
+    for workers in pargs.workers:
+        start = time.perf_counter()
+        sections = split_sections(text, dict(), workers=workers, chunk_size=pargs.chunk_size)
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = sections
+        results.append(
+            {
+                "workers": workers,
+                "s": elapsed,
+                "families_per_s": len(sections) / elapsed,
+                "identical": sections == expected,
+            }
+        )
+    print(
+        json.dumps(
+            {
+                "families": pargs.families,
+                "bytes": len(text.encode()),
+                "cpus": os.cpu_count(),
+                "chunk_size": pargs.chunk_size,
+                "results": results,
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+throughput of the Size validator on a large synthetic GEDCOM file with a known number of violations (over long names):
+validating the tree (validate) and the file read one record at a time (validate_stream), against writing the same tree,
+checking that every violation is reported. the target is to validate the tree at least as fast as it is written
+(--target lines/s, default: the measured write throughput).
+
+    python benchmarks/bench_validate.py --individuals 20000 --violations-every 100
+"""
+import argparse
+import json
+import logging
+import pathlib
+import tempfile
+import time
+
+from synthetic import gedcom_file
+
+from genealogy.gedcomish.common import GEDCOM_LINES
+from genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file import PERSONAL_NAME_STRUCTURE
+from genealogy.gedcomish.gedcom555ish.validator import validate, validate_stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=20000)
+    parser.add_argument("--violations-every", type=int, default=100, help="individuals per over long name")
+    parser.add_argument("--target", type=float, help="lines/s validate has to reach (default: that of writing)")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    ex = gedcom_file(pargs.individuals)
+    expected = 0
+    for no, record in enumerate(ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs[0 : pargs.individuals]):
+        if no % pargs.violations_every == 0:
+            record.INDI.PERSONAL_NAME_STRUCTUREs[0].NAME = PERSONAL_NAME_STRUCTURE.NAME(f"{'Anna ' * 30}/Andersdotter/")
+            expected += 1
+    nof_lines = len(ex(lines=GEDCOM_LINES(), delta_level=0))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "synthetic.ged"
+        start = time.perf_counter()
+        with path.open("wb") as stream:
+            ex.write_to(stream, encoding="utf-8-sig")
+        write = time.perf_counter() - start
+
+        start = time.perf_counter()
+        violations = validate(ex)
+        tree = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with path.open("rb") as stream:
+            streamed = list(validate_stream(stream))
+        stream_time = time.perf_counter() - start
+
+    target = pargs.target or nof_lines / write
+    print(
+        json.dumps(
+            {
+                "individuals": pargs.individuals,
+                "lines": nof_lines,
+                "write_lines_per_s": nof_lines / write,
+                "validate_lines_per_s": nof_lines / tree,
+                "validate_stream_lines_per_s": nof_lines / stream_time,
+                "target_lines_per_s": target,
+                "meets_target": nof_lines / tree >= target,
+                "expected_violations": expected,
+                "violations": len(violations),
+                "stream_violations": len(streamed),
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+throughput of write_parallel over the number of workers (and of the serial write_to) for a synthetic tree.
+
+    python benchmarks/bench_write_parallel.py --individuals 100000 --workers 1 2 4 8
+"""
+import argparse
+import io
+import json
+import logging
+import os
+import time
+
+from synthetic import iter_individuals
+
+from genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
+    FORM_RECORDS,
+    GEDCOM_TRAILER,
+    LINEAGE_LINKED_GEDCOM_FILE,
+)
+from genealogy.gedcomish.gedcom555ish.writer import write_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--individuals", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    gedcom_file = LINEAGE_LINKED_GEDCOM_FILE()
+    gedcom_file.FORM_RECORDS = FORM_RECORDS()
+    gedcom_file.FORM_RECORDS.LINEAGE_LINKED_RECORDs = list(iter_individuals(pargs.individuals))
+    gedcom_file.GEDCOM_TRAILER = GEDCOM_TRAILER()
+    gedcom_file.GEDCOM_TRAILER.TRLR = GEDCOM_TRAILER.TRLR()
+
+    start = time.perf_counter()
+    serial = io.BytesIO()
+    gedcom_file.write_to(serial)
+    elapsed = time.perf_counter() - start
+    expected = serial.getvalue()
+    nof_lines = expected.count(b"\n")
+    results = [{"workers": 0, "s": elapsed, "lines_per_s": nof_lines / elapsed, "identical": True}]
+    for workers in pargs.workers:
+        start = time.perf_counter()
+        parallel = io.BytesIO()
+        write_parallel(gedcom_file, parallel, workers=workers, chunk_size=pargs.chunk_size)
+        elapsed = time.perf_counter() - start
+        results.append(
+            {
+                "workers": workers,
+                "s": elapsed,
+                "lines_per_s": nof_lines / elapsed,
+                "identical": parallel.getvalue() == expected,
+            }
+        )
+    print(
+        json.dumps(
+            {
+                "individuals": pargs.individuals,
+                "lines": nof_lines,
+                "bytes": len(expected),
+                "cpus": os.cpu_count(),
+                "chunk_size": pargs.chunk_size,
+                "results": results,
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
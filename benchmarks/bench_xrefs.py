@@ -0,0 +1,88 @@
+"""
+size of the GEDCOM converted from a synthetic Holger export with sequential xrefs (Ids) against uuid xrefs
+(as before), and whether a second conversion with the id map (also after editing a few families) keeps the xrefs.
+
+    python benchmarks/bench_xrefs.py --families 2000 --edited 10
+"""
+import argparse
+import difflib
+import json
+import logging
+import pathlib
+import re
+import tempfile
+import uuid
+
+from synthetic_holger import export
+
+from genealogy.holgerish.html import Ids, parsed_to_gedcom, split_sections
+
+# NOTE: the header has the time of the conversion
+VOLATILE = re.compile(r"^(1 DATE|2 TIME|2 DATA) .*$", re.MULTILINE)
+
+
+class UuidIds(Ids):
+    """
+    xrefs as XREF_ID made them of uuids (the first 20 hex digits).
+    NOTE: as strings, as FAM pointers given uuids were left out of the output.
+    """
+
+    def __missing__(self, key):
+        self[key] = value = uuid.uuid4().hex[0:20]
+        return value
+
+
+def convert(directory: pathlib.Path, name: str, text: str, **kwargs) -> str:
+    path = directory / f"{name}.htm"
+    parsed_to_gedcom(path, split_sections(text, dict()), **kwargs)
+    return VOLATILE.sub("", path.with_suffix(".ged").read_text(encoding="utf-8-sig"))
+
+
+def changed_lines(before: str, after: str) -> list:
+    diff = difflib.unified_diff(before.splitlines(), after.splitlines(), lineterm="", n=0)
+    return [line for line in diff if line[0:1] in "+-" and not line.startswith(("+++", "---"))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--families", type=int, default=2000)
+    parser.add_argument("--children", type=int, default=6, help="children per family")
+    parser.add_argument("--edited", type=int, default=10, help="families edited before the last conversion")
+    parser.add_argument("--logging", action="store_true", help="keep the configured logging (disabled by default)")
+    pargs = parser.parse_args()
+    if not pargs.logging:
+        logging.disable(logging.CRITICAL)
+
+    text = export(pargs.families, children=pargs.children)
+    sections = text.split("<HR WIDTH=500>")
+    for no in range(pargs.edited):
+        sections[no] = sections[no].replace("i Skövde", "i Hova", 1)
+    edited = "<HR WIDTH=500>".join(sections)
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = pathlib.Path(directory)
+        id_map = directory / "ids.json"
+        uuids = convert(directory, "uuid", text, ids=UuidIds())
+        first = convert(directory, "first", text, id_map=id_map)
+        again = convert(directory, "again", text, id_map=id_map)
+        changed = convert(directory, "edited", edited, id_map=id_map)
+        edits = changed_lines(first, changed)
+        print(
+            json.dumps(
+                {
+                    "families": pargs.families,
+                    "uuid_bytes": len(uuids.encode()),
+                    "sequential_bytes": len(first.encode()),
+                    "reduction": 1 - len(first.encode()) / len(uuids.encode()),
+                    "id_map_bytes": id_map.stat().st_size,
+                    "identical_again": again == first,
+                    "edited_lines_changed": len(edits),
+                    "edited_xref_lines_changed": sum("@" in line for line in edits),
+                },
+                indent=4,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+synthetic LINEAGE_LINKED_GEDCOM_FILE trees of configurable size, for the benchmarks.
+
+    from synthetic import gedcom_file
+    tree = gedcom_file(individuals=10000, families=3000, notes=2, citations=1, name_pieces=True)
+"""
+from typing import Iterator, Optional
+
+from genealogy.gedcomish.common import NULL
+from genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
+    CHIL,
+    EVENT_DETAIL,
+    FAMILY_EVENT_DETAIL,
+    FAMILY_EVENT_STRUCTUREs,
+    FORM_RECORDS,
+    GEDCOM_FORM_HEADER_EXTENSIONs,
+    GEDCOM_HEADER,
+    GEDCOM_TRAILER,
+    INDIVIDUAL_EVENT_DETAIL,
+    INDIVIDUAL_EVENT_STRUCTUREs,
+    LINEAGE_LINKED_GEDCOM_FILE,
+    LINEAGE_LINKED_RECORDs,
+    NOTE_STRUCTUREs,
+    PERSONAL_NAME_PIECES,
+    PERSONAL_NAME_STRUCTURE,
+    PLACE_STRUCTURE,
+    SOURCE_CITATION,
+    SPOUSE_TO_FAMILY_LINK,
+    SUBMITTER_RECORD,
+)
+from genealogy.gedcomish.gedcom555ish.primitives import XREF_INDI
+
+HEADER_EXTENSION = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION
+
+
+def header() -> GEDCOM_HEADER:
+    head = GEDCOM_HEADER()
+    head.HEAD = GEDCOM_HEADER.HEAD()
+    head.HEAD.GEDC = GEDCOM_HEADER.HEAD.GEDC()
+    head.HEAD.GEDC.VERS = GEDCOM_HEADER.HEAD.GEDC.VERS("5.5.5")
+    head.HEAD.GEDC.FORM = GEDCOM_HEADER.HEAD.GEDC.FORM("LINEAGE-LINKED")
+    head.HEAD.GEDC.FORM.VERS = GEDCOM_HEADER.HEAD.GEDC.FORM.VERS("5.5.5")
+    head.HEAD.CHAR = GEDCOM_HEADER.HEAD.CHAR("UTF-8")
+    return head
+
+
+def header_extension() -> HEADER_EXTENSION:
+    extension = HEADER_EXTENSION()
+    extension.SOUR = HEADER_EXTENSION.SOUR("SYNTHETIC")
+    extension.SOUR.VERS = HEADER_EXTENSION.SOUR.VERS("1.0")
+    extension.SUBM = HEADER_EXTENSION.SUBM("U1")
+    return extension
+
+
+def submitter() -> SUBMITTER_RECORD:
+    subm = SUBMITTER_RECORD()
+    subm.SUBM = SUBMITTER_RECORD.SUBM("U1")
+    subm.SUBM.NAME = SUBMITTER_RECORD.SUBM.NAME("Synthetic Submitter")
+    return subm
+
+
+def iter_individuals(
+    n: int, *, notes: int = 1, citations: int = 0, name_pieces: bool = True, families: int = 0, sources: int = 1
+) -> Iterator[LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD]:
+    """
+    yields n individuals (I0, I1, ...), each with a name, a birth and notes,
+    citations of the sources (S0, S1, ...) on the birth and a link to the family (F0, F1, ...) they are a spouse in.
+    """
+    for no in range(n):
+        indi = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD()
+        indi.INDI = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI(XREF_INDI(f"I{no}"))
+        name = PERSONAL_NAME_STRUCTURE()
+        name.NAME = PERSONAL_NAME_STRUCTURE.NAME(f"Anna Maria/Andersdotter{no}/")
+        if name_pieces:
+            name.NAME.PERSONAL_NAME_PIECES = PERSONAL_NAME_PIECES()
+            name.NAME.PERSONAL_NAME_PIECES.GIVN = PERSONAL_NAME_PIECES.GIVN("Anna Maria")
+            name.NAME.PERSONAL_NAME_PIECES.SURN = PERSONAL_NAME_PIECES.SURN(f"Andersdotter{no}")
+        indi.INDI.PERSONAL_NAME_STRUCTUREs = [name]
+        birth = INDIVIDUAL_EVENT_STRUCTUREs.BIRT()
+        birth.INDIVIDUAL_EVENT_DETAIL = INDIVIDUAL_EVENT_DETAIL()
+        birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
+        birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(f"{1800 + no % 200}-05-17")
+        birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = PLACE_STRUCTURE()
+        birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = PLACE_STRUCTURE.PLAC("Skövde, Sverige")
+        if citations and sources:
+            birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.SOURCE_CITATIONs = list()
+            for citation_no in range(citations):
+                citation = SOURCE_CITATION()
+                citation.SOUR = SOURCE_CITATION.SOUR(f"S{(no + citation_no) % sources}")
+                citation.SOUR.PAGE = SOURCE_CITATION.SOUR.PAGE(f"Sida {no % 500 + 1}")
+                birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.SOURCE_CITATIONs.append(citation)
+        indi.INDI.INDIVIDUAL_EVENT_STRUCTUREs = [birth]
+        if notes:
+            indi.INDI.NOTE_STRUCTUREs = list()
+            for _ in range(notes):
+                note = NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT()
+                note.NOTE = NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE(
+                    "Bosatt i Skövde.\nFlyttade 1850 till Göteborg."
+                )
+                indi.INDI.NOTE_STRUCTUREs.append(note)
+        if no // 2 < families:
+            spouse_link = SPOUSE_TO_FAMILY_LINK()
+            spouse_link.FAMS = SPOUSE_TO_FAMILY_LINK.FAMS(f"F{no // 2}")
+            indi.INDI.SPOUSE_TO_FAMILY_LINKs = [spouse_link]
+        yield indi
+
+
+def iter_families(n: int, *, individuals: int) -> Iterator[LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD]:
+    """
+    yields n families (F0, F1, ...): family k of the (married) individuals 2k and 2k+1, with the child 2k+2.
+    """
+    fam_record = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD
+    for no in range(n):
+        fam = fam_record()
+        fam.FAM = fam_record.FAM(f"F{no}")
+        fam.FAM.HUSB = fam_record.FAM.HUSB(f"I{2 * no % individuals}")
+        fam.FAM.WIFE = fam_record.FAM.WIFE(f"I{(2 * no + 1) % individuals}")
+        fam.FAM.CHILs = [CHIL(f"I{(2 * no + 2) % individuals}")]
+        marriage = FAMILY_EVENT_STRUCTUREs.MARR(NULL())
+        marriage.FAMILY_EVENT_DETAIL = FAMILY_EVENT_DETAIL()
+        marriage.FAMILY_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
+        marriage.FAMILY_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(f"{1820 + no % 180}-06")
+        fam.FAM.FAMILY_EVENT_STRUCTUREs = [marriage]
+        yield fam
+
+
+def iter_sources(n: int) -> Iterator[LINEAGE_LINKED_RECORDs.SOURCE_RECORD]:
+    for no in range(n):
+        sour = LINEAGE_LINKED_RECORDs.SOURCE_RECORD()
+        sour.SOUR = LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR(f"S{no}")
+        sour.SOUR.TITL = LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TITL(f"Skövde kyrkoarkiv, volym {no}")
+        yield sour
+
+
+def gedcom_file(
+    individuals: int = 1000,
+    families: Optional[int] = None,
+    *,
+    notes: int = 1,
+    citations: int = 1,
+    name_pieces: bool = True,
+    sources: Optional[int] = None,
+) -> LINEAGE_LINKED_GEDCOM_FILE:
+    """
+    a complete file: header, submitter, the individuals, families (default: one per 3 individuals),
+    sources (default: one per 100 individuals, if cited) and trailer.
+    """
+    nof_families = individuals // 3 if families is None else families
+    nof_sources = (max(1, individuals // 100) if citations else 0) if sources is None else sources
+    ex = LINEAGE_LINKED_GEDCOM_FILE()
+    ex.GEDCOM_HEADER = header()
+    ex.GEDCOM_FORM_HEADER_EXTENSION = header_extension()
+    ex.FORM_RECORDS = FORM_RECORDS()
+    ex.FORM_RECORDS.SUBMITTER_RECORD = submitter()
+    ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs = [
+        *iter_individuals(
+            individuals,
+            notes=notes,
+            citations=citations,
+            name_pieces=name_pieces,
+            families=nof_families,
+            sources=nof_sources,
+        ),
+        *iter_families(nof_families, individuals=max(1, individuals)),
+        *iter_sources(nof_sources),
+    ]
+    ex.GEDCOM_TRAILER = GEDCOM_TRAILER()
+    ex.GEDCOM_TRAILER.TRLR = GEDCOM_TRAILER.TRLR()
+    return ex
+
+
+__all__ = [
+    "gedcom_file",
+    "header",
+    "header_extension",
+    "iter_families",
+    "iter_individuals",
+    "iter_sources",
+    "submitter",
+]
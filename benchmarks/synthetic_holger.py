@@ -0,0 +1,76 @@
+"""
+synthetic Holger (html) family sections and exports, for the benchmarks.
+
+    from synthetic_holger import export, family_section
+    section = family_section(12, children=100, notes=10)
+    text = export(5000, children=6)
+"""
+import random
+from typing import List
+
+from genealogy.holgerish.html import PERSONREGISTER
+
+
+def person(surname: str, firstnames: str, no: int, *, child: bool = False, family: int = None) -> str:
+    entry = f"<B>{surname}, {firstnames}</B>, född {1800 + no % 100}-0{1 + no % 9}-1{no % 10} i Skövde"
+    if no % 3 == 0:
+        entry += f", död {1860 + no % 40}-1{no % 3}-0{1 + no % 9} i Hova"
+    if family is not None:
+        entry += f", se familj <A HREF=#{family}>{family}</A>"
+    entry += "."
+    if no % 2 == 0:
+        entry += " Bosatt i Skövde."
+    if no % 4 == 0:
+        entry += " Bonde i Skövde. Enligt husförhörslängden läskunnig."
+    return f"* {entry}" if child else entry
+
+
+def family_section(fam_id: int, *, children: int = 10, notes: int = 0, seed: int = 0) -> str:
+    """
+    a family: two adults (married), children (some with families of their own) and notes (free text paragraphs),
+    with paragraphs broken by <BR> and <P> as in Holger exports.
+    """
+    rng = random.Random(seed + fam_id)
+    paragraphs: List[str] = [f"<A NAME={fam_id}>", f"<CENTER><FONT SIZE=5>Familj {fam_id}</FONT></CENTER>"]
+    paragraphs.append(person(f"Andersson{fam_id}", "Anders", fam_id))
+    paragraphs.append(f"Gift {1820 + fam_id % 50}-05-06 i Skövde med")
+    paragraphs.append(person(f"Persdotter{fam_id}", "Anna Maria", fam_id + 1))
+    paragraphs.append("Barn:")
+    for no in range(children):
+        family = fam_id + no + 1 if rng.random() < 0.2 else None
+        paragraphs.append(person(f"Andersson{fam_id}", f"Per{no}", no, child=True, family=family))
+        if no < notes:
+            paragraphs.append(
+                f"Enligt husförhörslängden flyttade {no} till Göteborg {1850 + no % 30}, "
+                f"men återkom efter {1 + no % 7} år och tog över gården efter fadern."
+            )
+    return "".join(paragraph + ("<P>" if rng.random() < 0.5 else "<BR>") for paragraph in paragraphs)
+
+
+def register_entry(surname: str, firstnames: str, no: int, families) -> str:
+    refs = ", ".join(f"<A HREF=#{family}>{family}</A>" for family in families)
+    return f"<B>{surname}, {firstnames}</B> f {1800 + no % 100}-0{1 + no % 9}-1{no % 10} i Skövde {refs}"
+
+
+def export(families: int, *, children: int = 6, notes: int = 0, seed: int = 0) -> str:
+    """
+    a Holger export of families (family_section) and a person register of everyone in them,
+    with the sections separated by <HR WIDTH=500>.
+    """
+    sections = [family_section(fam_id, children=children, notes=notes, seed=seed) for fam_id in range(1, families + 1)]
+    register = [PERSONREGISTER]
+    for fam_id in range(1, families + 1):
+        register.append(register_entry(f"Andersson{fam_id}", "Anders", fam_id, [fam_id]))
+        register.append(register_entry(f"Persdotter{fam_id}", "Anna Maria", fam_id + 1, [fam_id]))
+        for no in range(children):
+            register.append(register_entry(f"Andersson{fam_id}", f"Per{no}", no, [fam_id]))
+    sections.append("<BR>".join(register) + "<BR>")
+    return "<HR WIDTH=500>".join(sections)
+
+
+__all__ = [
+    "export",
+    "family_section",
+    "person",
+    "register_entry",
+]
@@ -1,21 +1,43 @@
+import array
+import codecs
+import collections.abc
 import datetime
 import functools
 import inspect
+import io
 import itertools
 import logging
 import os
 import pathlib
 import re
 import tempfile
+import threading
 import uuid
 import warnings
+from collections import namedtuple
 from contextlib import contextmanager
-from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from enum import Enum, auto
+from types import MappingProxyType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from .configure import configure
 
-configure()
+configure(lazy=True)
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +52,34 @@ def breaks():
         pass
 
 
+# compiled serialization plans, see Substructure.plan
+# NOTE: invalidated whenever a class attribute is (re)assigned, since plans are derived from class attributes.
+_serialization_plans: Dict[type, "SerializationPlan"] = dict()
+_nested_orders: Dict[Tuple[type, type], Tuple[Tuple[int, str], Optional[int]]] = dict()
+# every cache derived from class attributes, with the classes an entry (key, value) is derived from
+# (other modules may register theirs, e.g. the reader's routes), see invalidate
+_class_caches: List[Tuple[Dict, Callable[[Any, Any], Iterable[type]]]] = [
+    (_serialization_plans, lambda cls, plan: (cls, *(field.cls for field in plan.fields))),
+    (_nested_orders, lambda classes, order: classes),
+]
+# the kwargs of a value without keyword arguments, see Common
+EMPTY_KWARGS: Mapping = MappingProxyType(dict())
+# qualnames of the classes a class attribute was (re)assigned on after the classdef (e.g. to tell stale tables apart)
+_changed_classes: Set[str] = set()
+
+
+def invalidate(changed: type):
+    """
+    removes the entries of the class caches derived from changed (or from a subclass, which inherits its attributes).
+    """
+    for cache, derived_from in _class_caches:
+        stale = [
+            key for key, value in cache.items() if any(issubclass(cls, changed) for cls in derived_from(key, value))
+        ]
+        for key in stale:
+            del cache[key]
+
+
 class Meta(type):
     @classmethod
     def __prepare__(metaclass, name, bases, **kwds):
@@ -57,7 +107,11 @@ class Meta(type):
             :param **kwds:      classdef keyword arguments (sans 'metaclass')
                                 NOTE: same as in classdef, passed by value
             :return:            <class 'name'>
+            NOTE:
+            classes are slotted unless they declare __slots__ themselves (so instances only get a __dict__ from a base
+            that asks for one, see Substructure).
         """
+        namespace.setdefault("__slots__", ())
         return super().__new__(metaclass, name, bases, namespace)
 
     def __init__(classname, name, bases, namespace, **kwds):
@@ -74,11 +128,16 @@ class Meta(type):
             must call: super().__init__([args...]).
         """
         for key, value in kwds.items():
-            if not hasattr(classname, key):
-                setattr(classname, key, value)
+            # NOTE: a keyword argument overrides what is inherited (e.g. the Size of ENTRY_RECORDING_DATE),
+            # but not what the classdef itself defines
+            if key not in namespace:
+                # NOTE: part of the classdef, so not a change (see __setattr__), but caches may still hold subclasses
+                for base in bases:
+                    invalidate(base)
+                super().__setattr__(key, value)
             else:
                 warnings.warn(
-                    f"Could not enter {key}:{value} into class dictionary of {name} (already has {key}:{getattr(classname, key)})",
+                    f"Could not enter {key}:{value} into class dictionary of {name} (defines {key}:{getattr(classname, key)} itself)",
                     Warning,
                 )
         super().__init__(name, bases, namespace, **kwds)
@@ -99,11 +158,42 @@ class Meta(type):
         """
         return super().__call__(*args, **kwargs)
 
+    def __setattr__(classname, name, value):
+        """
+            __setattr__
+            :param classname:   <class 'name'>
+            :param name:        attribute name
+            :param value:       attribute value
+            :return:            None
+            NOTE:
+            invalidates the compiled serialization plans (and the other entries in _class_caches) derived from
+            <class 'name'>, and records its qualname in _changed_classes.
+        """
+        _changed_classes.add(classname.__qualname__)
+        invalidate(classname)
+        super().__setattr__(name, value)
+
 
 class Common(metaclass=Meta):
+    """
+    the value of a structure: its positional and keyword arguments.
+    NOTE: keyword arguments are only kept if there are any, else kwargs is an empty read-only mapping
+    (assign kwargs to add some).
+    """
+
+    __slots__ = ("args", "_kwargs")
+
     def __init__(self, *args, **kwargs):
         self.args = args
-        self.kwargs = kwargs
+        self._kwargs = kwargs or None
+
+    @property
+    def kwargs(self) -> Mapping:
+        return EMPTY_KWARGS if self._kwargs is None else self._kwargs
+
+    @kwargs.setter
+    def kwargs(self, kwargs: dict):
+        self._kwargs = kwargs or None
 
     def __str__(self):
         value = str()
@@ -117,6 +207,8 @@ class Common(metaclass=Meta):
 
 
 class XREF_ID(Common):
+    __slots__ = ("id",)
+
     def __init__(self, *args, create=False, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -201,22 +293,75 @@ class GEDCOM_LINE:
         )
 
 
+def utf8_chunksplit(text: str, safe_chunksize: int) -> Iterator[str]:
+    """
+    splits text into chunks of at most safe_chunksize UTF-8 bytes, without splitting characters.
+    NOTE: text is encoded once, each cut steps back over UTF-8 continuation bytes (0b10xxxxxx).
+    """
+    encoded = text.encode("utf-8")
+    if len(encoded) == len(text):
+        for start in range(0, len(text), safe_chunksize):
+            yield text[start : start + safe_chunksize]
+        return
+    start = 0
+    while start < len(encoded):
+        end = start + safe_chunksize
+        if end >= len(encoded):
+            end = len(encoded)
+        else:
+            while encoded[end] & 0xC0 == 0x80:
+                end -= 1
+        if end <= start:
+            raise ValueError(f"character does not fit in a chunk of {safe_chunksize} bytes: {text}")
+        yield encoded[start:end].decode("utf-8")
+        start = end
+
+
 class GEDCOM_LINES:
+    """
+    columnar buffer of GEDCOM lines, one row per line:
+    the level relative to the level the lines are rendered at, an index into the (shared, interned) tag table,
+    the xref id and the line value.
+    """
+
+    tag_names: List[Optional[str]] = list()
+    tag_ids: Dict[Optional[str], int] = dict()
+    # NOTE: the tables are shared by every instance (and thread), new tags are entered under the lock
+    tag_lock = threading.Lock()
+
+    __slots__ = ("levels", "tags", "xref_ids", "line_values")
+
     def __init__(self):
-        self.lines: List[Union[Callable[[int], GEDCOM_LINE], "GEDCOM_LINES"]] = list()
+        self.levels = array.array("h")
+        self.tags = array.array("I")
+        self.xref_ids: List[Optional[str]] = list()
+        self.line_values: List[Optional[str]] = list()
+
+    def __len__(self):
+        return len(self.levels)
+
+    def append(self, *, level_delta: int, tag: Optional[str], xref_id: Optional[XREF_ID] = None, line_value=None):
+        if (tag_id := GEDCOM_LINES.tag_ids.get(tag)) is None:
+            tag_id = GEDCOM_LINES.tag_id(tag)
+        self.levels.append(level_delta)
+        self.tags.append(tag_id)
+        self.xref_ids.append(None if xref_id is None else str(xref_id))
+        self.line_values.append(None if line_value is None else str(line_value))
+
+    @staticmethod
+    def tag_id(tag: Optional[str]) -> int:
+        """
+        the index of tag in the tag table, entering it if it is new.
+        """
+        with GEDCOM_LINES.tag_lock:
+            if (tag_id := GEDCOM_LINES.tag_ids.get(tag)) is None:
+                tag_names = GEDCOM_LINES.tag_names
+                tag_names.append(tag)
+                tag_id = GEDCOM_LINES.tag_ids[tag] = len(tag_names) - 1
+        return tag_id
 
     def add_text(self, *, level_delta: int, tag: str, primitive: "Primitive", xref_id: XREF_ID = None):
         try:
-
-            def unicode_chunksplit(slicable, safe_chunksize: int):
-                from_char = 0
-                while from_char < len(slicable):
-                    for to_char in range(from_char + safe_chunksize, from_char, -1):
-                        if len(slicable[from_char:to_char].encode("utf-8")) <= safe_chunksize:
-                            yield slicable[from_char:to_char]
-                            from_char = to_char
-                            break
-
             safe_chunksize = 255
             safe_chunksize -= len("99")
             if xref_id:
@@ -234,42 +379,21 @@ class GEDCOM_LINES:
             if isinstance(primitive, Enum):
                 primitive = primitive.value
             for line_no, line in enumerate(lines):
-                for text_chunk_no, unicode_text_chunk in enumerate(unicode_chunksplit(line, safe_chunksize)):
+                for text_chunk_no, unicode_text_chunk in enumerate(utf8_chunksplit(line, safe_chunksize)):
                     if text_chunk_no == 0:
                         if line_no == 0:
-
-                            def apply_text(
-                                n, level_delta=level_delta, tag=tag, xref_id=xref_id, line_value=unicode_text_chunk
-                            ):
-                                return GEDCOM_LINE(
-                                    level=n + level_delta, tag=tag, xref_id=xref_id, line_value=line_value
-                                )
-
-                            self.lines.append(apply_text)
-                            continue
+                            self.append(level_delta=level_delta, tag=tag, xref_id=xref_id, line_value=unicode_text_chunk)
                         else:
-
-                            def apply_cont(n, level_delta=level_delta, xref_id=xref_id, line_value=unicode_text_chunk):
-                                return GEDCOM_LINE(
-                                    level=n + level_delta + 1, tag="CONT", xref_id=xref_id, line_value=line_value
-                                )
-
-                            self.lines.append(apply_cont)
+                            self.append(level_delta=level_delta + 1, tag="CONT", line_value=unicode_text_chunk)
                     else:
-
-                        def apply_conc(n, level_delta=level_delta, xref_id=xref_id, line_value=unicode_text_chunk):
-                            return GEDCOM_LINE(
-                                level=n + level_delta + 1, tag="CONC", xref_id=xref_id, line_value=line_value
-                            )
-
-                        if hasattr(primitive, "meta"):
-                            if max(getattr(getattr(primitive, "meta"), "Size")) <= 248:
-                                raise ValueError(
-                                    f"'never uses CONC records for line values with a maximum length of 248 or less': "
-                                    "{line}"
-                                )
-                            else:
-                                self.lines.append(apply_conc)
+                        size = getattr(primitive, "Size", None)
+                        if size is not None and (max(size) if isinstance(size, tuple) else size) <= 248:
+                            # NOTE: 'never uses CONC records for line values with a maximum length of 248 or less',
+                            # the value is cut (as it always was), validator.validate reports it as a SizeViolation
+                            logger.warning(f"<no-conc:{tag}:{size}:{line}>")
+                            break
+                        else:
+                            self.append(level_delta=level_delta + 1, tag="CONC", line_value=unicode_text_chunk)
         except Exception as ex:
             raise ex
 
@@ -280,26 +404,45 @@ class GEDCOM_LINES:
                     logger.debug(f"\t\t<{level_delta} {tag} {primitive} {xref_id}>")
                     self.add_text(level_delta=level_delta, tag=tag, primitive=primitive, xref_id=xref_id)
         else:
-
-            def apply(n, level_delta=level_delta, tag=tag, xref_id=xref_id):
-                return GEDCOM_LINE(level=n + level_delta, tag=tag, xref_id=xref_id, line_value=None)
-
             logger.debug(f"\t\t<{level_delta} {tag} {primitives} {xref_id}>")
-            self.lines.append(apply)
+            self.append(level_delta=level_delta, tag=tag, xref_id=xref_id)
 
     def add_substructures(self, level_delta: int, *substructs: Optional["Substructure"]):
         if substructs:
             for substruct in substructs:
                 if substruct:
+                    logger.debug(f"\t\t<<{level_delta} {substructs}>>")
+                    substruct(lines=self, delta_level=level_delta)
 
-                    def apply(n, level_delta=level_delta, substruct=substruct):
-                        return substruct(n + level_delta)
+    def render(self, level: int) -> Iterator[str]:
+        """
+        yields the lines (terminator included), resolving the relative levels against level.
+        """
+        tag_names = GEDCOM_LINES.tag_names
+        for level_delta, tag_id, xref_id, line_value in zip(self.levels, self.tags, self.xref_ids, self.line_values):
+            tag = tag_names[tag_id]
+            if xref_id is None:
+                if line_value is None:
+                    yield f"{level + level_delta} {tag}\n"
+                else:
+                    yield f"{level + level_delta} {tag} {line_value}\n"
+            elif line_value is None:
+                yield f"{level + level_delta} {xref_id} {tag}\n"
+            else:
+                yield f"{level + level_delta} {xref_id} {tag} {line_value}\n"
 
-                    logger.debug(f"\t\t<<{level_delta} {substructs}>>")
-                    self.lines.append(apply)
+    def clear(self):
+        del self.levels[:]
+        del self.tags[:]
+        self.xref_ids.clear()
+        self.line_values.clear()
+
+    def drain(self, level: int) -> Iterator[str]:
+        yield from self.render(level)
+        self.clear()
 
     def __call__(self, level=int):
-        return "".join([str(line(level)) for line in self.lines])
+        return "".join(self.render(level))
 
 
 @functools.lru_cache(maxsize=None)
@@ -334,10 +477,127 @@ def getsource(cls, nesteds):
     return best
 
 
+class FieldKind(Enum):
+    POINTER = auto()
+    TAG = auto()
+    XREF = auto()
+    PRIMITIVE = auto()
+    SUBSTRUCTURE = auto()
+
+    @classmethod
+    def of(cls, nested_cls: type) -> "FieldKind":
+        if issubclass(nested_cls, Pointer):
+            return cls.POINTER
+        elif issubclass(nested_cls, Tag):
+            return cls.TAG
+        elif issubclass(nested_cls, XREF_ID):
+            return cls.XREF
+        elif issubclass(nested_cls, Primitive):
+            return cls.PRIMITIVE
+        else:
+            return cls.SUBSTRUCTURE
+
+
+FieldDescriptor = namedtuple("FieldDescriptor", ("name", "tag", "delta_level", "kind", "iterable", "cls"))
+SerializationPlan = namedtuple("SerializationPlan", ("tag", "delta_level", "kind", "bases", "fields", "value_names"))
+
+
+def nested_order(owner: type, nested_cls: type) -> Tuple[Tuple[int, str], Optional[int]]:
+    """
+    returns the sort key of nested_cls within owner (position in the docstring of owner, then qualname),
+    and the level offset nested_cls is emitted at (None if it is not emitted).
+    """
+    if (order := _nested_orders.get((owner, nested_cls))) is None:
+        doc = owner.__doc__
+        qualname = nested_cls.__qualname__
+        if doc:
+            if result := re.search(fr"{qualname}", doc):
+                key = (result.start(), qualname)
+            else:
+                key = (len(doc), qualname)
+        else:
+            key = (0, qualname)
+        if qualname.startswith(owner.__qualname__):
+            level_offset = 0
+        elif issubclass(nested_cls, Substructure):
+            level_offset = 1
+        else:
+            level_offset = None
+        order = _nested_orders[(owner, nested_cls)] = (key, level_offset)
+    return order
+
+
+def may_hold_values(attr) -> bool:
+    if isinstance(attr, type) or get_origin(attr) is not None:
+        return False
+    return isinstance(attr, Common) or (isinstance(attr, Iterable) and not isinstance(attr, (str, bytes)))
+
+
+def compile_plan(cls: type) -> "SerializationPlan":
+    """
+    compiles (once per class) what the emitter needs to know about cls:
+    its tag, delta_level, kind and value bases,
+    the nested classes declared on it (as fields, in emission order),
+    and the names of class attributes that hold values (and so must be visited besides the instance attributes).
+    """
+    if plan := _serialization_plans.get(cls):
+        return plan
+    fields: List[FieldDescriptor] = list()
+    value_names: List[str] = list()
+    for attrname in dir(cls):
+        attr = getattr(cls, attrname)
+        if isinstance(attr, type):
+            if issubclass(attr, (XREF_ID, Primitive, Substructure)):
+                fields.append(
+                    FieldDescriptor(
+                        name=attrname,
+                        tag=attr.__name__,
+                        delta_level=getattr(attr, "delta_level", None),
+                        kind=FieldKind.of(attr),
+                        iterable=False,
+                        cls=attr,
+                    )
+                )
+        elif get_origin(attr) is not None:
+            for item in get_args(attr):
+                if isinstance(item, type) and issubclass(item, (XREF_ID, Primitive, Substructure)):
+                    fields.append(
+                        FieldDescriptor(
+                            name=attrname,
+                            tag=item.__name__,
+                            delta_level=getattr(item, "delta_level", None),
+                            kind=FieldKind.of(item),
+                            iterable=True,
+                            cls=item,
+                        )
+                    )
+        elif not attrname.startswith("__") and may_hold_values(attr):
+            value_names.append(attrname)
+    fields.sort(key=lambda field, cls=cls: nested_order(cls, field.cls)[0])
+    plan = SerializationPlan(
+        tag=cls.__name__,
+        delta_level=getattr(cls, "delta_level", None),
+        kind=FieldKind.of(cls),
+        bases=tuple(base for base in cls.__bases__ if base not in (XREF_ID, Primitive, Substructure)),
+        fields=tuple(fields),
+        value_names=tuple(value_names),
+    )
+    _serialization_plans[cls] = plan
+    logger.debug(f"<plan:{cls.__qualname__}:{plan}>")
+    return plan
+
+
 class Substructure(Common):
+    # NOTE: the nested structures are instance attributes named like the nested classes
+    __slots__ = ("__dict__",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def plan(cls) -> SerializationPlan:
+        return compile_plan(cls)
+
     @classmethod
     def nested_classes(cls, *queries):
         inners = []
@@ -349,15 +609,12 @@ class Substructure(Common):
 
     def instances_of_nested_classes(self, *queries):
         inners = []
-        for attrname in dir(self):
+        attr_queries = tuple(innercls for innercls in queries if innercls is not Iterable)
+        for attrname in sorted(self.__dict__.keys() | set(compile_plan(self.__class__).value_names)):
             attr = getattr(self, attrname)
-            if isinstance(attr, Iterable):
-                for subattr in attr:
-                    if any(isinstance(subattr, innercls) for innercls in queries):
-                        inners.append(subattr)
-            elif not isinstance(attr, type) and any(
-                isinstance(attr, innercls) for innercls in queries if innercls is not Iterable
-            ):
+            if isinstance(attr, collections.abc.Iterable):
+                inners.extend(subattr for subattr in attr if isinstance(subattr, queries))
+            elif not isinstance(attr, type) and isinstance(attr, attr_queries):
                 inners.append(attr)
         return inners
 
@@ -370,83 +627,67 @@ class Substructure(Common):
             yield from (getattr(nested, attr) for attr in dir(nested) if isinstance(getattr(nested, attr), base))
 
     def handle_nested(self, *, lines: GEDCOM_LINES, nested: Union[Primitive, "Substructure"], delta_level: int):
-        if hasattr(nested, "delta_level") and getattr(nested, "delta_level"):
-            nested_level = delta_level + getattr(nested, "delta_level")
-            logger.debug(
-                f"![{nested_level}\t{nested.__class__.__qualname__} <= {delta_level:+d} {getattr(nested, 'delta_level'):+d}]"
-            )
+        for _ in self.walk_nested(lines=lines, nested=nested, delta_level=delta_level):
+            pass
+
+    def walk_nested(self, *, lines: GEDCOM_LINES, nested: Union[Primitive, "Substructure"], delta_level: int):
+        """
+        adds the lines of nested to lines, yielding whenever lines may be drained.
+        """
+        plan = compile_plan(nested.__class__)
+        if plan.delta_level:
+            nested_level = delta_level + plan.delta_level
+            logger.debug(f"![{nested_level}\t{nested.__class__.__qualname__} <= {delta_level:+d} {plan.delta_level:+d}]")
         else:
             nested_level = delta_level
 
-        tag = nested.__class__.__name__
-        bases = [base for base in nested.__class__.__bases__ if base not in (XREF_ID, Primitive, Substructure)]
-        xrefs: List[XREF_ID] = list()
+        tag = plan.tag
 
         tag_value: Optional[Primitive] = None
         tag_xref_id: Optional[XREF_ID] = None
 
-        primitives: List[Primitive] = list()
-        substructures: List[Substructure] = list()
-
         blacklist: List[Union[Common, Primitive, XREF_ID, str]] = list()
-        for base in bases:
-            if isinstance(nested, base):
-                if isinstance(nested, Common):
-                    if hasattr(nested, "args") and getattr(nested, "args"):
-                        for arg in nested.args:
-                            if arg not in blacklist:
-                                if not tag_xref_id and isinstance(arg, base) and isinstance(arg, XREF_ID):
-                                    logger.debug(f"<tag-xref-id-for-{nested}:[{base}]:{arg}>")
-                                    tag_xref_id = arg
-                                    blacklist.append(arg)
-                                    continue
-                                elif not tag_xref_id and isinstance(arg, str) and issubclass(base, XREF_ID):
-                                    logger.debug(f"<tag-xref-id-for-{nested}:{arg}>")
-                                    tag_xref_id = base(arg)
-                                    blacklist.append(arg)
-                                    continue
-                                elif not tag_value and isinstance(arg, base) and isinstance(arg, Primitive):
-                                    logger.debug(f"<tag-value-for-{nested}:[{base}]:{arg}>")
-                                    tag_value = arg
-                                    blacklist.append(arg)
-                                    continue
-                                elif (
-                                    not tag_value and isinstance(arg, str) and str(arg) and issubclass(base, Primitive)
-                                ):
-                                    logger.debug(f"<tag-str-value-for-{nested}:{arg}>")
-                                    tag_value = base(arg)
-                                    blacklist.append(arg)
-                                    continue
-                                elif not tag_value and isinstance(arg, Common) and str(arg):
-                                    logger.debug(f"<tag-common-last-resort-value-for-{nested}:{arg}>")
-                                    tag_value = base(arg)
-                                    blacklist.append(arg)
-                                    continue
-                                elif not tag_value and not isinstance(arg, Common):
-                                    logger.debug(f"<tag-unknown-last-resort-value-for-{nested}:{arg}>")
-                                    tag_value = base(arg)
-                                    blacklist.append(arg)
-                                    continue
-                    elif hasattr(nested, "kwargs") and getattr(nested, "kwargs"):
-                        if not tag_value and isinstance(nested, Primitive):
-                            logger.debug(f"<tag-str-of-self-for-{nested}>")
-                            tag_value = nested
-                            blacklist.append(nested)
+        for base in plan.bases:
+            if nested.args:
+                for arg in nested.args:
+                    if arg not in blacklist:
+                        if not tag_xref_id and isinstance(arg, base) and isinstance(arg, XREF_ID):
+                            logger.debug(f"<tag-xref-id-for-{tag}:[{base}]:{arg}>")
+                            tag_xref_id = arg
+                            blacklist.append(arg)
+                            continue
+                        elif not tag_xref_id and isinstance(arg, str) and issubclass(base, XREF_ID):
+                            logger.debug(f"<tag-xref-id-for-{tag}:{arg}>")
+                            tag_xref_id = base(arg)
+                            blacklist.append(arg)
+                            continue
+                        elif not tag_value and isinstance(arg, base) and isinstance(arg, Primitive):
+                            logger.debug(f"<tag-value-for-{tag}:[{base}]:{arg}>")
+                            tag_value = arg
+                            blacklist.append(arg)
+                            continue
+                        elif not tag_value and isinstance(arg, str) and str(arg) and issubclass(base, Primitive):
+                            logger.debug(f"<tag-str-value-for-{tag}:{arg}>")
+                            tag_value = base(arg)
+                            blacklist.append(arg)
                             continue
-                    logger.debug(f"<tag-no-value-found>")
+                        elif not tag_value and isinstance(arg, Common) and str(arg) and not issubclass(base, XREF_ID):
+                            logger.debug(f"<tag-common-last-resort-value-for-{tag}:{arg}>")
+                            tag_value = base(arg)
+                            blacklist.append(arg)
+                            continue
+                        elif not tag_value and not isinstance(arg, Common) and not issubclass(base, XREF_ID):
+                            logger.debug(f"<tag-unknown-last-resort-value-for-{tag}:{arg}>")
+                            tag_value = base(arg)
+                            blacklist.append(arg)
+                            continue
+            elif nested.kwargs:
+                if not tag_value and isinstance(nested, Primitive):
+                    logger.debug(f"<tag-str-of-self-for-{tag}>")
+                    tag_value = nested
+                    blacklist.append(nested)
                     continue
-            if issubclass(base, Primitive):
-                found = list(Substructure.find_stuff(nested, base))
-                logger.debug(f"<primitives-for-{base}:{found}>")
-                primitives.extend(found)
-            if issubclass(base, Substructure):
-                found = list(Substructure.find_stuff(nested, base))
-                logger.debug(f"<substructures-for-{base}:{found}>")
-                substructures.extend(found)
-            if issubclass(base, XREF_ID) and isinstance(nested, Pointer):
-                found = list(Substructure.find_stuff(nested, base))
-                logger.debug(f"<xrefs-for-{base}:{found}>")
-                xrefs.extend(found)
+            logger.debug(f"<tag-no-value-found>")
         if (tag_value) or (tag_xref_id):
             if tag_value and tag_xref_id and not isinstance(tag_value, NULL):
                 logger.debug(f"<tag-with-xref-id-and-value>")
@@ -467,65 +708,75 @@ class Substructure(Common):
         if isinstance(nested, Tag):
             logger.debug(f"<tag-with-tag>")
             lines.add_primitives(nested_level, tag)
-        if xrefs:
-            logger.debug(f"<xrefs>")
-            for xref in (xref for xref in xrefs if xref is not None):
-                lines.add_primitives(nested_level, tag, xref_id=xref if xref else None)
-        if primitives:
-            logger.debug(f"<primitives>")
-            lines.add_primitives(nested_level, tag, *primitives, xref_id=xrefs[0] if xrefs else None)
-        if substructures:
-            logger.debug(f"<substructures>")
-            lines.add_substructures(nested_level, *substructures)
-        try:
-            if isinstance(nested, Substructure):
-                logger.debug(f"<nested:call@{delta_level}>")
-                nested(lines=lines, delta_level=delta_level)
-            else:
-                logger.debug(f"<nested:skip>")
-        except Exception as e:
-            logger.debug(f"<nested:except:{e}>")
+        yield
+        if isinstance(nested, Substructure):
+            logger.debug(f"<nested:call@{delta_level}>")
+            yield from nested.walk(lines=lines, delta_level=delta_level)
+        else:
+            logger.debug(f"<nested:skip>")
 
     def __call__(self, *, lines: GEDCOM_LINES, delta_level=0):
-        logger.debug(f"\n[{delta_level}\t{self.__class__.__qualname__}]")
-        if hasattr(self, "delta_level") and getattr(self, "delta_level"):
-            delta_level = delta_level + getattr(self, "delta_level")
-            logger.debug(f"![{delta_level}\t{self.__class__.__qualname__} => {getattr(self, 'delta_level'):+d}]")
-
-        nesteds = list(self.instances_of_nested_classes(XREF_ID, Primitive, Substructure))
-
-        if self.__class__.__doc__:
-            nesteds = sorted(
-                nesteds,
-                key=lambda nested, doc=self.__class__.__doc__: (result.start(), nested.__class__.__qualname__)
-                if (result := re.search(fr"{nested.__class__.__qualname__}", doc))
-                else (len(doc), nested.__class__.__qualname__),
-            )
-        else:
-            nesteds = sorted(nesteds, key=lambda nested: nested.__class__.__qualname__)
+        for _ in self.walk(lines=lines, delta_level=delta_level):
+            pass
+        return lines
 
-        logger.debug(f"<nesteds:{nesteds}>")
-        for nested in nesteds:
+    def iter_lines(self, level: int = 0) -> Iterator[str]:
+        """
+        yields each GEDCOM line (terminator included) as it is produced,
+        so that only the lines of a single structure are kept in memory.
+        """
+        lines = GEDCOM_LINES()
+        for _ in self.walk(lines=lines, delta_level=0):
+            yield from lines.drain(level)
+        yield from lines.drain(level)
 
-            logger.debug(f"<nested:{nested.__class__.__qualname__}:{nested}>")
-            is_iterable = isinstance(nested, Iterable)
-            is_qualname_nested = nested.__class__.__qualname__.startswith(self.__class__.__qualname__)
+    def write_to(self, stream: IO, *, encoding: str = "utf-8", level: int = 0):
+        """
+        writes the GEDCOM lines to stream as they are produced.
+        text streams get str, binary streams get bytes encoded with encoding through a buffered writer.
+        NOTE: use encoding="utf-8-sig" for a byte order mark (written once, at the start).
+        """
+        if isinstance(stream, io.TextIOBase):
+            for line in self.iter_lines(level):
+                stream.write(line)
+            return
+        writer = stream if isinstance(stream, io.BufferedIOBase) else io.BufferedWriter(stream)
+        encoder = codecs.getincrementalencoder(encoding)()
+        try:
+            for line in self.iter_lines(level):
+                writer.write(encoder.encode(line))
+            writer.write(encoder.encode("", final=True))
+        finally:
+            # NOTE: a writer wrapped around a raw stream would close it when collected
+            writer.flush()
+            if writer is not stream:
+                writer.detach()
+
+    def walk(self, *, lines: GEDCOM_LINES, delta_level=0):
+        """
+        adds the lines of self to lines, yielding whenever lines may be drained.
+        """
+        cls = self.__class__
+        plan = compile_plan(cls)
+        logger.debug(f"\n[{delta_level}\t{cls.__qualname__}]")
+        if plan.delta_level:
+            delta_level = delta_level + plan.delta_level
+            logger.debug(f"![{delta_level}\t{cls.__qualname__} => {plan.delta_level:+d}]")
+
+        nesteds = sorted(
+            (
+                (nested_order(cls, nested.__class__), nested)
+                for nested in self.instances_of_nested_classes(XREF_ID, Primitive, Substructure)
+            ),
+            key=lambda order_nested: order_nested[0][0],
+        )
 
-            if is_iterable:
-                for subnested in nested:
-                    logger.debug(f"<is_iterable:subnested:handle_nested@+1:{delta_level+1}>")
-                    self.handle_nested(lines=lines, nested=subnested, delta_level=delta_level + 1)
-            elif is_qualname_nested:
-                logger.debug(f"<is_qualname_nested:handle_nested@{delta_level}>")
-                self.handle_nested(lines=lines, nested=nested, delta_level=delta_level)
+        for (_, level_offset), nested in nesteds:
+            if level_offset is None:
+                logger.debug(f"<is_attribute:skip:{nested.__class__.__qualname__}>")
             else:
-                if isinstance(nested, Substructure):
-                    logger.debug(f"<is_attribute:handle_nested@+1:{delta_level+1}>")
-                    self.handle_nested(lines=lines, nested=nested, delta_level=delta_level + 1)
-                else:
-                    logger.debug(f"<is_attribute:skip:{nested}>")
-
-        return lines
+                logger.debug(f"<nested:{nested.__class__.__qualname__}:handle_nested@{delta_level + level_offset}>")
+                yield from self.walk_nested(lines=lines, nested=nested, delta_level=delta_level + level_offset)
 
 
 def get_month(date: Union[datetime.date, datetime.datetime]):
@@ -1,3 +1,11 @@
+import functools
+import logging
+import logging.handlers
+import os
+import sys
+from typing import Dict, Iterator, List, Optional
+
+
 class LevelFilter:
     def __init__(self, levelname: str):
         self.levelname = levelname
@@ -6,14 +14,168 @@ class LevelFilter:
         return self.levelname == record.levelname
 
 
-def configure(*args, **kwargs):
-    import logging.config
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    puts records on a bounded queue, waiting for room when it is full (so no record is lost).
+    in a forked process (where no listener runs) records are handled by the handlers of the listener directly.
+    """
+
+    def __init__(self, queue, handlers):
+        super().__init__(queue)
+        self.handlers = handlers
+        self.pid = os.getpid()
+
+    def prepare(self, record):
+        # NOTE: the queue is in process, so the record is neither formatted nor copied here but in the listener
+        return record
+
+    def enqueue(self, record):
+        self.queue.put(record)
+
+    def emit(self, record):
+        if os.getpid() == self.pid:
+            super().emit(record)
+            return
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class BoundedQueueListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        if self._thread is not None:
+            super().stop()
+
+
+class PendingConfiguration(logging.Handler):
+    """
+    stands in for the handlers of configure(lazy=True) on the root logger until the first record reaches it,
+    then configures logging and hands the record to the handlers it configured.
+    """
+
+    def __init__(self, configure):
+        super().__init__()
+        self.configure = configure
+
+    @staticmethod
+    def handlers_of(logger: logging.Logger) -> Iterator[logging.Handler]:
+        """
+        the handlers a record logged by logger is handed to (see logging.Logger.callHandlers).
+        """
+        while logger:
+            yield from logger.handlers
+            logger = logger.parent if logger.propagate else None
+
+    def handle(self, record):
+        root = logging.getLogger()
+        logger = root if record.name == root.name else logging.getLogger(record.name)
+        handled = set(self.handlers_of(logger))
+        with self.lock:
+            if self in root.handlers:
+                # NOTE: a new list, the caller goes on with the handlers of the old one
+                root.handlers = [handler for handler in root.handlers if handler is not self]
+                self.configure()
+        if logger.isEnabledFor(record.levelno):
+            for handler in self.handlers_of(logger):
+                if handler not in handled and record.levelno >= handler.level:
+                    handler.handle(record)
+        return True
+
+    def emit(self, record):
+        self.handle(record)
+
+
+def loggers() -> List[logging.Logger]:
+    return [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+
+
+def unqueue_handlers():
+    """
+    puts the handlers behind every BoundedQueueHandler (see queue_handlers) back on their loggers,
+    so that no logger is left with a queue no listener empties once the listeners are stopped.
+    """
+    for logger in loggers():
+        if any(isinstance(handler, BoundedQueueHandler) for handler in logger.handlers):
+            logger.handlers = [
+                unqueued
+                for handler in logger.handlers
+                for unqueued in (handler.handlers if isinstance(handler, BoundedQueueHandler) else [handler])
+            ]
+
+
+def queue_handlers(maxsize: int) -> List[logging.handlers.QueueListener]:
+    """
+    moves the handlers of every configured logger behind a BoundedQueueHandler,
+    one queue (and listener thread) per distinct set of handlers, and starts the listeners.
+    """
+    import atexit
+    import queue
+
+    queued = dict()
+    for logger in loggers():
+        handlers = tuple(handler for handler in logger.handlers if not isinstance(handler, BoundedQueueHandler))
+        if not handlers:
+            continue
+        if handlers not in queued:
+            queued[handlers] = BoundedQueueHandler(queue.Queue(maxsize), list(handlers))
+        logger.handlers = [queued[handlers]]
+    listeners = list()
+    for handler in queued.values():
+        listener = BoundedQueueListener(handler.queue, *handler.handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        listeners.append(listener)
+    return listeners
+
+
+def configure(
+    *args,
+    package: Optional[str] = None,
+    backend: str = "sync",
+    levels: Optional[Dict[str, str]] = None,
+    maxsize: int = 10000,
+    lazy: bool = False,
+    **kwargs,
+) -> List[logging.handlers.QueueListener]:
+    """
+    configures logging from the logging.json of package (default: gedcomish), the log files are opened on their first
+    record, not at import. the handlers of a previous queue backend are taken off their queues.
+    lazy (what modules ask for when imported) postpones it until the first record is logged (see PendingConfiguration),
+    and leaves logging as it is if the root logger already has handlers (so the first module imported decides, and
+    neither a configuration made on purpose nor one made by the user is replaced by importing another module).
+    levels sets the level of loggers by name, e.g. {"gedcomish.common": "WARNING", "holgerish.html": "DEBUG"}
+    (a name without the genealogy. prefix also applies to the logger of the module imported with it, and the name of a
+    module run with -m to __main__).
+    backend "queue" has the handlers run in listener threads, fed by bounded queues of maxsize records;
+    the listeners are returned (and stopped at exit), so logging a record does not wait for its formatting or i/o.
+    """
+    if backend not in ("sync", "queue"):
+        raise ValueError(f"unknown logging backend {backend!r} (sync or queue)")
+    if lazy:
+        root = logging.getLogger()
+        if not root.handlers:
+            # NOTE: every record has to reach the root logger, the levels are set when it is configured
+            root.setLevel(logging.NOTSET)
+            root.addHandler(
+                PendingConfiguration(
+                    functools.partial(
+                        configure, *args, package=package, backend=backend, levels=levels, maxsize=maxsize, **kwargs
+                    )
+                )
+            )
+        return list()
+
+    from logging.config import dictConfig
     import json
-    import logging
     import importlib.resources
     import warnings
 
-    jsonConfig = importlib.resources.files(__package__) / "logging.json"
+    jsonConfig = importlib.resources.files(package or __package__) / "logging.json"
 
     def default_logging(default_level):
         logging.basicConfig(
@@ -22,13 +184,26 @@ def configure(*args, **kwargs):
         )
         warnings.warn("fallback logging setup used!")
 
+    unqueue_handlers()
     if jsonConfig:
         try:
             config = json.loads(jsonConfig.read_text())
-            logging.config.dictConfig(config)
+            dictConfig(config)
         except Exception as e:
             default_logging(default_level=logging.INFO)
             logging.error(f"Failed to load {jsonConfig}")
             logging.error(f"{e}")
     else:
         default_logging(default_level=logging.INFO)
+
+    # NOTE: a module run with -m logs as __main__
+    main = getattr(sys.modules.get("__main__"), "__spec__", None)
+    for name, level in (levels or dict()).items():
+        names = {name} if name.startswith("genealogy.") else {name, f"genealogy.{name}"}
+        if main is not None and main.name in names:
+            names.add("__main__")
+        for logger_name in names:
+            logging.getLogger(logger_name).setLevel(level)
+    if backend == "queue":
+        return queue_handlers(maxsize)
+    return list()
@@ -0,0 +1,451 @@
+import array
+import bisect
+import datetime
+import functools
+import logging
+import re
+from collections import namedtuple
+from enum import IntEnum
+from typing import Iterable, Iterator, Optional, Tuple
+
+from ..configure import configure
+from ..lazy import lazy_import
+
+# NOTE: optional, date_keys fills array.array instead (that cannot be sorted or filtered as one)
+numpy = lazy_import("numpy")
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+Date = namedtuple("Date", ("calendar", "year", "month", "day", "dual", "bc"))
+DateValue = namedtuple("DateValue", ("keyword", "dates", "conjunction", "phrase"))
+DateKey = namedtuple("DateKey", ("lower", "upper", "precision"))
+DateIndex = namedtuple("DateIndex", ("xref_ids", "tags", "lower", "upper", "precision"))
+
+DATE_CACHE_SIZE = 1 << 16
+
+# NOTE: the bounds of a key that is open on one side, so that comparisons need no special case
+FIRST_DAY = -(1 << 31)
+LAST_DAY = (1 << 31) - 1
+
+CALENDAR_ESCAPES = {
+    "@#DGREGORIAN@": "GREGORIAN",
+    "@#DJULIAN@": "JULIAN",
+    "@#DHEBREW@": "HEBREW",
+    "@#DFRENCH R@": "FRENCH R",
+}
+MONTHS = {
+    "GREGORIAN": ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"),
+    "JULIAN": ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"),
+    "HEBREW": ("TSH", "CSH", "KSL", "TVT", "SHV", "ADR", "ADS", "NSN", "IYR", "SVN", "TMZ", "AAV", "ELL"),
+    "FRENCH R": (
+        "VEND",
+        "BRUM",
+        "FRIM",
+        "NIVO",
+        "PLUV",
+        "VENT",
+        "GERM",
+        "FLOR",
+        "PRAI",
+        "MESS",
+        "THER",
+        "FRUC",
+        "COMP",
+    ),
+}
+# NOTE: the most days a month can have (in a leap year)
+MONTH_DAYS = {
+    "GREGORIAN": (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    "JULIAN": (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    "HEBREW": (30, 30, 30, 29, 30, 30, 29, 30, 29, 30, 29, 30, 29),
+    "FRENCH R": (30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 6),
+}
+# keyword, conjunction and whether a phrase follows of each form of DATE_VALUE
+DATE_VALUE_FORMS = {
+    (None, None, False),
+    ("ABT", None, False),
+    ("CAL", None, False),
+    ("EST", None, False),
+    ("BEF", None, False),
+    ("AFT", None, False),
+    ("BET", "AND", False),
+    ("FROM", None, False),
+    ("FROM", "TO", False),
+    ("TO", None, False),
+    ("INT", None, True),
+}
+# the names of the groups of the first and second date in DATE_VALUE_REGEX
+DATE_GROUPS = {no: tuple(f"{name}{no}" for name in ("escape", "day", "month", "year", "dual", "bc")) for no in (1, 2)}
+
+
+class DatePrecision(IntEnum):
+    """
+    what the (lower, upper) julian day numbers of a DateKey stand for.
+    """
+
+    DAY = 0
+    MONTH = 1
+    YEAR = 2
+    ABOUT = 3
+    BETWEEN = 4
+    BEFORE = 5
+    AFTER = 6
+    UNKNOWN = 7
+
+
+def date_pattern(no: int) -> str:
+    return (
+        rf"(?:(?P<escape{no}>@#D[A-Z ]+@)\s+)?"
+        rf"(?:(?:(?P<day{no}>\d{{1,2}})\s+)?(?P<month{no}>[A-Z]{{3,4}})\s+)?"
+        rf"(?P<year{no}>\d{{1,4}})(?:/(?P<dual{no}>\d{{2}}))?"
+        rf"(?P<bc{no}>\s*(?:B\.C\.|BCE|BC))?"
+    )
+
+
+DATE_VALUE_REGEX = re.compile(
+    r"^\s*(?:\((?P<only_phrase>.*)\)|"
+    r"(?:(?P<keyword>ABT|CAL|EST|BEF|AFT|BET|FROM|TO|INT)\s+)?"
+    rf"{date_pattern(1)}"
+    rf"(?:\s+(?P<conjunction>AND|TO)\s+{date_pattern(2)})?"
+    r"(?:\s*\((?P<phrase>.*)\))?)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+# NOTE: what the converters write, e.g. 1850-03-02, 1850-03 or 1850 (trailing .xX- as in 1850-xx-xx are ignored)
+ISO_DATE_REGEX = re.compile(r"^(?P<year>\d{4})(?:-(?P<month>\d{1,2})(?:-(?P<day>\d{1,2}))?)?$")
+
+
+def iso_date(text: str) -> Optional[Date]:
+    if not (match := ISO_DATE_REGEX.match(text.strip().rstrip(".xX-"))):
+        return None
+    year, month, day = (None if value is None else int(value) for value in match.group("year", "month", "day"))
+    try:
+        datetime.date(year, month or 1, day or 1)
+    except ValueError:
+        return None
+    return Date("GREGORIAN", year, month, day, None, False)
+
+
+def match_date(match: re.Match, no: int) -> Optional[Date]:
+    escape, day, month, year, dual, bc = match.group(*DATE_GROUPS[no])
+    calendar = "GREGORIAN" if escape is None else CALENDAR_ESCAPES.get(escape.upper())
+    if calendar is None:
+        return None
+    if month is not None:
+        months = MONTHS[calendar]
+        if (month := month.upper()) not in months:
+            return None
+        month = months.index(month) + 1
+        if day is not None and not 1 <= int(day) <= MONTH_DAYS[calendar][month - 1]:
+            return None
+    year = int(year)
+    if dual is not None and (calendar != "GREGORIAN" or (year + 1) % 100 != int(dual)):
+        return None
+    if bc is not None and calendar not in ("GREGORIAN", "JULIAN"):
+        return None
+    if year == 0:
+        return None
+    day = None if day is None else int(day)
+    dual = None if dual is None else int(dual)
+    return Date(calendar, year, month, day, dual, bc is not None)
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date_value(text: str) -> Optional[DateValue]:
+    """
+    text as a DATE_VALUE (None if it is not one), cached by text.
+    besides the GEDCOM grammar (any case and spacing) a date as the converters write it, e.g. 1850-03-02, is a date.
+    """
+    if (date := iso_date(text)) is not None:
+        return DateValue(None, (date,), None, None)
+    if not (match := DATE_VALUE_REGEX.match(text)):
+        return None
+    if (phrase := match.group("only_phrase")) is not None:
+        return DateValue(None, tuple(), None, phrase)
+    keyword, conjunction, phrase = match.group("keyword", "conjunction", "phrase")
+    keyword = None if keyword is None else keyword.upper()
+    conjunction = None if conjunction is None else conjunction.upper()
+    if (keyword, conjunction, phrase is not None) not in DATE_VALUE_FORMS:
+        return None
+    dates = tuple(match_date(match, no) for no in ((1, 2) if conjunction else (1,)))
+    if None in dates:
+        return None
+    return DateValue(keyword, dates, conjunction, phrase)
+
+
+def parse_date(text: str) -> Optional[Date]:
+    """
+    text as a single date (None if it is not one, or a period, range, approximation or phrase).
+    """
+    value = parse_date_value(text)
+    if value is None or value.keyword is not None or len(value.dates) != 1:
+        return None
+    return value.dates[0]
+
+
+def format_date(date: Date) -> str:
+    parts = list()
+    if date.calendar != "GREGORIAN":
+        parts.append(f"@#D{date.calendar}@")
+    if date.day is not None:
+        parts.append(str(date.day))
+    if date.month is not None:
+        parts.append(MONTHS[date.calendar][date.month - 1])
+    parts.append(str(date.year) if date.dual is None else f"{date.year}/{date.dual:02d}")
+    if date.bc:
+        parts.append("B.C.")
+    return " ".join(parts)
+
+
+def format_date_value(value: DateValue) -> str:
+    parts = list()
+    if value.keyword is not None:
+        parts.append(value.keyword)
+    if value.dates:
+        parts.append(format_date(value.dates[0]))
+    if value.conjunction is not None:
+        parts.append(value.conjunction)
+        parts.append(format_date(value.dates[1]))
+    if value.phrase is not None:
+        parts.append(f"({value.phrase})")
+    return " ".join(parts)
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def gedcom_date_value(text: str) -> str:
+    """
+    text as a DATE_VALUE line value, cached by text: normalized if it is a date value, else a (text) phrase.
+    """
+    if (value := parse_date_value(text)) is not None:
+        return format_date_value(value)
+    logger.warning(f"<not-a-date-value:{text}>")
+    return f"({text})"
+
+
+def gregorian_day(year: int, month: int, day: int) -> int:
+    """
+    the julian day number of a (proleptic) gregorian date, with astronomical years (1 B.C. is 0).
+    """
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+
+
+def julian_calendar_day(year: int, month: int, day: int) -> int:
+    """
+    the julian day number of a julian calendar date, with astronomical years (1 B.C. is 0).
+    """
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return day + (153 * m + 2) // 5 + 365 * y + y // 4 - 32083
+
+
+def hebrew_leap_year(year: int) -> bool:
+    return (7 * year + 1) % 19 < 7
+
+
+@functools.lru_cache(maxsize=1024)
+def hebrew_new_year(year: int) -> int:
+    """
+    the julian day number of 1 TSH of year (Calendrical Calculations: the molad of Tishri and its postponements).
+    """
+
+    def elapsed(year):
+        months = (235 * year - 234) // 19
+        days = 29 * months + (12084 + 13753 * months) // 25920
+        return days + 1 if (3 * (days + 1)) % 7 < 3 else days
+
+    before, this, after = elapsed(year - 1), elapsed(year), elapsed(year + 1)
+    delay = 2 if after - this == 356 else 1 if this - before == 382 else 0
+    return 347998 + this + delay
+
+
+def hebrew_month_days(year: int) -> Tuple[int, ...]:
+    """
+    the days of the months TSH ... ELL of year (ADS has none in a common year).
+    """
+    days = hebrew_new_year(year + 1) - hebrew_new_year(year)
+    leap = hebrew_leap_year(year)
+    heshvan = 30 if days % 10 == 5 else 29
+    kislev = 29 if days % 10 == 3 else 30
+    return (30, heshvan, kislev, 29, 30, 30 if leap else 29, 29 if leap else 0, 30, 29, 30, 29, 30, 29)
+
+
+def french_leap_year(year: int) -> bool:
+    # NOTE: the years 3, 7 and 11 were observed as sextile (leap) years, later years are by the rule of Romme
+    if year < 15:
+        return year in (3, 7, 11)
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+@functools.lru_cache(maxsize=1024)
+def french_new_year(year: int) -> int:
+    """
+    the julian day number of 1 VEND of year (1 VEND I is 22 SEP 1792).
+    """
+    return 2375840 + sum(366 if french_leap_year(no) else 365 for no in range(1, year))
+
+
+def calendar_day(calendar: str, year: int, month: int, day: int) -> int:
+    """
+    the julian day number of day of month (counted from 1, in the order of MONTHS) of year in calendar.
+    """
+    if calendar == "GREGORIAN":
+        return gregorian_day(year, month, day)
+    if calendar == "JULIAN":
+        return julian_calendar_day(year, month, day)
+    if calendar == "HEBREW":
+        return hebrew_new_year(year) + sum(hebrew_month_days(year)[0 : month - 1]) + day - 1
+    if calendar == "FRENCH R":
+        return french_new_year(year) + 30 * (month - 1) + day - 1
+    raise ValueError(f"unknown calendar {calendar}")
+
+
+def date_bounds(date: Date) -> Tuple[int, int]:
+    """
+    the julian day numbers of the first and last day date can be.
+    NOTE: a dual year (1699/00) is the later year, as in the gregorian calendar.
+    """
+    year = date.year + 1 if date.dual is not None else date.year
+    if date.bc:
+        year = 1 - year
+    months = len(MONTHS[date.calendar])
+    if date.month is None:
+        first = calendar_day(date.calendar, year, 1, 1)
+        return first, calendar_day(date.calendar, year + 1, 1, 1) - 1
+    first = calendar_day(date.calendar, year, date.month, date.day or 1)
+    if date.day is not None:
+        return first, first
+    if date.month < months:
+        return first, calendar_day(date.calendar, year, date.month + 1, 1) - 1
+    return first, calendar_day(date.calendar, year + 1, 1, 1) - 1
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def date_key(text: str) -> DateKey:
+    """
+    text (a DATE_VALUE) as the julian day numbers of the first and last day it can be and what they stand for,
+    cached by text. a reversed range is taken the right way round, an open side is FIRST_DAY or LAST_DAY,
+    a phrase (or no date value) is (LAST_DAY, FIRST_DAY), so that it overlaps no range and is sorted last.
+    """
+    value = parse_date_value(text)
+    if value is None or not value.dates:
+        return DateKey(LAST_DAY, FIRST_DAY, DatePrecision.UNKNOWN)
+    first, last = date_bounds(value.dates[0])
+    if value.conjunction is not None:
+        # NOTE: BET 1860 AND 1840 is BET 1840 AND 1860, or select could never return it
+        second_first, second_last = date_bounds(value.dates[1])
+        return DateKey(min(first, second_first), max(last, second_last), DatePrecision.BETWEEN)
+    if value.keyword in ("ABT", "CAL", "EST"):
+        return DateKey(first, last, DatePrecision.ABOUT)
+    if value.keyword == "BEF":
+        return DateKey(FIRST_DAY, first - 1, DatePrecision.BEFORE)
+    if value.keyword == "TO":
+        return DateKey(FIRST_DAY, last, DatePrecision.BEFORE)
+    if value.keyword == "AFT":
+        return DateKey(last + 1, LAST_DAY, DatePrecision.AFTER)
+    if value.keyword == "FROM":
+        return DateKey(first, LAST_DAY, DatePrecision.AFTER)
+    if value.dates[0].month is None:
+        return DateKey(first, last, DatePrecision.YEAR)
+    if value.dates[0].day is None:
+        return DateKey(first, last, DatePrecision.MONTH)
+    return DateKey(first, last, DatePrecision.DAY)
+
+
+def date_keys(texts: Iterable[str]):
+    """
+    the lower and upper julian day numbers (int32) and precisions (int8) of texts, as numpy arrays
+    (array.array without numpy). every distinct text is converted once, the rest is filled by indexing.
+    """
+    distinct = dict()
+    codes = [distinct.setdefault(text, len(distinct)) for text in texts]
+    keys = [date_key(text) for text in distinct]
+    if numpy is None:
+        return (
+            array.array("i", (keys[code].lower for code in codes)),
+            array.array("i", (keys[code].upper for code in codes)),
+            array.array("b", (keys[code].precision for code in codes)),
+        )
+    codes = numpy.asarray(codes, dtype=numpy.intp)
+    lower, upper, precision = tuple(zip(*keys)) or ((), (), ())
+    return (
+        numpy.array(lower, dtype=numpy.int32)[codes],
+        numpy.array(upper, dtype=numpy.int32)[codes],
+        numpy.array(precision, dtype=numpy.int8)[codes],
+    )
+
+
+def iter_dates(nodes: Iterable) -> Iterator[Tuple[Optional[str], str, str]]:
+    """
+    yields the xref id of the record, the tag of the line above and the value of every DATE line in nodes
+    (trees of lines as reader.iter_nodes yields them).
+    """
+    for record in nodes:
+        stack = [record]
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                if child.tag == "DATE" and child.line_value:
+                    yield record.xref_id, node.tag, child.line_value
+                if child.children:
+                    stack.append(child)
+
+
+def date_index(nodes: Iterable) -> DateIndex:
+    """
+    the dates of a whole record set, sorted by their lower bound (so a range is found by bisection, see select).
+    the columns are numpy arrays (array.array without numpy).
+    """
+    dates = list(iter_dates(nodes))
+    lower, upper, precision = date_keys(text for _, _, text in dates)
+    if numpy is None:
+        order = sorted(range(len(dates)), key=lower.__getitem__)
+        xref_ids = [dates[no][0] for no in order]
+        tags = [dates[no][1] for no in order]
+        return DateIndex(
+            xref_ids,
+            tags,
+            array.array("i", (lower[no] for no in order)),
+            array.array("i", (upper[no] for no in order)),
+            array.array("b", (precision[no] for no in order)),
+        )
+    order = numpy.argsort(lower, kind="stable")
+    xref_ids = [dates[no][0] for no in order.tolist()]
+    tags = [dates[no][1] for no in order.tolist()]
+    return DateIndex(xref_ids, tags, lower[order], upper[order], precision[order])
+
+
+def select(index: DateIndex, lower: int, upper: int):
+    """
+    the positions in index of the dates that can be within lower ... upper (julian day numbers, both included).
+    """
+    if numpy is None or isinstance(index.lower, array.array):
+        end = bisect.bisect_right(index.lower, upper)
+        return [no for no in range(end) if index.upper[no] >= lower]
+    end = numpy.searchsorted(index.lower, upper, side="right")
+    return numpy.flatnonzero(index.upper[0:end] >= lower)
+
+
+__all__ = [
+    "DATE_CACHE_SIZE",
+    "FIRST_DAY",
+    "LAST_DAY",
+    "Date",
+    "DateIndex",
+    "DateKey",
+    "DatePrecision",
+    "DateValue",
+    "date_bounds",
+    "date_index",
+    "date_key",
+    "date_keys",
+    "format_date",
+    "format_date_value",
+    "gedcom_date_value",
+    "parse_date",
+    "parse_date_value",
+    "select",
+]
@@ -0,0 +1,146 @@
+import argparse
+import logging
+import pathlib
+import sys
+from collections import namedtuple
+from typing import Dict, Iterator, Optional, Tuple
+
+from ..common import FieldKind, compile_plan
+from ..configure import configure
+from . import primitives
+from .lineage_linked_gedcom_file import LINEAGE_LINKED_GEDCOM_FILE
+from .reader import HEADER_EXTENSION, Step, reflect_routes, resolve
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+TABLE = pathlib.Path(__file__).with_name("grammar_table.py")
+RULE_FIELDS = ("qualname", "steps", "cardinality", "primitive", "level_delta", "kind")
+Rule = namedtuple("Rule", RULE_FIELDS)
+# the classes lines are read into without a line above them: the file (level 0) and the header extension (below HEAD)
+ROOTS = (LINEAGE_LINKED_GEDCOM_FILE, HEADER_EXTENSION)
+
+HEADER = f'''# generated by python -m gedcomish.gedcom555ish.grammar from the classes in lineage_linked_gedcom_file.py
+# do not edit: regenerate after changing them (--check tells whether this file is current).
+#
+# GRAMMAR[context][tag] are the rules (in emission order) for a line tagged tag directly below a line of context
+# (the qualname of the class emitting it, or of a root:
+# {", ".join(root.__qualname__ for root in ROOTS)}).
+# fmt: off
+from collections import namedtuple
+
+Rule = namedtuple("Rule", {RULE_FIELDS!r})
+
+'''
+
+
+def primitive_of(cls: type) -> Optional[str]:
+    """
+    the name of the primitive (see primitives.py) the line value of cls is, None for lines without one.
+    """
+    return next((base.__name__ for base in cls.__mro__[1:] if base.__module__ == primitives.__name__), None)
+
+
+def level_delta(context: type, route: Tuple[Step, ...]) -> int:
+    """
+    the level the line route leads to is written at (see Substructure.walk), relative to the line of context.
+    NOTE: a root emits no line, so it is relative to the level the root is written at.
+    """
+    delta = (compile_plan(context).delta_level or 0) if FieldKind.of(context) is FieldKind.SUBSTRUCTURE else 0
+    owner = context
+    for step in route:
+        level_offset = 0 if step.cls.__qualname__.startswith(owner.__qualname__) else 1
+        delta += level_offset + (compile_plan(step.cls).delta_level or 0)
+        owner = step.cls
+    return delta
+
+
+def compile_rule(context: type, route: Tuple[Step, ...]) -> Rule:
+    """
+    NOTE: the schema classes do not say which lines are required, so the least number of lines is always 0.
+    """
+    cls = route[-1].cls
+    return Rule(
+        qualname=cls.__qualname__,
+        steps=tuple((step.name, step.iterable, step.cls.__qualname__) for step in route),
+        cardinality=(0, None if any(step.iterable for step in route) else 1),
+        primitive=primitive_of(cls),
+        level_delta=level_delta(context, route),
+        kind=FieldKind.of(cls).name,
+    )
+
+
+def iter_contexts() -> Iterator[type]:
+    """
+    yields the roots and every class emitting a line that may be read below them, once each.
+    """
+    seen = set()
+    pending = list(ROOTS)
+    while pending:
+        if (context := pending.pop()) in seen:
+            continue
+        seen.add(context)
+        yield context
+        pending.extend(route[-1].cls for tag_routes in reflect_routes(context).values() for route in tag_routes)
+
+
+def compile_grammar() -> Dict[str, Dict[str, Tuple[Rule, ...]]]:
+    """
+    the rules of every context (see iter_contexts), found by reflecting over the schema classes.
+    """
+    grammar = dict()
+    for context in iter_contexts():
+        if context.__qualname__ in grammar or resolve(context.__qualname__) is not context:
+            raise ValueError(f"<ambiguous-context:{context.__module__}.{context.__qualname__}>")
+        grammar[context.__qualname__] = {
+            tag: tuple(compile_rule(context, route) for route in tag_routes)
+            for tag, tag_routes in reflect_routes(context).items()
+        }
+    return {context: grammar[context] for context in sorted(grammar)}
+
+
+def render(grammar: Dict[str, Dict[str, Tuple[Rule, ...]]]) -> str:
+    lines = [HEADER, "GRAMMAR = {\n"]
+    for context, rules in grammar.items():
+        lines.append(f"    {context!r}: {{\n")
+        for tag, tag_rules in rules.items():
+            lines.append(f"        {tag!r}: (\n")
+            lines.extend(f"            {rule!r},\n" for rule in tag_rules)
+            lines.append("        ),\n")
+        lines.append("    },\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def is_current(path: pathlib.Path = TABLE) -> bool:
+    """
+    whether path holds the grammar the schema classes compile to.
+    """
+    return path.exists() and path.read_text(encoding="utf-8") == render(compile_grammar())
+
+
+__all__ = [
+    "ROOTS",
+    "Rule",
+    "compile_grammar",
+    "is_current",
+    "level_delta",
+    "render",
+]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the schema classes into the tag grammar table.")
+    parser.add_argument(
+        "--check", action="store_true", help="only tell whether the table is current (exit code 1 if not)"
+    )
+    parser.add_argument("--output", type=pathlib.Path, default=TABLE, help=f"path of the table (default: {TABLE})")
+    pargs = parser.parse_args()
+    if pargs.check:
+        if not is_current(pargs.output):
+            logger.error(f"<grammar-outdated:{pargs.output}>")
+            sys.exit(1)
+        logger.info(f"<grammar-current:{pargs.output}>")
+    else:
+        pargs.output.write_text(render(compile_grammar()), encoding="utf-8")
+        logger.info(f"<grammar-written:{pargs.output}>")
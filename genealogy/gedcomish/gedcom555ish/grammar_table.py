@@ -0,0 +1,3259 @@
+# generated by python -m gedcomish.gedcom555ish.grammar from the classes in lineage_linked_gedcom_file.py
+# do not edit: regenerate after changing them (--check tells whether this file is current).
+#
+# GRAMMAR[context][tag] are the rules (in emission order) for a line tagged tag directly below a line of context
+# (the qualname of the class emitting it, or of a root:
+# LINEAGE_LINKED_GEDCOM_FILE, GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION).
+# fmt: off
+from collections import namedtuple
+
+Rule = namedtuple("Rule", ('qualname', 'steps', 'cardinality', 'primitive', 'level_delta', 'kind'))
+
+GRAMMAR = {
+    'ADDRESS_STRUCTURE.ADDR': {
+        'ADR1': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.ADR1', steps=(('ADR1', False, 'ADDRESS_STRUCTURE.ADDR.ADR1'),), cardinality=(0, 1), primitive='ADDRESS_LINE1', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADR2': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.ADR2', steps=(('ADR2', False, 'ADDRESS_STRUCTURE.ADDR.ADR2'),), cardinality=(0, 1), primitive='ADDRESS_LINE2', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADR3': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.ADR3', steps=(('ADR3', False, 'ADDRESS_STRUCTURE.ADDR.ADR3'),), cardinality=(0, 1), primitive='ADDRESS_LINE3', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CITY': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.CITY', steps=(('CITY', False, 'ADDRESS_STRUCTURE.ADDR.CITY'),), cardinality=(0, 1), primitive='ADDRESS_CITY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CTRY': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.CTRY', steps=(('CTRY', False, 'ADDRESS_STRUCTURE.ADDR.CTRY'),), cardinality=(0, 1), primitive='ADDRESS_COUNTRY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'POST': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.POST', steps=(('POST', False, 'ADDRESS_STRUCTURE.ADDR.POST'),), cardinality=(0, 1), primitive='ADDRESS_POSTAL_CODE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'STAE': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR.STAE', steps=(('STAE', False, 'ADDRESS_STRUCTURE.ADDR.STAE'),), cardinality=(0, 1), primitive='ADDRESS_STATE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'ADDRESS_STRUCTURE.ADDR.ADR1': {
+    },
+    'ADDRESS_STRUCTURE.ADDR.ADR2': {
+    },
+    'ADDRESS_STRUCTURE.ADDR.ADR3': {
+    },
+    'ADDRESS_STRUCTURE.ADDR.CITY': {
+    },
+    'ADDRESS_STRUCTURE.ADDR.CTRY': {
+    },
+    'ADDRESS_STRUCTURE.ADDR.POST': {
+    },
+    'ADDRESS_STRUCTURE.ADDR.STAE': {
+    },
+    'ADDRESS_STRUCTURE.EMAIL': {
+    },
+    'ADDRESS_STRUCTURE.FAX': {
+    },
+    'ADDRESS_STRUCTURE.PHON': {
+    },
+    'ADDRESS_STRUCTURE.WWW': {
+    },
+    'ASSOCIATION_STRUCTURE.ASSO': {
+        'RELA': (
+            Rule(qualname='ASSOCIATION_STRUCTURE.ASSO.RELA', steps=(('RELA', False, 'ASSOCIATION_STRUCTURE.ASSO.RELA'),), cardinality=(0, 1), primitive='RELATION_IS_DESCRIPTOR', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=0, kind='XREF'),
+        ),
+    },
+    'ASSOCIATION_STRUCTURE.ASSO.RELA': {
+    },
+    'CHANGE_DATE.CHAN': {
+        'DATE': (
+            Rule(qualname='CHANGE_DATE.CHAN.DATE', steps=(('DATE', False, 'CHANGE_DATE.CHAN.DATE'),), cardinality=(0, 1), primitive='DATE_EXACT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+    },
+    'CHANGE_DATE.CHAN.DATE': {
+        'TIME': (
+            Rule(qualname='CHANGE_DATE.CHAN.DATE.TIME', steps=(('TIME', False, 'CHANGE_DATE.CHAN.DATE.TIME'),), cardinality=(0, 1), primitive='TIME_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'CHANGE_DATE.CHAN.DATE.TIME': {
+    },
+    'CHIL': {
+    },
+    'CHILD_TO_FAMILY_LINK.FAMC': {
+        'PEDI': (
+            Rule(qualname='CHILD_TO_FAMILY_LINK.FAMC.PEDI', steps=(('PEDI', False, 'CHILD_TO_FAMILY_LINK.FAMC.PEDI'),), cardinality=(0, 1), primitive='PEDIGREE_LINKAGE_TYPE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+    },
+    'CHILD_TO_FAMILY_LINK.FAMC.PEDI': {
+    },
+    'EVENT_DETAIL.AGNC': {
+    },
+    'EVENT_DETAIL.CAUS': {
+    },
+    'EVENT_DETAIL.DATE': {
+    },
+    'EVENT_DETAIL.RELI': {
+    },
+    'EVENT_DETAIL.TYPE': {
+    },
+    'EVENs.EVEN': {
+        'DATE': (
+            Rule(qualname='EVENs.EVEN.DATE', steps=(('DATE', False, 'EVENs.EVEN.DATE'),), cardinality=(0, 1), primitive='DATE_PERIOD', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'PLAC': (
+            Rule(qualname='EVENs.EVEN.PLAC', steps=(('PLAC', False, 'EVENs.EVEN.PLAC'),), cardinality=(0, 1), primitive='SOURCE_JURISDICTION_PLACE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'EVENs.EVEN.DATE': {
+    },
+    'EVENs.EVEN.PLAC': {
+    },
+    'FAMILY_EVENT_DETAIL.HUSB': {
+        'AGE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB.AGE', steps=(('AGE', False, 'FAMILY_EVENT_DETAIL.HUSB.AGE'),), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'FAMILY_EVENT_DETAIL.HUSB.AGE': {
+    },
+    'FAMILY_EVENT_DETAIL.WIFE': {
+        'AGE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE.AGE', steps=(('AGE', False, 'FAMILY_EVENT_DETAIL.WIFE.AGE'),), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'FAMILY_EVENT_DETAIL.WIFE.AGE': {
+    },
+    'FAMILY_EVENT_STRUCTUREs.ANUL': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.CENS': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.DIV': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.DIVF': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.ENGA': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.EVEN': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.MARB': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.MARC': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.MARL': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.MARR': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.MARS': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'FAMILY_EVENT_STRUCTUREs.RESI': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'HUSB': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.HUSB', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('HUSB', False, 'FAMILY_EVENT_DETAIL.HUSB')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WIFE': (
+            Rule(qualname='FAMILY_EVENT_DETAIL.WIFE', steps=(('FAMILY_EVENT_DETAIL', False, 'FAMILY_EVENT_DETAIL'), ('WIFE', False, 'FAMILY_EVENT_DETAIL.WIFE')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION': {
+        'COPR': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.COPR', steps=(('COPR', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.COPR'),), cardinality=(0, 1), primitive='COPYRIGHT_GEDCOM_FILE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE', steps=(('DATE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE'),), cardinality=(0, 1), primitive='FILE_CREATION_DATE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DEST': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DEST', steps=(('DEST', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DEST'),), cardinality=(0, 1), primitive='RECEIVING_SYSTEM_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FILE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.FILE', steps=(('FILE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.FILE'),), cardinality=(0, 1), primitive='GEDCOM_FILE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'LANG': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.LANG', steps=(('LANG', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.LANG'),), cardinality=(0, 1), primitive='LANGUAGE_OF_TEXT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.NOTE', steps=(('NOTE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.NOTE'),), cardinality=(0, 1), primitive='GEDCOM_CONTENT_DESCRIPTION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR', steps=(('SOUR', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR'),), cardinality=(0, 1), primitive='SYSTEM_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SUBM': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SUBM', steps=(('SUBM', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SUBM'),), cardinality=(0, 1), primitive='XREF_SUBM', level_delta=1, kind='XREF'),
+        ),
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.COPR': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE': {
+        'TIME': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE.TIME', steps=(('TIME', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE.TIME'),), cardinality=(0, 1), primitive='TIME_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE.TIME': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DEST': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.FILE': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.LANG': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.NOTE': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR': {
+        'CORP': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.CORP', steps=(('CORP', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.CORP'),), cardinality=(0, 1), primitive='NAME_OF_BUSINESS', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATA': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA', steps=(('DATA', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA'),), cardinality=(0, 1), primitive='NAME_OF_SOURCE_DATA', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NAME': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.NAME', steps=(('NAME', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.NAME'),), cardinality=(0, 1), primitive='NAME_OF_PRODUCT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'VERS': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.VERS', steps=(('VERS', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.VERS'),), cardinality=(0, 1), primitive='PRODUCT_VERSION_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.CORP': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA': {
+        'COPR': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA.COPR', steps=(('COPR', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA.COPR'),), cardinality=(0, 1), primitive='COPYRIGHT_SOURCE_DATA', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA.DATE', steps=(('DATE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA.DATE'),), cardinality=(0, 1), primitive='PUBLICATION_DATE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA.COPR': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA.DATE': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.NAME': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.VERS': {
+    },
+    'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SUBM': {
+    },
+    'GEDCOM_HEADER.HEAD': {
+        'GEDC': (
+            Rule(qualname='GEDCOM_HEADER.HEAD.GEDC', steps=(('GEDC', False, 'GEDCOM_HEADER.HEAD.GEDC'),), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CHAR': (
+            Rule(qualname='GEDCOM_HEADER.HEAD.CHAR', steps=(('CHAR', False, 'GEDCOM_HEADER.HEAD.CHAR'),), cardinality=(0, 1), primitive='CHARACTER_ENCODING', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_HEADER.HEAD.CHAR': {
+    },
+    'GEDCOM_HEADER.HEAD.GEDC': {
+        'VERS': (
+            Rule(qualname='GEDCOM_HEADER.HEAD.GEDC.VERS', steps=(('VERS', False, 'GEDCOM_HEADER.HEAD.GEDC.VERS'),), cardinality=(0, 1), primitive='GEDCOM_VERSION_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FORM': (
+            Rule(qualname='GEDCOM_HEADER.HEAD.GEDC.FORM', steps=(('FORM', False, 'GEDCOM_HEADER.HEAD.GEDC.FORM'),), cardinality=(0, 1), primitive='GEDCOM_FORM', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_HEADER.HEAD.GEDC.FORM': {
+        'VERS': (
+            Rule(qualname='GEDCOM_HEADER.HEAD.GEDC.FORM.VERS', steps=(('VERS', False, 'GEDCOM_HEADER.HEAD.GEDC.FORM.VERS'),), cardinality=(0, 1), primitive='GEDCOM_VERSION_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'GEDCOM_HEADER.HEAD.GEDC.FORM.VERS': {
+    },
+    'GEDCOM_HEADER.HEAD.GEDC.VERS': {
+    },
+    'GEDCOM_TRAILER.TRLR': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.CAST': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.CAST.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.CAST.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.CAST.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.DSCR': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.DSCR.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.DSCR.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.DSCR.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.EDUC': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.EDUC.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.EDUC.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.EDUC.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.IDNO': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.IDNO.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.IDNO.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.IDNO.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NATI': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NATI.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NATI.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NATI.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NCHI': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NCHI.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NCHI.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NCHI.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NMR': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NMR.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NMR.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NMR.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.OCCU': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.OCCU.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.OCCU.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.OCCU.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.PROP': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.PROP.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.PROP.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.PROP.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RELI': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RELI.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RELI.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RELI.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RESI': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RESI.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RESI.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RESI.TYPE': {
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.TITL': {
+        'TYPE': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.TITL.TYPE', steps=(('TYPE', False, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.TITL.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.TITL.TYPE': {
+    },
+    'INDIVIDUAL_EVENT_DETAIL.AGE': {
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.ADOP': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAMC': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.ADOP.FAMC', steps=(('FAMC', False, 'INDIVIDUAL_EVENT_STRUCTUREs.ADOP.FAMC'),), cardinality=(0, 1), primitive='XREF_FAM', level_delta=1, kind='XREF'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.ADOP.FAMC': {
+        'ADOP': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.ADOP.FAMC.ADOP', steps=(('ADOP', False, 'INDIVIDUAL_EVENT_STRUCTUREs.ADOP.FAMC.ADOP'),), cardinality=(0, 1), primitive='ADOPTED_BY_WHICH_PARENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.ADOP.FAMC.ADOP': {
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.BAPM': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.BARM': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.BASM': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.BIRT': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAMC': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.BIRT.FAMC', steps=(('FAMC', False, 'INDIVIDUAL_EVENT_STRUCTUREs.BIRT.FAMC'),), cardinality=(0, 1), primitive='XREF_FAM', level_delta=1, kind='XREF'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.BIRT.FAMC': {
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.BURI': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.CENS': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.CHR': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAMC': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.CHR.FAMC', steps=(('FAMC', False, 'INDIVIDUAL_EVENT_STRUCTUREs.CHR.FAMC'),), cardinality=(0, 1), primitive='XREF_FAM', level_delta=1, kind='XREF'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.CHR.FAMC': {
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.CHRA': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.CONF': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.CREM': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.DEAT': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.EMIG': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.EVEN': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.FCOM': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.GRAD': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.IMMI': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.NATU': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.PROB': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.RETI': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'INDIVIDUAL_EVENT_STRUCTUREs.WILL': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=2, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=2, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='EVENT_DETAIL.AGNC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('AGNC', False, 'EVENT_DETAIL.AGNC')), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CAUS': (
+            Rule(qualname='EVENT_DETAIL.CAUS', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('CAUS', False, 'EVENT_DETAIL.CAUS')), cardinality=(0, 1), primitive='CAUSE_OF_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='EVENT_DETAIL.DATE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('DATE', False, 'EVENT_DETAIL.DATE')), cardinality=(0, 1), primitive='DATE_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='EVENT_DETAIL.RELI', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('RELI', False, 'EVENT_DETAIL.RELI')), cardinality=(0, 1), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='EVENT_DETAIL.TYPE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('TYPE', False, 'EVENT_DETAIL.TYPE')), cardinality=(0, 1), primitive='EVENT_OR_FACT_CLASSIFICATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=2, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'PLAC': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('PLACE_STRUCTURE', False, 'PLACE_STRUCTURE'), ('PLAC', False, 'PLACE_STRUCTURE.PLAC')), cardinality=(0, 1), primitive='PLACE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('EVENT_DETAIL', False, 'EVENT_DETAIL'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'AGE': (
+            Rule(qualname='INDIVIDUAL_EVENT_DETAIL.AGE', steps=(('INDIVIDUAL_EVENT_DETAIL', False, 'INDIVIDUAL_EVENT_DETAIL'), ('AGE', False, 'INDIVIDUAL_EVENT_DETAIL.AGE')), cardinality=(0, 1), primitive='AGE_AT_EVENT', level_delta=2, kind='PRIMITIVE'),
+        ),
+    },
+    'LINEAGE_LINKED_GEDCOM_FILE': {
+        'HEAD': (
+            Rule(qualname='GEDCOM_HEADER.HEAD', steps=(('GEDCOM_HEADER', False, 'GEDCOM_HEADER'), ('HEAD', False, 'GEDCOM_HEADER.HEAD')), cardinality=(0, 1), primitive=None, level_delta=0, kind='TAG'),
+        ),
+        'COPR': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.COPR', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('COPR', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.COPR')), cardinality=(0, 1), primitive='COPYRIGHT_GEDCOM_FILE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('DATE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE')), cardinality=(0, 1), primitive='FILE_CREATION_DATE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DEST': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DEST', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('DEST', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DEST')), cardinality=(0, 1), primitive='RECEIVING_SYSTEM_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FILE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.FILE', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('FILE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.FILE')), cardinality=(0, 1), primitive='GEDCOM_FILE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'LANG': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.LANG', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('LANG', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.LANG')), cardinality=(0, 1), primitive='LANGUAGE_OF_TEXT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.NOTE', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('NOTE', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.NOTE')), cardinality=(0, 1), primitive='GEDCOM_CONTENT_DESCRIPTION', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='LINEAGE_LINKED_RECORDs.NOTE_RECORD.NOTE', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('LINEAGE_LINKED_RECORDs', True, 'LINEAGE_LINKED_RECORDs.NOTE_RECORD'), ('NOTE', False, 'LINEAGE_LINKED_RECORDs.NOTE_RECORD.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=0, kind='POINTER'),
+        ),
+        'SOUR': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('SOUR', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR')), cardinality=(0, 1), primitive='SYSTEM_ID', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('LINEAGE_LINKED_RECORDs', True, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD'), ('SOUR', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=0, kind='POINTER'),
+        ),
+        'SUBM': (
+            Rule(qualname='GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SUBM', steps=(('GEDCOM_FORM_HEADER_EXTENSION', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION'), ('SUBM', False, 'GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SUBM')), cardinality=(0, 1), primitive='XREF_SUBM', level_delta=1, kind='XREF'),
+            Rule(qualname='SUBMITTER_RECORD.SUBM', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('SUBMITTER_RECORD', False, 'SUBMITTER_RECORD'), ('SUBM', False, 'SUBMITTER_RECORD.SUBM')), cardinality=(0, 1), primitive='XREF_SUBM', level_delta=0, kind='POINTER'),
+        ),
+        'FAM': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('LINEAGE_LINKED_RECORDs', True, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD'), ('FAM', False, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM')), cardinality=(0, None), primitive='XREF_FAM', level_delta=0, kind='POINTER'),
+        ),
+        'INDI': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('LINEAGE_LINKED_RECORDs', True, 'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD'), ('INDI', False, 'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI')), cardinality=(0, None), primitive='XREF_INDI', level_delta=0, kind='POINTER'),
+        ),
+        'OBJE': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('LINEAGE_LINKED_RECORDs', True, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD'), ('OBJE', False, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=0, kind='POINTER'),
+        ),
+        'REPO': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO', steps=(('FORM_RECORDS', False, 'FORM_RECORDS'), ('LINEAGE_LINKED_RECORDs', True, 'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD'), ('REPO', False, 'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO')), cardinality=(0, None), primitive='XREF_REPO', level_delta=0, kind='POINTER'),
+        ),
+        'TRLR': (
+            Rule(qualname='GEDCOM_TRAILER.TRLR', steps=(('GEDCOM_TRAILER', False, 'GEDCOM_TRAILER'), ('TRLR', False, 'GEDCOM_TRAILER.TRLR')), cardinality=(0, 1), primitive=None, level_delta=0, kind='TAG'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM': {
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CHIL': (
+            Rule(qualname='CHIL', steps=(('CHILs', True, 'CHIL'),), cardinality=(0, None), primitive='XREF_INDI', level_delta=1, kind='XREF'),
+        ),
+        'ANUL': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.ANUL', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.ANUL'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CENS': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.CENS', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.CENS'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'DIV': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.DIV', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.DIV'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'DIVF': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.DIVF', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.DIVF'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'ENGA': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.ENGA', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.ENGA'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'MARB': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.MARB', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.MARB'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'MARC': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.MARC', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.MARC'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'MARR': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.MARR', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.MARR'),), cardinality=(0, None), primitive='Y', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'MARL': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.MARL', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.MARL'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'MARS': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.MARS', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.MARS'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'RESI': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.RESI', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.RESI'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EVEN': (
+            Rule(qualname='FAMILY_EVENT_STRUCTUREs.EVEN', steps=(('FAMILY_EVENT_STRUCTUREs', True, 'FAMILY_EVENT_STRUCTUREs.EVEN'),), cardinality=(0, None), primitive='EVENT_DESCRIPTOR', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'HUSB': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.HUSB', steps=(('HUSB', False, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.HUSB'),), cardinality=(0, 1), primitive='XREF_INDI', level_delta=1, kind='XREF'),
+        ),
+        'NCHI': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.NCHI', steps=(('NCHI', False, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.NCHI'),), cardinality=(0, 1), primitive='COUNT_OF_CHILDREN', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RIN': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.RIN', steps=(('RIN', False, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.TYPE', steps=(('TYPE', False, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'WIFE': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.WIFE', steps=(('WIFE', False, 'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.WIFE'),), cardinality=(0, 1), primitive='XREF_INDI', level_delta=1, kind='XREF'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=1, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'REFN': (
+            Rule(qualname='REFN', steps=(('REFNs', True, 'REFN'),), cardinality=(0, None), primitive='USER_REFERENCE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=0, kind='XREF'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.HUSB': {
+    },
+    'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.NCHI': {
+    },
+    'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.RIN': {
+    },
+    'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.TYPE': {
+    },
+    'LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.WIFE': {
+    },
+    'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI': {
+        'ASSO': (
+            Rule(qualname='ASSOCIATION_STRUCTURE.ASSO', steps=(('ASSOCIATION_STRUCTUREs', True, 'ASSOCIATION_STRUCTURE'), ('ASSO', False, 'ASSOCIATION_STRUCTURE.ASSO')), cardinality=(0, None), primitive='XREF_INDI', level_delta=1, kind='XREF'),
+        ),
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'FAMC': (
+            Rule(qualname='CHILD_TO_FAMILY_LINK.FAMC', steps=(('CHILD_TO_FAMILY_LINKs', True, 'CHILD_TO_FAMILY_LINK'), ('FAMC', False, 'CHILD_TO_FAMILY_LINK.FAMC')), cardinality=(0, None), primitive='XREF_FAM', level_delta=1, kind='XREF'),
+        ),
+        'CAST': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.CAST', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.CAST'),), cardinality=(0, None), primitive='CASTE_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DSCR': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.DSCR', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.DSCR'),), cardinality=(0, None), primitive='PHYSICAL_DESCRIPTION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'EDUC': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.EDUC', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.EDUC'),), cardinality=(0, None), primitive='SCHOLASTIC_ACHIEVEMENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'IDNO': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.IDNO', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.IDNO'),), cardinality=(0, None), primitive='ID_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NATI': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NATI', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NATI'),), cardinality=(0, None), primitive='NATIONAL_OR_TRIBAL_ORIGIN', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NCHI': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NCHI', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NCHI'),), cardinality=(0, None), primitive='COUNT_OF_CHILDREN', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NMR': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NMR', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.NMR'),), cardinality=(0, None), primitive='NUMBER_OF_RELATIONSHIPS', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OCCU': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.OCCU', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.OCCU'),), cardinality=(0, None), primitive='OCCUPATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'PROP': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.PROP', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.PROP'),), cardinality=(0, None), primitive='POSSESSIONS', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RELI': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RELI', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RELI'),), cardinality=(0, None), primitive='RELIGIOUS_AFFILIATION', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RESI': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RESI', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.RESI'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'TITL': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.TITL', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.TITL'),), cardinality=(0, None), primitive='NOBILITY_TYPE_TITLE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FACT': (
+            Rule(qualname='INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT', steps=(('INDIVIDUAL_ATTRIBUTE_STRUCTUREs', True, 'INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT'),), cardinality=(0, None), primitive='ATTRIBUTE_DESCRIPTOR', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'BIRT': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.BIRT', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.BIRT'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CHR': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.CHR', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.CHR'),), cardinality=(0, None), primitive='Y', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DEAT': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.DEAT', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.DEAT'),), cardinality=(0, None), primitive='Y', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'BURI': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.BURI', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.BURI'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CREM': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.CREM', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.CREM'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'ADOP': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.ADOP', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.ADOP'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'BAPM': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.BAPM', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.BAPM'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'BARM': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.BARM', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.BARM'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'BASM': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.BASM', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.BASM'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CHRA': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.CHRA', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.CHRA'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CONF': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.CONF', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.CONF'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'FCOM': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.FCOM', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.FCOM'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'NATU': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.NATU', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.NATU'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EMIG': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.EMIG', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.EMIG'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'IMMI': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.IMMI', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.IMMI'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'CENS': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.CENS', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.CENS'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'PROB': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.PROB', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.PROB'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'WILL': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.WILL', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.WILL'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'GRAD': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.GRAD', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.GRAD'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'RETI': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.RETI', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.RETI'),), cardinality=(0, None), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EVEN': (
+            Rule(qualname='INDIVIDUAL_EVENT_STRUCTUREs.EVEN', steps=(('INDIVIDUAL_EVENT_STRUCTUREs', True, 'INDIVIDUAL_EVENT_STRUCTUREs.EVEN'),), cardinality=(0, None), primitive='EVENT_DESCRIPTOR', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RIN': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.RIN', steps=(('RIN', False, 'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SEX': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.SEX', steps=(('SEX', False, 'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.SEX'),), cardinality=(0, 1), primitive='SEX_VALUE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=1, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'NAME': (
+            Rule(qualname='PERSONAL_NAME_STRUCTURE.NAME', steps=(('PERSONAL_NAME_STRUCTUREs', True, 'PERSONAL_NAME_STRUCTURE'), ('NAME', False, 'PERSONAL_NAME_STRUCTURE.NAME')), cardinality=(0, None), primitive='NAME_PERSONAL', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'REFN': (
+            Rule(qualname='REFN', steps=(('REFNs', True, 'REFN'),), cardinality=(0, None), primitive='USER_REFERENCE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=0, kind='XREF'),
+        ),
+        'FAMS': (
+            Rule(qualname='SPOUSE_TO_FAMILY_LINK.FAMS', steps=(('SPOUSE_TO_FAMILY_LINKs', True, 'SPOUSE_TO_FAMILY_LINK'), ('FAMS', False, 'SPOUSE_TO_FAMILY_LINK.FAMS')), cardinality=(0, None), primitive='XREF_FAM', level_delta=1, kind='XREF'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.RIN': {
+    },
+    'LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.SEX': {
+    },
+    'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE': {
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'FILE': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE', steps=(('FILE', False, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE'),), cardinality=(0, 1), primitive='MULTIMEDIA_FILE_REFERENCE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RIN': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.RIN', steps=(('RIN', False, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'REFN': (
+            Rule(qualname='REFN', steps=(('REFNs', True, 'REFN'),), cardinality=(0, None), primitive='USER_REFERENCE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=0, kind='XREF'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE': {
+        'FORM': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.FORM', steps=(('FORM', False, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.FORM'),), cardinality=(0, 1), primitive='MULTIMEDIA_FORMAT', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TITL': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.TITL', steps=(('TITL', False, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.TITL'),), cardinality=(0, 1), primitive='DESCRIPTIVE_TITLE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.FORM': {
+        'TYPE': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.FORM.TYPE', steps=(('TYPE', False, 'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.FORM.TYPE'),), cardinality=(0, 1), primitive='SOURCE_MEDIA_TYPE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.FORM.TYPE': {
+    },
+    'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.FILE.TITL': {
+    },
+    'LINEAGE_LINKED_RECORDs.MULTIMEDIA_RECORD.OBJE.RIN': {
+    },
+    'LINEAGE_LINKED_RECORDs.NOTE_RECORD.NOTE': {
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'RIN': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.NOTE_RECORD.NOTE.RIN', steps=(('RIN', False, 'LINEAGE_LINKED_RECORDs.NOTE_RECORD.NOTE.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'REFN': (
+            Rule(qualname='REFN', steps=(('REFNs', True, 'REFN'),), cardinality=(0, None), primitive='USER_REFERENCE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=0, kind='XREF'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.NOTE_RECORD.NOTE.RIN': {
+    },
+    'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'NAME': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO.NAME', steps=(('NAME', False, 'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO.NAME'),), cardinality=(0, 1), primitive='NAME_OF_REPOSITORY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RIN': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO.RIN', steps=(('RIN', False, 'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'REFN': (
+            Rule(qualname='REFN', steps=(('REFNs', True, 'REFN'),), cardinality=(0, None), primitive='USER_REFERENCE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO.NAME': {
+    },
+    'LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD.REPO.RIN': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR': {
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'ABBR': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.ABBR', steps=(('ABBR', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.ABBR'),), cardinality=(0, 1), primitive='SOURCE_FILED_BY_ENTRY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'AUTH': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.AUTH', steps=(('AUTH', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.AUTH'),), cardinality=(0, 1), primitive='SOURCE_ORIGINATOR', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'DATA': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.DATA', steps=(('DATA', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.DATA'),), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'PUBL': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.PUBL', steps=(('PUBL', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.PUBL'),), cardinality=(0, 1), primitive='SOURCE_PUBLICATION_FACTS', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RIN': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.RIN', steps=(('RIN', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TEXT': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TEXT', steps=(('TEXT', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TEXT'),), cardinality=(0, 1), primitive='TEXT_FROM_SOURCE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TITL': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TITL', steps=(('TITL', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TITL'),), cardinality=(0, 1), primitive='SOURCE_DESCRIPTIVE_TITLE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=1, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'REFN': (
+            Rule(qualname='REFN', steps=(('REFNs', True, 'REFN'),), cardinality=(0, None), primitive='USER_REFERENCE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'REPO': (
+            Rule(qualname='SOURCE_REPOSITORY_CITATION.REPO', steps=(('SOURCE_REPOSITORY_CITATIONs', True, 'SOURCE_REPOSITORY_CITATION'), ('REPO', False, 'SOURCE_REPOSITORY_CITATION.REPO')), cardinality=(0, None), primitive='XREF_REPO', level_delta=1, kind='XREF'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.ABBR': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.AUTH': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.DATA': {
+        'EVEN': (
+            Rule(qualname='EVENs.EVEN', steps=(('EVENs', True, 'EVENs.EVEN'),), cardinality=(0, None), primitive='EVENTS_RECORDED', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'AGNC': (
+            Rule(qualname='LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.DATA.AGNC', steps=(('AGNC', False, 'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.DATA.AGNC'),), cardinality=(0, 1), primitive='RESPONSIBLE_AGENCY', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.DATA.AGNC': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.PUBL': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.RIN': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TEXT': {
+    },
+    'LINEAGE_LINKED_RECORDs.SOURCE_RECORD.SOUR.TITL': {
+    },
+    'MULTIMEDIA_LINK.OBJE': {
+    },
+    'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE': {
+    },
+    'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE': {
+    },
+    'PERSONAL_NAME_PIECES.GIVN': {
+    },
+    'PERSONAL_NAME_PIECES.NICK': {
+    },
+    'PERSONAL_NAME_PIECES.NPFX': {
+    },
+    'PERSONAL_NAME_PIECES.NSFX': {
+    },
+    'PERSONAL_NAME_PIECES.SPFX': {
+    },
+    'PERSONAL_NAME_PIECES.SURN': {
+    },
+    'PERSONAL_NAME_STRUCTURE.NAME': {
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'GIVN': (
+            Rule(qualname='PERSONAL_NAME_PIECES.GIVN', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('GIVN', False, 'PERSONAL_NAME_PIECES.GIVN')), cardinality=(0, 1), primitive='NAME_PIECE_GIVEN', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NICK': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NICK', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NICK', False, 'PERSONAL_NAME_PIECES.NICK')), cardinality=(0, 1), primitive='NAME_PIECE_NICKNAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NPFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NPFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NPFX', False, 'PERSONAL_NAME_PIECES.NPFX')), cardinality=(0, 1), primitive='NAME_PIECE_PREFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NSFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NSFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NSFX', False, 'PERSONAL_NAME_PIECES.NSFX')), cardinality=(0, 1), primitive='NAME_PIECE_SUFFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SPFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.SPFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SPFX', False, 'PERSONAL_NAME_PIECES.SPFX')), cardinality=(0, 1), primitive='NAME_PIECE_SURNAME_PREFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SURN': (
+            Rule(qualname='PERSONAL_NAME_PIECES.SURN', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SURN', False, 'PERSONAL_NAME_PIECES.SURN')), cardinality=(0, 1), primitive='NAME_PIECE_SURNAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'FONE': (
+            Rule(qualname='PERSONAL_NAME_STRUCTURE.NAME.FONE', steps=(('FONEs', True, 'PERSONAL_NAME_STRUCTURE.NAME.FONE'),), cardinality=(0, None), primitive='NAME_PHONETIC', level_delta=0, kind='PRIMITIVE'),
+        ),
+        'ROMN': (
+            Rule(qualname='PERSONAL_NAME_STRUCTURE.NAME.ROMN', steps=(('ROMNs', True, 'PERSONAL_NAME_STRUCTURE.NAME.ROMN'),), cardinality=(0, None), primitive='NAME_ROMANISED', level_delta=0, kind='PRIMITIVE'),
+        ),
+        'TYPE': (
+            Rule(qualname='PERSONAL_NAME_STRUCTURE.NAME.TYPE', steps=(('TYPE', False, 'PERSONAL_NAME_STRUCTURE.NAME.TYPE'),), cardinality=(0, 1), primitive='NAME_TYPE', level_delta=0, kind='PRIMITIVE'),
+        ),
+    },
+    'PERSONAL_NAME_STRUCTURE.NAME.FONE': {
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'GIVN': (
+            Rule(qualname='PERSONAL_NAME_PIECES.GIVN', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('GIVN', False, 'PERSONAL_NAME_PIECES.GIVN')), cardinality=(0, 1), primitive='NAME_PIECE_GIVEN', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NICK': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NICK', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NICK', False, 'PERSONAL_NAME_PIECES.NICK')), cardinality=(0, 1), primitive='NAME_PIECE_NICKNAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NPFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NPFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NPFX', False, 'PERSONAL_NAME_PIECES.NPFX')), cardinality=(0, 1), primitive='NAME_PIECE_PREFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NSFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NSFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NSFX', False, 'PERSONAL_NAME_PIECES.NSFX')), cardinality=(0, 1), primitive='NAME_PIECE_SUFFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SPFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.SPFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SPFX', False, 'PERSONAL_NAME_PIECES.SPFX')), cardinality=(0, 1), primitive='NAME_PIECE_SURNAME_PREFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SURN': (
+            Rule(qualname='PERSONAL_NAME_PIECES.SURN', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SURN', False, 'PERSONAL_NAME_PIECES.SURN')), cardinality=(0, 1), primitive='NAME_PIECE_SURNAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'TYPE': (
+            Rule(qualname='PERSONAL_NAME_STRUCTURE.NAME.FONE.TYPE', steps=(('TYPE', False, 'PERSONAL_NAME_STRUCTURE.NAME.FONE.TYPE'),), cardinality=(0, 1), primitive='PHONETISATION_METHOD', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'PERSONAL_NAME_STRUCTURE.NAME.FONE.TYPE': {
+    },
+    'PERSONAL_NAME_STRUCTURE.NAME.ROMN': {
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=2, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=2, kind='XREF'),
+        ),
+        'GIVN': (
+            Rule(qualname='PERSONAL_NAME_PIECES.GIVN', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('GIVN', False, 'PERSONAL_NAME_PIECES.GIVN')), cardinality=(0, 1), primitive='NAME_PIECE_GIVEN', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NICK': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NICK', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NICK', False, 'PERSONAL_NAME_PIECES.NICK')), cardinality=(0, 1), primitive='NAME_PIECE_NICKNAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NPFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NPFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NPFX', False, 'PERSONAL_NAME_PIECES.NPFX')), cardinality=(0, 1), primitive='NAME_PIECE_PREFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'NSFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.NSFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('NSFX', False, 'PERSONAL_NAME_PIECES.NSFX')), cardinality=(0, 1), primitive='NAME_PIECE_SUFFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SPFX': (
+            Rule(qualname='PERSONAL_NAME_PIECES.SPFX', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SPFX', False, 'PERSONAL_NAME_PIECES.SPFX')), cardinality=(0, 1), primitive='NAME_PIECE_SURNAME_PREFIX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SURN': (
+            Rule(qualname='PERSONAL_NAME_PIECES.SURN', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SURN', False, 'PERSONAL_NAME_PIECES.SURN')), cardinality=(0, 1), primitive='NAME_PIECE_SURNAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'SOUR': (
+            Rule(qualname='SOURCE_CITATION.SOUR', steps=(('PERSONAL_NAME_PIECES', False, 'PERSONAL_NAME_PIECES'), ('SOURCE_CITATIONs', True, 'SOURCE_CITATION'), ('SOUR', False, 'SOURCE_CITATION.SOUR')), cardinality=(0, None), primitive='XREF_SOUR', level_delta=1, kind='XREF'),
+        ),
+        'TYPE': (
+            Rule(qualname='PERSONAL_NAME_STRUCTURE.NAME.ROMN.TYPE', steps=(('TYPE', False, 'PERSONAL_NAME_STRUCTURE.NAME.ROMN.TYPE'),), cardinality=(0, 1), primitive='ROMANISATION_METHOD', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'PERSONAL_NAME_STRUCTURE.NAME.ROMN.TYPE': {
+    },
+    'PERSONAL_NAME_STRUCTURE.NAME.TYPE': {
+    },
+    'PLACE_STRUCTURE.PLAC': {
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'FONE': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.FONE', steps=(('FONEs', True, 'PLACE_STRUCTURE.PLAC.FONE'),), cardinality=(0, None), primitive='PLACE_PHONETIC', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'MAP': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.MAP', steps=(('MAP', False, 'PLACE_STRUCTURE.PLAC.MAP'),), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'ROMN': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.ROMN', steps=(('ROMNs', True, 'PLACE_STRUCTURE.PLAC.ROMN'),), cardinality=(0, None), primitive='PLACE_ROMANISED', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'PLACE_STRUCTURE.PLAC.FONE': {
+        'TYPE': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.FONE.TYPE', steps=(('TYPE', False, 'PLACE_STRUCTURE.PLAC.FONE.TYPE'),), cardinality=(0, 1), primitive='PHONETISATION_METHOD', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'PLACE_STRUCTURE.PLAC.FONE.TYPE': {
+    },
+    'PLACE_STRUCTURE.PLAC.MAP': {
+        'LATI': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.MAP.LATI', steps=(('LATI', False, 'PLACE_STRUCTURE.PLAC.MAP.LATI'),), cardinality=(0, 1), primitive='PLACE_LATITUDE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'LONG': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.MAP.LONG', steps=(('LONG', False, 'PLACE_STRUCTURE.PLAC.MAP.LONG'),), cardinality=(0, 1), primitive='PLACE_LONGITUDE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'PLACE_STRUCTURE.PLAC.MAP.LATI': {
+    },
+    'PLACE_STRUCTURE.PLAC.MAP.LONG': {
+    },
+    'PLACE_STRUCTURE.PLAC.ROMN': {
+        'TYPE': (
+            Rule(qualname='PLACE_STRUCTURE.PLAC.ROMN.TYPE', steps=(('TYPE', False, 'PLACE_STRUCTURE.PLAC.ROMN.TYPE'),), cardinality=(0, 1), primitive='ROMANISATION_METHOD', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'PLACE_STRUCTURE.PLAC.ROMN.TYPE': {
+    },
+    'REFN': {
+        'TYPE': (
+            Rule(qualname='REFN.TYPE', steps=(('TYPE', False, 'REFN.TYPE'),), cardinality=(0, 1), primitive='USER_REFERENCE_TYPE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'REFN.TYPE': {
+    },
+    'SOURCE_CITATION.SOUR': {
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=1, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'DATA': (
+            Rule(qualname='SOURCE_CITATION.SOUR.DATA', steps=(('DATA', False, 'SOURCE_CITATION.SOUR.DATA'),), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EVEN': (
+            Rule(qualname='SOURCE_CITATION.SOUR.EVEN', steps=(('EVEN', False, 'SOURCE_CITATION.SOUR.EVEN'),), cardinality=(0, 1), primitive='EVENT_TYPE_CITED_FROM', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'PAGE': (
+            Rule(qualname='SOURCE_CITATION.SOUR.PAGE', steps=(('PAGE', False, 'SOURCE_CITATION.SOUR.PAGE'),), cardinality=(0, 1), primitive='WHERE_WITHIN_SOURCE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'QUAY': (
+            Rule(qualname='SOURCE_CITATION.SOUR.QUAY', steps=(('QUAY', False, 'SOURCE_CITATION.SOUR.QUAY'),), cardinality=(0, 1), primitive='CERTAINTY_ASSESSMENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'SOURCE_CITATION.SOUR.DATA': {
+        'DATE': (
+            Rule(qualname='SOURCE_CITATION.SOUR.DATA.DATE', steps=(('DATE', False, 'SOURCE_CITATION.SOUR.DATA.DATE'),), cardinality=(0, 1), primitive='ENTRY_RECORDING_DATE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'TEXT': (
+            Rule(qualname='TEXTs.TEXT', steps=(('TEXTs', True, 'TEXTs.TEXT'),), cardinality=(0, None), primitive='TEXT_FROM_SOURCE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'SOURCE_CITATION.SOUR.DATA.DATE': {
+    },
+    'SOURCE_CITATION.SOUR.EVEN': {
+        'ROLE': (
+            Rule(qualname='SOURCE_CITATION.SOUR.EVEN.ROLE', steps=(('ROLE', False, 'SOURCE_CITATION.SOUR.EVEN.ROLE'),), cardinality=(0, 1), primitive='ROLE_IN_EVENT', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'SOURCE_CITATION.SOUR.EVEN.ROLE': {
+    },
+    'SOURCE_CITATION.SOUR.PAGE': {
+    },
+    'SOURCE_CITATION.SOUR.QUAY': {
+    },
+    'SOURCE_REPOSITORY_CITATION.REPO': {
+        'CALN': (
+            Rule(qualname='SOURCE_REPOSITORY_CITATION.REPO.CALN', steps=(('CALN', False, 'SOURCE_REPOSITORY_CITATION.REPO.CALN'),), cardinality=(0, 1), primitive='SOURCE_CALL_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'SOURCE_REPOSITORY_CITATION.REPO.CALN': {
+        'MEDI': (
+            Rule(qualname='SOURCE_REPOSITORY_CITATION.REPO.CALN.MEDI', steps=(('MEDI', False, 'SOURCE_REPOSITORY_CITATION.REPO.CALN.MEDI'),), cardinality=(0, 1), primitive='SOURCE_MEDIA_TYPE', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'SOURCE_REPOSITORY_CITATION.REPO.CALN.MEDI': {
+    },
+    'SPOUSE_TO_FAMILY_LINK.FAMS': {
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+    },
+    'SUBMITTER_RECORD.SUBM': {
+        'ADDR': (
+            Rule(qualname='ADDRESS_STRUCTURE.ADDR', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('ADDR', False, 'ADDRESS_STRUCTURE.ADDR')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'EMAIL': (
+            Rule(qualname='ADDRESS_STRUCTURE.EMAIL', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('EMAILs', True, 'ADDRESS_STRUCTURE.EMAIL')), cardinality=(0, None), primitive='ADDRESS_EMAIL', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'FAX': (
+            Rule(qualname='ADDRESS_STRUCTURE.FAX', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('FAXs', True, 'ADDRESS_STRUCTURE.FAX')), cardinality=(0, None), primitive='ADDRESS_FAX', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'PHON': (
+            Rule(qualname='ADDRESS_STRUCTURE.PHON', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('PHONs', True, 'ADDRESS_STRUCTURE.PHON')), cardinality=(0, None), primitive='PHONE_NUMBER', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'WWW': (
+            Rule(qualname='ADDRESS_STRUCTURE.WWW', steps=(('ADDRESS_STRUCTURE', False, 'ADDRESS_STRUCTURE'), ('WWWs', True, 'ADDRESS_STRUCTURE.WWW')), cardinality=(0, None), primitive='ADDRESS_WEB_PAGE', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'CHAN': (
+            Rule(qualname='CHANGE_DATE.CHAN', steps=(('CHANGE_DATE', False, 'CHANGE_DATE'), ('CHAN', False, 'CHANGE_DATE.CHAN')), cardinality=(0, 1), primitive=None, level_delta=1, kind='TAG'),
+        ),
+        'OBJE': (
+            Rule(qualname='MULTIMEDIA_LINK.OBJE', steps=(('MULTIMEDIA_LINKs', True, 'MULTIMEDIA_LINK'), ('OBJE', False, 'MULTIMEDIA_LINK.OBJE')), cardinality=(0, None), primitive='XREF_OBJE', level_delta=1, kind='XREF'),
+        ),
+        'NOTE': (
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE')), cardinality=(0, None), primitive='USER_TEXT', level_delta=1, kind='PRIMITIVE'),
+            Rule(qualname='NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE', steps=(('NOTE_STRUCTUREs', True, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE'), ('NOTE', False, 'NOTE_STRUCTUREs.NOTE_STRUCTURE_XREF_NOTE.NOTE')), cardinality=(0, None), primitive='XREF_NOTE', level_delta=1, kind='XREF'),
+        ),
+        'NAME': (
+            Rule(qualname='SUBMITTER_RECORD.SUBM.NAME', steps=(('NAME', False, 'SUBMITTER_RECORD.SUBM.NAME'),), cardinality=(0, 1), primitive='SUBMITTER_NAME', level_delta=1, kind='PRIMITIVE'),
+        ),
+        'RIN': (
+            Rule(qualname='SUBMITTER_RECORD.SUBM.RIN', steps=(('RIN', False, 'SUBMITTER_RECORD.SUBM.RIN'),), cardinality=(0, 1), primitive='AUTOMATED_RECORD_ID', level_delta=1, kind='PRIMITIVE'),
+        ),
+    },
+    'SUBMITTER_RECORD.SUBM.NAME': {
+    },
+    'SUBMITTER_RECORD.SUBM.RIN': {
+    },
+    'TEXTs.TEXT': {
+    },
+}
@@ -0,0 +1,172 @@
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import pathlib
+import re
+import tempfile
+from collections import namedtuple
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from ..common import Substructure
+from ..configure import configure
+from .reader import iter_records
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+RecordSpan = namedtuple("RecordSpan", ("offset", "length", "tag"))
+XrefIndex = namedtuple("XrefIndex", ("path", "size", "mtime_ns", "digest", "records"))
+
+RECORD_START = re.compile(rb"^(?:\xef\xbb\xbf)?0 +(?:@(?P<xref_id>[^@ ]+)@ +)?(?P<tag>[A-Za-z0-9_]+)")
+INDEX_VERSION = 1
+
+
+def index_path(path: Union[str, pathlib.Path]) -> pathlib.Path:
+    """
+    where the index of path is persisted: next to it.
+    """
+    path = pathlib.Path(path)
+    return path.with_name(f"{path.name}.xrefs.json")
+
+
+def iter_record_spans(view: Union[mmap.mmap, bytes]) -> Iterator[Tuple[Optional[str], RecordSpan]]:
+    """
+    yields the xref id (None if there is none) and the byte offset, length and tag of every level 0 record.
+    NOTE: a record runs from its level 0 line up to (and including the terminator before) the next one,
+    so the spans cover view without gaps.
+    """
+    start = 0
+    while start < len(view):
+        next_start = view.find(b"\n0 ", start)
+        end = len(view) if next_start < 0 else next_start + 1
+        if match := RECORD_START.match(view[start : min(end, start + 256)]):
+            xref_id = match.group("xref_id")
+            xref_id = None if xref_id is None else xref_id.decode("utf-8")
+            yield xref_id, RecordSpan(start, end - start, match.group("tag").decode("ascii"))
+        else:
+            logger.warning(f"<not-a-record:{start}>")
+            yield None, RecordSpan(start, end - start, None)
+        start = end
+
+
+def new_digest():
+    return hashlib.blake2b(digest_size=20)
+
+
+def file_digest(path: Union[str, pathlib.Path]) -> str:
+    digest = new_digest()
+    with pathlib.Path(path).open("rb") as stream:
+        if os.fstat(stream.fileno()).st_size:
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                digest.update(view)
+    return digest.hexdigest()
+
+
+def build_index(path: Union[str, pathlib.Path]) -> XrefIndex:
+    """
+    scans path (memory mapped) once, recording where each record with an xref id is and hashing the file meanwhile.
+    """
+    path = pathlib.Path(path)
+    digest = new_digest()
+    records: Dict[str, RecordSpan] = dict()
+    with path.open("rb") as stream:
+        stat = os.fstat(stream.fileno())
+        if stat.st_size:
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                with memoryview(view) as buffer:
+                    for xref_id, span in iter_record_spans(view):
+                        digest.update(buffer[span.offset : span.offset + span.length])
+                        if xref_id is None:
+                            continue
+                        if xref_id in records:
+                            logger.warning(f"<duplicate-xref-id:{xref_id}>")
+                        records[xref_id] = span
+    logger.debug(f"<indexed:{path}:{len(records)}>")
+    return XrefIndex(str(path), stat.st_size, stat.st_mtime_ns, digest.hexdigest(), records)
+
+
+def save_index(index: XrefIndex):
+    """
+    persists index next to the file it indexes (atomically, a failure to write is logged and ignored).
+    """
+    target = index_path(index.path)
+    content = {
+        "version": INDEX_VERSION,
+        "size": index.size,
+        "mtime_ns": index.mtime_ns,
+        "digest": index.digest,
+        "records": {xref_id: list(span) for xref_id, span in index.records.items()},
+    }
+    try:
+        fd, temporary = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(content, fp)
+            os.replace(temporary, target)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+    except Exception as e:
+        # NOTE: the index is only a cache, the file is indexed again next time
+        logger.warning(f"<index-not-saved:{target}:{e}>")
+
+
+def load_index(path: Union[str, pathlib.Path], *, verify: bool = False) -> XrefIndex:
+    """
+    the persisted index of path if it is still valid, else a freshly built (and persisted) one.
+    the index is stale if the size differs, or if the hash differs when the mtime differs (or verify is set),
+    so that touching the file does not cost a rebuild.
+    """
+    path = pathlib.Path(path)
+    stat = path.stat()
+    try:
+        content = json.loads(index_path(path).read_text(encoding="utf-8"))
+        if content.get("version") != INDEX_VERSION or content["size"] != stat.st_size:
+            raise ValueError("stale index")
+        if verify or content["mtime_ns"] != stat.st_mtime_ns:
+            if content["digest"] != file_digest(path):
+                raise ValueError("stale index")
+        index = XrefIndex(
+            str(path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            content["digest"],
+            {xref_id: RecordSpan(*span) for xref_id, span in content["records"].items()},
+        )
+        if content["mtime_ns"] != stat.st_mtime_ns:
+            save_index(index)
+        return index
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"<index-rebuilt:{path}:{e}>")
+    index = build_index(path)
+    save_index(index)
+    return index
+
+
+def read_span(path: Union[str, pathlib.Path], span: RecordSpan) -> bytes:
+    with pathlib.Path(path).open("rb") as stream:
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return view[span.offset : span.offset + span.length]
+
+
+def read_record(index: XrefIndex, xref_id: str) -> Substructure:
+    """
+    materializes the record with xref_id (e.g. 'I1' or '@I1@'), e.g. a LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD,
+    reading only its bytes.
+    """
+    span = index.records[xref_id.strip("@")]
+    text = read_span(index.path, span).decode("utf-8-sig")
+    return next(iter_records(io.StringIO(text)))
+
+
+__all__ = [
+    "RecordSpan",
+    "XrefIndex",
+    "build_index",
+    "index_path",
+    "load_index",
+    "read_record",
+]
@@ -134,7 +134,7 @@ from .primitives import (
     Y,
 )
 
-configure()
+configure(lazy=True)
 logger = logging.getLogger(__name__)
 
 
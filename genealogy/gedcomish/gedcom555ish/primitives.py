@@ -1,12 +1,13 @@
 import datetime
 import logging
 from enum import Enum, auto
-from typing import Iterable
+from typing import Iterable, Iterator
 
-from ..common import XREF_ID, Primitive, get_gedcom_date, get_month, try_strptime
+from ..common import XREF_ID, Primitive, get_gedcom_date, get_month
 from ..configure import configure
+from .dates import format_date, gedcom_date_value, parse_date
 
-configure()
+configure(lazy=True)
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +18,8 @@ class DateConstraint(Enum):
 
 
 class DateHelper:
+    __slots__ = ("args", "constraint", "kwargs")
+
     def __init__(self, *args, constraint: DateConstraint, **kwargs):
         self.args = args
         self.constraint = constraint
@@ -27,25 +30,16 @@ class DateHelper:
             return get_gedcom_date(date)
         elif self.constraint == DateConstraint.PARTIAL:
             if isinstance(date, str):
-                datestr = date.strip().rstrip(".xX-")
-                fmts = [r"%Y-%m-%d", r"%Y-%m", r"%Y"]
-                for fmt in fmts:
-                    try:
-                        date = datetime.datetime.strptime(datestr, fmt)
-                        if fmt == fmts[0]:
-                            return "\u0020".join((str(date.day), get_month(date), str(date.year)))
-                        elif fmt == fmts[1]:
-                            return "\u0020".join((get_month(date), str(date.year)))
-                        elif fmt == fmts[2]:
-                            return str(date.year)
-                    except Exception as _:
-                        pass
+                if (parsed := parse_date(date)) is not None:
+                    return format_date(parsed)
             elif isinstance(date, (datetime.date, datetime.datetime)):
                 return "\u0020".join((str(date.day), get_month(date), str(date.year)))
         elif self.constraint == DateConstraint.FULL:
             if isinstance(date, str):
-                date = try_strptime(date)
-            if isinstance(date, (datetime.date, datetime.datetime)):
+                # NOTE: a partial date is completed as strptime would, e.g. 1850 is 1 JAN 1850
+                if (parsed := parse_date(date)) is not None:
+                    return format_date(parsed._replace(month=parsed.month or 1, day=parsed.day or 1))
+            elif isinstance(date, (datetime.date, datetime.datetime)):
                 return "\u0020".join((str(date.day), get_month(date), str(date.year)))
         raise ValueError(f"get_date failed: locals()={locals()}")
 
@@ -175,17 +169,16 @@ class DATE_CALENDAR(Primitive, Size=(4, 35)):
 
 
 class DATE_EXACT(Primitive, Size=(10, 11)):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.date_helper = DateHelper(*args, constraint=DateConstraint.FULL, **kwargs)
+    @property
+    def date_helper(self) -> DateHelper:
+        return DateHelper(*self.args, constraint=DateConstraint.FULL, **self.kwargs)
 
     def __str__(self):
-        if hasattr(self, "date_helper") and getattr(self, "date_helper"):
-            try:
-                if result := str(self.date_helper):
-                    return result
-            except Exception as e:
-                logger.warning(f"{e}")
+        try:
+            if result := str(self.date_helper):
+                return result
+        except Exception as e:
+            logger.warning(f"{e}")
         logger.warning("fallback to super().__str__()")
         return super().__str__()
 
@@ -207,17 +200,16 @@ class DATE_JULN(Primitive, Size=(4, 35)):
 
 
 class DATE_PERIOD(Primitive, Size=(7, 35)):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.date_helper = DateHelper(*args, constraint=DateConstraint.PARTIAL, **kwargs)
+    @property
+    def date_helper(self) -> DateHelper:
+        return DateHelper(*self.args, constraint=DateConstraint.PARTIAL, **self.kwargs)
 
     def __str__(self):
-        if hasattr(self, "date_helper") and getattr(self, "date_helper"):
-            try:
-                if result := str(self.date_helper):
-                    return result
-            except Exception as e:
-                logger.warning(f"{e}")
+        try:
+            if result := str(self.date_helper):
+                return result
+        except Exception as e:
+            logger.warning(f"{e}")
         logger.warning("fallback to super().__str__()")
         return super().__str__()
 
@@ -231,39 +223,39 @@ class DATE_RANGE(Primitive, Size=(8, 35)):
 
 
 class DATE_VALUE(Primitive, Size=(1, 35)):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.date_helpers = [
-            DateHelper(*args, constraint=DateConstraint.PARTIAL, **kwargs),
-            DateHelper(*args, constraint=DateConstraint.FULL, **kwargs),
-            DateHelper(*args, constraint=DateConstraint.INTERPRETED, **kwargs),
-        ]
+    @property
+    def date_helpers(self) -> Iterator[DateHelper]:
+        """
+        tried in order, created one at a time (only as far as needed).
+        """
+        for constraint in (DateConstraint.PARTIAL, DateConstraint.FULL, DateConstraint.INTERPRETED):
+            yield DateHelper(*self.args, constraint=constraint, **self.kwargs)
 
     def __str__(self):
-        if hasattr(self, "date_helpers") and getattr(self, "date_helpers"):
-            for date_helper in self.date_helpers:
-                try:
-                    if result := str(date_helper):
-                        logger.debug(f"DATE_VALUE:{result}")
-                        return result
-                except Exception as e:
-                    logger.warning(f"{e}")
+        if self.args and isinstance(self.args[0], str):
+            return gedcom_date_value(self.args[0])
+        for date_helper in self.date_helpers:
+            try:
+                if result := str(date_helper):
+                    logger.debug(f"DATE_VALUE:{result}")
+                    return result
+            except Exception as e:
+                logger.warning(f"{e}")
         logger.warning("fallback to super().__str__()")
         return super().__str__()
 
 
 class DATE(Primitive, Size=(4, 35)):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.date_helper = DateHelper(*args, constraint=DateConstraint.PARTIAL, **kwargs)
+    @property
+    def date_helper(self) -> DateHelper:
+        return DateHelper(*self.args, constraint=DateConstraint.PARTIAL, **self.kwargs)
 
     def __str__(self):
-        if hasattr(self, "date_helper") and getattr(self, "date_helper"):
-            try:
-                if result := str(self.date_helper):
-                    return result
-            except Exception as e:
-                logger.warning(f"{e}")
+        try:
+            if result := str(self.date_helper):
+                return result
+        except Exception as e:
+            logger.warning(f"{e}")
         logger.warning("fallback to super().__str__()")
         return super().__str__()
 
@@ -585,6 +577,8 @@ class TEXT(Primitive, Size=(1, 32767)):
 
 
 class TIME_VALUE(Primitive, Size=(7, 12)):
+    __slots__ = ("date",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if args and isinstance(args, Iterable) and len(args) > 0 and isinstance(args[0], (datetime.datetime)):
@@ -0,0 +1,445 @@
+import functools
+import io
+import logging
+import mmap
+import os
+import pathlib
+import re
+from collections import defaultdict, deque, namedtuple
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..common import (
+    NULL,
+    XREF_ID,
+    FieldKind,
+    Option,
+    Pointer,
+    Primitive,
+    Substructure,
+    _changed_classes,
+    _class_caches,
+    compile_plan,
+)
+from ..configure import configure
+from . import lineage_linked_gedcom_file
+from .lineage_linked_gedcom_file import (
+    FORM_RECORDS,
+    GEDCOM_FORM_HEADER_EXTENSIONs,
+    GEDCOM_HEADER,
+    GEDCOM_TRAILER,
+    LINEAGE_LINKED_GEDCOM_FILE,
+    SUBMITTER_RECORD,
+    LINEAGE_LINKED_RECORDs,
+)
+from .dates import parse_date_value
+from .primitives import DATE, DATE_EXACT, DATE_PERIOD, DATE_VALUE
+
+try:
+    from .grammar_table import GRAMMAR
+except ImportError:
+    # NOTE: until it is generated (see grammar.py), routes are reflected
+    GRAMMAR = dict()
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+GEDCOM_NODE = namedtuple("GEDCOM_NODE", ("level", "xref_id", "tag", "line_value", "children"))
+Step = namedtuple("Step", ("name", "iterable", "cls"))
+
+LINE = re.compile(r"^\s*(?P<level>\d+) +(?:(?P<xref_id>@[^@ ]+@) +)?(?P<tag>[A-Za-z0-9_]+)(?: (?P<line_value>.*))?$")
+POINTER = re.compile(r"^@[^@#][^@]*@$")
+
+
+HEADER_EXTENSION = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION
+
+# routes from a class to the line emitting classes below it, see routes
+_routes: Dict[type, Dict[str, Tuple[Tuple[Step, ...], ...]]] = dict()
+
+
+def routed_classes(cls: type, found: Dict[str, Tuple[Tuple[Step, ...], ...]]) -> Tuple[type, ...]:
+    """
+    cls and the classes on the routes found from it (what the routes are derived from).
+    """
+    return (cls, *(step.cls for routes in found.values() for route in routes for step in route))
+
+
+_class_caches.append((_routes, routed_classes))
+
+
+def iter_lines(stream: IO, *, encoding: str = "utf-8-sig") -> Iterator[GEDCOM_NODE]:
+    """
+    yields the lines of stream (without children), with CONT/CONC lines folded into the line they continue.
+    binary streams are decoded with encoding, anything else is iterated as lines of text.
+    """
+    wrapper = None
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        stream = wrapper = io.TextIOWrapper(stream, encoding=encoding)
+    try:
+        pending: Optional[GEDCOM_NODE] = None
+        for line_no, text in enumerate(stream, start=1):
+            text = text.rstrip("\r\n")
+            if line_no == 1:
+                text = text.lstrip("\ufeff")
+            if not text.strip():
+                continue
+            if not (match := LINE.match(text)):
+                logger.warning(f"<unparsable-line:{line_no}:{text!r}>")
+                continue
+            level = int(match.group("level"))
+            tag = match.group("tag")
+            line_value = match.group("line_value")
+            if pending and tag in ("CONT", "CONC") and level == pending.level + 1:
+                # NOTE: the writer splits values on os.linesep, so CONT joins with os.linesep
+                joiner = os.linesep if tag == "CONT" else ""
+                pending = pending._replace(line_value=(pending.line_value or "") + joiner + (line_value or ""))
+                continue
+            if pending:
+                yield pending
+            pending = GEDCOM_NODE(level, match.group("xref_id"), tag, line_value, list())
+        if pending:
+            yield pending
+    finally:
+        # NOTE: the stream stays open for the caller (closing the wrapper would close it)
+        if wrapper is not None and not wrapper.closed:
+            wrapper.detach()
+
+
+def iter_nodes(stream: IO, *, encoding: str = "utf-8-sig") -> Iterator[GEDCOM_NODE]:
+    """
+    yields one tree of lines per level 0 line, so that only the lines of a single record are kept in memory.
+    """
+    stack: List[GEDCOM_NODE] = list()
+    for node in iter_lines(stream, encoding=encoding):
+        if node.level == 0:
+            if stack:
+                yield stack[0]
+            stack = [node]
+        elif not stack:
+            logger.warning(f"<line-before-first-record:{node}>")
+        else:
+            while stack[-1].level >= node.level:
+                stack.pop()
+            stack[-1].children.append(node)
+            stack.append(node)
+    if stack:
+        yield stack[0]
+
+
+def options(cls: type) -> List[type]:
+    return [sub for sub in cls.__subclasses__() if issubclass(sub, Option)] or [cls]
+
+
+def resolve(qualname: str) -> type:
+    return functools.reduce(getattr, qualname.split("."), lineage_linked_gedcom_file)
+
+
+def changed(cls: type, grammar: Dict) -> bool:
+    """
+    whether a class attribute was reassigned on cls or on a class on the routes in grammar (the GRAMMAR of cls).
+    """
+    if not _changed_classes:
+        return False
+    qualnames = {qualname for rules in grammar.values() for rule in rules for *_, qualname in rule.steps}
+    return not _changed_classes.isdisjoint(qualnames | {cls.__qualname__})
+
+
+def routes(cls: type) -> Dict[str, Tuple[Tuple[Step, ...], ...]]:
+    """
+    maps each tag that may appear directly below a line of cls to the routes (in emission order) leading to it:
+    the fields to follow through the structures that emit no line of their own, ending at the class emitting the tag.
+    looked up in the generated GRAMMAR (see grammar.py) for the schema classes, else reflected (see reflect_routes).
+    NOTE: so are the routes of a schema class when an attribute of it (or of a class on its routes) was reassigned.
+    """
+    if (result := _routes.get(cls)) is None:
+        schema = cls.__module__ == lineage_linked_gedcom_file.__name__
+        if schema and (grammar := GRAMMAR.get(cls.__qualname__)) is not None and not changed(cls, grammar):
+            result = {
+                tag: tuple(
+                    tuple(Step(name, iterable, resolve(qualname)) for name, iterable, qualname in rule.steps)
+                    for rule in rules
+                )
+                for tag, rules in grammar.items()
+            }
+        else:
+            result = reflect_routes(cls)
+        _routes[cls] = result
+    return result
+
+
+def reflect_routes(cls: type, seen: Tuple[type, ...] = ()) -> Dict[str, Tuple[Tuple[Step, ...], ...]]:
+    """
+    routes (see routes) found by walking the fields of cls (see compile_plan).
+    """
+    found = defaultdict(list)
+    for field in compile_plan(cls).fields:
+        if not issubclass(field.cls, Substructure):
+            continue
+        for option in options(field.cls):
+            step = Step(field.name, field.iterable, option)
+            if FieldKind.of(option) is not FieldKind.SUBSTRUCTURE:
+                found[option.__name__].append((step,))
+            elif option not in seen:
+                for tag, subroutes in reflect_routes(option, seen + (cls,)).items():
+                    found[tag].extend((step,) + subroute for subroute in subroutes)
+
+    # NOTE: a class declared both as a field and as an Iterable (ADDRESS_STRUCTURE.PHON, PHONs) is read as an Iterable
+    def superseded(route, tag_routes):
+        return not route[-1].iterable and any(
+            other[-1].iterable and other[-1].cls is route[-1].cls and other[:-1] == route[:-1] for other in tag_routes
+        )
+
+    return {
+        tag: tuple(route for route in tag_routes if not superseded(route, tag_routes))
+        for tag, tag_routes in found.items()
+    }
+
+
+def select_route(candidates: Optional[Tuple[Tuple[Step, ...], ...]], node: GEDCOM_NODE) -> Optional[Tuple[Step, ...]]:
+    """
+    picks the route whose line emitting class fits the line: records need a Pointer, pointer values an XREF_ID.
+    """
+    if not candidates:
+        return None
+    is_pointer = bool(node.line_value and POINTER.match(node.line_value))
+
+    def fits(cls):
+        if bool(node.xref_id) != issubclass(cls, Pointer):
+            return False
+        return is_pointer == (issubclass(cls, XREF_ID) and not issubclass(cls, Pointer))
+
+    return next((route for route in candidates if fits(route[-1].cls)), candidates[0])
+
+
+def date_arguments(text: str, *, exact: bool = False) -> Optional[Tuple[tuple, dict]]:
+    """
+    converts a GEDCOM date (e.g. '2 OCT 1822', 'FROM 1900 TO 1905') to the arguments the date primitives take
+    (e.g. ('1822-10-02',), {} and (), {'FROM': '1900', 'TO': '1905'}), parsed as a DATE_VALUE (see dates.py).
+    returns None for anything else (date phrases, calendar escapes, ...).
+    """
+    value = parse_date_value(text)
+    if value is None or value.phrase is not None or not value.dates:
+        return None
+    if any(date.calendar != "GREGORIAN" or date.dual is not None or date.bc for date in value.dates):
+        return None
+    if exact:
+        (date,) = value.dates
+        if value.keyword is not None or date.day is None:
+            return None
+    isodates = [
+        "-".join(f"{part:0{width}d}" for part, width in ((date.year, 4), (date.month, 2), (date.day, 2)) if part)
+        for date in value.dates
+    ]
+    if value.keyword is None:
+        return (isodates[0],), dict()
+    return tuple(), dict(zip((value.keyword, value.conjunction), isodates))
+
+
+def instantiate(cls: type, node: GEDCOM_NODE) -> Substructure:
+    """
+    creates the line emitting cls from the xref id and line value of node (like the schema classes are created by hand).
+    """
+    args: list = list()
+    kwargs: dict = dict()
+    xref_base = next((base for base in cls.__mro__[1:] if issubclass(base, XREF_ID) and base is not XREF_ID), None)
+    if issubclass(cls, Pointer) and node.xref_id and xref_base:
+        args.append(xref_base(node.xref_id[1:-1]))
+    if node.line_value is None:
+        if issubclass(cls, NULL):
+            args.append(NULL())
+    elif xref_base and not issubclass(cls, Pointer) and POINTER.match(node.line_value):
+        args.append(node.line_value[1:-1])
+    elif issubclass(cls, (DATE_VALUE, DATE_EXACT, DATE_PERIOD, DATE)):
+        if converted := date_arguments(node.line_value, exact=issubclass(cls, DATE_EXACT)):
+            args.extend(converted[0])
+            kwargs.update(converted[1])
+        else:
+            # NOTE: a plain Primitive is written verbatim
+            args.append(Primitive(node.line_value))
+    elif issubclass(cls, Primitive):
+        if args:
+            # NOTE: typed, so that the value is not taken for the xref id
+            value_base = next(
+                base
+                for base in cls.__mro__[1:]
+                if issubclass(base, Primitive) and not issubclass(base, (XREF_ID, NULL, Substructure))
+            )
+            args.append(value_base(node.line_value))
+        else:
+            args.append(node.line_value)
+    else:
+        logger.warning(f"<value-dropped:{cls.__qualname__}:{node.line_value!r}>")
+    return cls(*args, **kwargs)
+
+
+def attach(owner: Substructure, step: Step, value: Substructure):
+    if step.iterable:
+        if not isinstance(values := owner.__dict__.get(step.name), list):
+            values = list()
+            setattr(owner, step.name, values)
+        values.append(value)
+    else:
+        if step.name in owner.__dict__:
+            logger.warning(f"<replaced:{owner.__class__.__qualname__}.{step.name}>")
+        setattr(owner, step.name, value)
+
+
+def container(owner: Substructure, step: Step) -> Substructure:
+    """
+    the structure (emitting no line of its own) to put the next line in: a new one for iterables, else the existing one.
+    """
+    if not step.iterable and isinstance(existing := owner.__dict__.get(step.name), step.cls):
+        return existing
+    value = step.cls()
+    attach(owner, step, value)
+    return value
+
+
+def fill(owner: Substructure, nodes: List[GEDCOM_NODE]) -> List[GEDCOM_NODE]:
+    """
+    puts the structures read from nodes in owner, returns the nodes that do not fit.
+    """
+    owner_routes = routes(owner.__class__)
+    unmatched: List[GEDCOM_NODE] = list()
+    for node in nodes:
+        if route := select_route(owner_routes.get(node.tag), node):
+            materialize(owner, route, node)
+        else:
+            unmatched.append(node)
+    return unmatched
+
+
+def materialize(owner: Substructure, route: Tuple[Step, ...], node: GEDCOM_NODE) -> Substructure:
+    for step in route[:-1]:
+        owner = container(owner, step)
+    value = instantiate(route[-1].cls, node)
+    attach(owner, route[-1], value)
+    for unmatched in fill(value, node.children):
+        logger.warning(f"<unrecognized:{value.__class__.__qualname__}:{unmatched.level} {unmatched.tag}>")
+    return value
+
+
+def iter_records(stream: IO, *, encoding: str = "utf-8-sig") -> Iterator[Substructure]:
+    """
+    yields one record per level 0 line (e.g. LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD, SUBMITTER_RECORD),
+    so that only a single record is kept in memory.
+    NOTE: HEAD yields GEDCOM_HEADER followed by GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.
+    """
+    file_routes = routes(LINEAGE_LINKED_GEDCOM_FILE)
+    for node in iter_nodes(stream, encoding=encoding):
+        candidates = tuple(route for route in file_routes.get(node.tag, ()) if route[0].cls is not HEADER_EXTENSION)
+        if not (route := select_route(candidates, node)):
+            logger.warning(f"<unrecognized-record:{node.tag}>")
+            continue
+        value = instantiate(route[-1].cls, node)
+        if len(route) > 1:
+            record = route[-2].cls()
+            attach(record, route[-1], value)
+        else:
+            record = value
+        unmatched = fill(value, node.children)
+        extension = None
+        if isinstance(record, GEDCOM_HEADER):
+            extension = HEADER_EXTENSION()
+            unmatched = fill(extension, unmatched)
+        for child in unmatched:
+            logger.warning(f"<unrecognized:{value.__class__.__qualname__}:{child.level} {child.tag}>")
+        yield record
+        if extension:
+            yield extension
+
+
+def read_file(stream: IO, *, encoding: str = "utf-8-sig") -> LINEAGE_LINKED_GEDCOM_FILE:
+    """
+    reads a whole lineage-linked GEDCOM file (see iter_records for reading one record at a time).
+    """
+    ex = LINEAGE_LINKED_GEDCOM_FILE()
+    ex.FORM_RECORDS = FORM_RECORDS()
+    ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs = list()
+    for record in iter_records(stream, encoding=encoding):
+        if isinstance(record, GEDCOM_HEADER):
+            ex.GEDCOM_HEADER = record
+        elif isinstance(record, HEADER_EXTENSION):
+            ex.GEDCOM_FORM_HEADER_EXTENSION = record
+        elif isinstance(record, SUBMITTER_RECORD):
+            ex.FORM_RECORDS.SUBMITTER_RECORD = record
+        elif isinstance(record, LINEAGE_LINKED_RECORDs.LINEAGE_LINKED_RECORD):
+            ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs.append(record)
+        elif isinstance(record, GEDCOM_TRAILER):
+            ex.GEDCOM_TRAILER = record
+        else:
+            logger.warning(f"<unplaced-record:{record.__class__.__qualname__}>")
+    return ex
+
+
+def split_ranges(path: Union[str, pathlib.Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    cuts path into (at most) parts byte ranges, each starting at a level 0 line.
+    """
+    with pathlib.Path(path).open("rb") as stream:
+        size = os.fstat(stream.fileno()).st_size
+        if not size:
+            return list()
+        cuts = [0]
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for part in range(1, parts):
+                if (found := view.find(b"\n0 ", max(cuts[-1], part * size // parts - 1))) < 0:
+                    break
+                if found + 1 > cuts[-1]:
+                    cuts.append(found + 1)
+    return list(zip(cuts, cuts[1:] + [size]))
+
+
+def parse_range(path: str, start: int, end: int, encoding: str = "utf-8-sig") -> List[Substructure]:
+    with open(path, "rb") as stream:
+        stream.seek(start)
+        text = stream.read(end - start).decode(encoding)
+    return list(iter_records(io.StringIO(text)))
+
+
+def parse_parallel(
+    path: Union[str, pathlib.Path],
+    workers: Optional[int] = None,
+    *,
+    chunk_size: int = 1 << 22,
+    encoding: str = "utf-8-sig",
+) -> Iterator[Substructure]:
+    """
+    yields the records of path (like iter_records), parsed in worker processes a byte range (of about chunk_size) each.
+    NOTE: records are yielded in file order, with at most 2 ranges per worker parsed ahead.
+    NOTE: records are pickled back from the workers, so a single worker parses in this process instead.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        with pathlib.Path(path).open("rb") as stream:
+            yield from iter_records(stream, encoding=encoding)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    size = pathlib.Path(path).stat().st_size
+    ranges = split_ranges(path, max(workers, -(-size // chunk_size)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for start, end in ranges:
+                pending.append(executor.submit(parse_range, str(path), start, end, encoding))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+__all__ = [
+    "GEDCOM_NODE",
+    "date_arguments",
+    "iter_lines",
+    "iter_nodes",
+    "iter_records",
+    "parse_parallel",
+    "read_file",
+    "reflect_routes",
+    "routes",
+    "split_ranges",
+]
@@ -0,0 +1,159 @@
+import logging
+from collections import namedtuple
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..common import GEDCOM_LINES, XREF_ID, Common, Substructure
+from ..configure import configure
+from . import primitives
+from .lineage_linked_gedcom_file import GEDCOM_HEADER, LINEAGE_LINKED_GEDCOM_FILE
+from .reader import GEDCOM_NODE, GRAMMAR, HEADER_EXTENSION, POINTER, iter_nodes, iter_records
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+SizeViolation = namedtuple("SizeViolation", ("xref_id", "tag", "primitive", "length", "size", "value"))
+TagViolation = namedtuple("TagViolation", ("xref_id", "context", "tag", "reason"))
+
+
+def size_table(module) -> Dict[type, Tuple[int, int]]:
+    """
+    the Size every class of module declares (not the ones it inherits).
+    """
+    return {
+        cls: cls.__dict__["Size"]
+        for cls in vars(module).values()
+        if isinstance(cls, type) and issubclass(cls, Common) and "Size" in cls.__dict__
+    }
+
+
+SIZES = size_table(primitives)
+# the Size that applies to a class (through the first of its bases in SIZES), see size_of
+_sizes: Dict[type, Optional[Tuple[int, int]]] = dict()
+
+
+def size_of(cls: type) -> Optional[Tuple[int, int]]:
+    if (size := _sizes.get(cls, False)) is False:
+        size = _sizes[cls] = next((SIZES[base] for base in cls.__mro__ if base in SIZES), None)
+    return size
+
+
+class SizeCheckingLines(GEDCOM_LINES):
+    """
+    takes the place of GEDCOM_LINES when walking a structure, checking the value and xref id of every line against
+    the Size of its primitive instead of keeping the line. violations are collected (with the xref id of the record
+    they are in), so one walk finds all of them.
+    """
+
+    __slots__ = ("record", "violations")
+
+    def __init__(self):
+        super().__init__()
+        self.record: Optional[str] = None
+        self.violations: List[SizeViolation] = list()
+
+    def check(self, tag: str, value: Common):
+        if (size := size_of(value.__class__)) is None:
+            return
+        text = str(value)
+        if not size[0] <= len(text) <= size[1]:
+            name = next(base for base in value.__class__.__mro__ if base in SIZES).__name__
+            self.violations.append(SizeViolation(self.record, tag, name, len(text), size, text))
+
+    def add_primitives(self, level_delta: int, tag: str, *primitives: Optional[Common], xref_id: XREF_ID = None):
+        if level_delta == 0:
+            self.record = None if xref_id is None else str(xref_id)
+        if xref_id is not None:
+            self.check(tag, xref_id)
+        for primitive in primitives:
+            if primitive:
+                self.check(tag, primitive)
+
+
+def iter_violations(structures: Iterable[Substructure]) -> Iterator[SizeViolation]:
+    """
+    yields every Size violation in structures (e.g. the records iter_records yields), one structure at a time.
+    a structure that cannot be walked is logged and skipped.
+    """
+    lines = SizeCheckingLines()
+    for structure in structures:
+        lines.record = None
+        try:
+            structure(lines=lines)
+        except Exception as e:
+            logger.warning(f"<not-validated:{structure.__class__.__qualname__}:{lines.record}:{e}>")
+        yield from lines.violations
+        lines.violations.clear()
+
+
+def validate(structure: Substructure) -> List[SizeViolation]:
+    """
+    every Size violation in structure (e.g. a whole LINEAGE_LINKED_GEDCOM_FILE), found in one walk.
+    """
+    return list(iter_violations((structure,)))
+
+
+def validate_stream(stream: IO, *, encoding: str = "utf-8-sig") -> Iterator[SizeViolation]:
+    """
+    yields every Size violation in the GEDCOM file stream, reading one record at a time.
+    """
+    yield from iter_violations(iter_records(stream, encoding=encoding))
+
+
+def fitting_rule(rules: tuple, node: GEDCOM_NODE):
+    """
+    the rule (see grammar.py) for node, picked like reader.select_route picks a route.
+    """
+    is_pointer = bool(node.line_value and POINTER.match(node.line_value))
+    for rule in rules:
+        if bool(node.xref_id) == (rule.kind == "POINTER") and is_pointer == (rule.kind == "XREF"):
+            return rule
+    return rules[0]
+
+
+def iter_tag_violations(
+    nodes: Iterable[GEDCOM_NODE], context: str, xref_id: Optional[str], fallback: Optional[str] = None
+) -> Iterator[TagViolation]:
+    """
+    yields the lines of nodes (and of their children) the GRAMMAR of context does not allow:
+    "unknown" tags and "repeated" lines of which at most one is allowed.
+    NOTE: lines the GRAMMAR of context does not know are looked up in fallback (the header extension below HEAD).
+    """
+    seen = set()
+    for node in nodes:
+        node_context = context
+        if (rules := GRAMMAR[context].get(node.tag)) is None and fallback:
+            node_context, rules = fallback, GRAMMAR[fallback].get(node.tag)
+        if rules is None:
+            yield TagViolation(xref_id, node_context, node.tag, "unknown")
+            continue
+        rule = fitting_rule(rules, node)
+        if rule.cardinality[1] == 1:
+            if rule.qualname in seen:
+                yield TagViolation(xref_id, node_context, node.tag, "repeated")
+            seen.add(rule.qualname)
+        if node.children:
+            below = HEADER_EXTENSION.__qualname__ if rule.qualname == GEDCOM_HEADER.HEAD.__qualname__ else None
+            yield from iter_tag_violations(node.children, rule.qualname, xref_id, below)
+
+
+def validate_tags(stream: IO, *, encoding: str = "utf-8-sig") -> Iterator[TagViolation]:
+    """
+    yields every line of the GEDCOM file stream its place does not allow, with dict lookups in GRAMMAR only
+    (without creating the schema classes), reading one record at a time.
+    """
+    for node in iter_nodes(stream, encoding=encoding):
+        yield from iter_tag_violations((node,), LINEAGE_LINKED_GEDCOM_FILE.__qualname__, node.xref_id)
+
+
+__all__ = [
+    "SIZES",
+    "SizeCheckingLines",
+    "SizeViolation",
+    "TagViolation",
+    "iter_tag_violations",
+    "iter_violations",
+    "size_of",
+    "validate",
+    "validate_stream",
+    "validate_tags",
+]
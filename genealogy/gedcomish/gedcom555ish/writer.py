@@ -0,0 +1,117 @@
+import codecs
+import copy
+import functools
+import io
+import logging
+import os
+from collections import deque
+from typing import IO, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from ..common import Substructure, nested_order
+from ..configure import configure
+from .lineage_linked_gedcom_file import FORM_RECORDS, GEDCOM_TRAILER, LINEAGE_LINKED_GEDCOM_FILE
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+
+def split_records(
+    gedcom_file: LINEAGE_LINKED_GEDCOM_FILE,
+) -> Tuple[LINEAGE_LINKED_GEDCOM_FILE, List[Substructure], Optional[GEDCOM_TRAILER]]:
+    """
+    splits gedcom_file (without modifying it) into what is written before the records (a shallow copy of gedcom_file),
+    the FORM_RECORDS.LINEAGE_LINKED_RECORDs (in the order they are written) and the trailer.
+    """
+    shell = copy.copy(gedcom_file)
+    trailer = vars(shell).pop("GEDCOM_TRAILER", None)
+    records: List[Substructure] = list()
+    if isinstance(form_records := vars(shell).get("FORM_RECORDS"), FORM_RECORDS):
+        shell.FORM_RECORDS = copy.copy(form_records)
+        # NOTE: sorted like Substructure.walk sorts them (stable, so by class first and then in list order)
+        records = [
+            record
+            for (_, level_offset), record in sorted(
+                (
+                    (nested_order(FORM_RECORDS, record.__class__), record)
+                    for record in vars(shell.FORM_RECORDS).pop("LINEAGE_LINKED_RECORDs", None) or list()
+                    if isinstance(record, Substructure)
+                ),
+                key=lambda order_record: order_record[0][0],
+            )
+            if level_offset is not None
+        ]
+    return shell, records, trailer
+
+
+def render_records(records: List[Substructure], *, encoding: str = "utf-8", state=None) -> bytes:
+    """
+    the lines of records (level 0 records, rendered at level 0), encoded continuing from the encoder state.
+    """
+    encoder = codecs.getincrementalencoder(encoding)()
+    if state is not None:
+        encoder.setstate(state)
+    return b"".join(encoder.encode(line) for record in records for line in record.iter_lines())
+
+
+def map_in_order(function: Callable, items: Iterable, workers: int) -> Iterator:
+    """
+    yields function(item) for each item in order, computed in worker processes (in this process for a single worker).
+    NOTE: at most 2 items per worker are in flight.
+    """
+    if workers == 1:
+        yield from map(function, items)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def write_parallel(
+    gedcom_file: LINEAGE_LINKED_GEDCOM_FILE,
+    stream: IO,
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    encoding: str = "utf-8",
+):
+    """
+    writes gedcom_file to the binary stream like write_to does (byte for byte),
+    with the records rendered and encoded in worker processes, chunk_size records at a time.
+    """
+    workers = workers or os.cpu_count() or 1
+    shell, records, trailer = split_records(gedcom_file)
+    writer = stream if isinstance(stream, io.BufferedIOBase) else io.BufferedWriter(stream)
+    encoder = codecs.getincrementalencoder(encoding)()
+    # NOTE: a byte order mark (if any) is written here, the workers continue from the state after it
+    writer.write(encoder.encode(""))
+    for line in shell.iter_lines():
+        writer.write(encoder.encode(line))
+    chunks = (records[start : start + chunk_size] for start in range(0, len(records), chunk_size))
+    render = functools.partial(render_records, encoding=encoding, state=encoder.getstate())
+    for rendered in map_in_order(render, chunks, workers):
+        writer.write(rendered)
+    if trailer is not None:
+        for line in trailer.iter_lines():
+            writer.write(encoder.encode(line))
+    writer.write(encoder.encode("", final=True))
+    writer.flush()
+    if writer is not stream:
+        writer.detach()
+
+
+__all__ = [
+    "map_in_order",
+    "split_records",
+    "write_parallel",
+]
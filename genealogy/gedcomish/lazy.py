@@ -0,0 +1,30 @@
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    the module name, executed on the first access of one of its attributes instead of now (see
+    importlib.util.LazyLoader), None if it is not installed. a module that is already imported is returned as it is.
+    NOTE: for optional dependencies (numpy) and heavy modules only some code paths need (the schema classes).
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    # NOTE: the parent packages are imported (by find_spec)
+    if (spec := importlib.util.find_spec(name)) is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+__all__ = [
+    "lazy_import",
+]
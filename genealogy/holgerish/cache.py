@@ -0,0 +1,68 @@
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+from typing import Any, Optional
+
+from .configure import configure
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """
+    parse results on disk (pickled), content addressed by a hash of the version of the parser and the text parsed,
+    so a result is found again as long as neither changes (and nothing has to be invalidated).
+    counts the hits and misses of get.
+    """
+
+    def __init__(self, directory: pathlib.Path, version: str):
+        self.directory = pathlib.Path(directory)
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, text: str) -> pathlib.Path:
+        key = hashlib.sha256(f"{self.version}\0{text}".encode("utf-8", "surrogatepass")).hexdigest()
+        return self.directory / key[0:2] / f"{key}.pickle"
+
+    def get(self, text: str) -> Optional[Any]:
+        path = self.path(text)
+        try:
+            with path.open("rb") as stream:
+                result = pickle.load(stream)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"unreadable cache entry {path}: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, text: str, result: Any):
+        path = self.path(text)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: written to a temporary file first, so a reader never sees a partial entry
+        fd, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                pickle.dump(result, stream, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return f"parse cache {self.directory}: {self.hits} hits, {self.misses} misses ({ratio:.1%} hits)"
+
+
+__all__ = [
+    "ParseCache",
+]
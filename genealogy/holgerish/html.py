@@ -1,54 +1,34 @@
 import argparse
+import codecs
+import contextlib
 import copy
 import datetime
+import functools
+import hashlib
 import itertools
+import json
+import locale
 import logging
+import mmap
+import os
 import pathlib
 import re
 import socket
-import uuid
 from collections import OrderedDict, defaultdict, namedtuple
 from difflib import SequenceMatcher
-from typing import DefaultDict, Dict, List, Optional, Set
-
-import importlib.metadata
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from .cache import ParseCache
 from .configure import configure
-from genealogy.gedcomish.common import GEDCOM_LINES, NULL
-from genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
-    ADDRESS_STRUCTURE,
-    ASSOCIATION_STRUCTURE,
-    CHANGE_DATE,
-    CHIL,
-    CHILD_TO_FAMILY_LINK,
-    EVENT_DETAIL,
-    FAMILY_EVENT_DETAIL,
-    FORM_RECORDS,
-    GEDCOM_HEADER,
-    GEDCOM_TRAILER,
-    INDIVIDUAL_EVENT_DETAIL,
-    LINEAGE_LINKED_GEDCOM_FILE,
-    MULTIMEDIA_LINK,
-    PERSONAL_NAME_PIECES,
-    PERSONAL_NAME_STRUCTURE,
-    PLACE_STRUCTURE,
-    REFN,
-    SOURCE_CITATION,
-    SOURCE_REPOSITORY_CITATION,
-    SPOUSE_TO_FAMILY_LINK,
-    SUBMITTER_RECORD,
-    EVENs,
-    FAMILY_EVENT_STRUCTUREs,
-    GEDCOM_FORM_HEADER_EXTENSIONs,
-    INDIVIDUAL_ATTRIBUTE_STRUCTUREs,
-    INDIVIDUAL_EVENT_STRUCTUREs,
-    LINEAGE_LINKED_RECORDs,
-    NOTE_STRUCTUREs,
-    TEXTs,
-)
-from genealogy.gedcomish.gedcom555ish.primitives import XREF_FAM, XREF_INDI, XREF_SUBM
+from .matching import match, score_matrix
+from genealogy.gedcomish.lazy import lazy_import
+
+# NOTE: loaded on first use, so that --help and the worker processes splitting family sections do without them
+common = lazy_import("genealogy.gedcomish.common")
+primitives = lazy_import("genealogy.gedcomish.gedcom555ish.primitives")
+schema = lazy_import("genealogy.gedcomish.gedcom555ish.lineage_linked_gedcom_file")
 
-configure()
+configure(lazy=True)
 logger = logging.getLogger(__name__)
 
 
@@ -254,6 +234,58 @@ PERSONREGISTRY_PERSON_REGEX = re.compile(
 
 IGNORE = re.compile(r"^<A\sNAME=[0-9]+>$")
 
+# what each kind of entry (FAMILY_PERSON_REGEX, FAMILY_RELATION_REGEX and FAMILY_UNION_REGEX) must start with
+# NOTE: the leads exclude each other, so one match tells which (if any) of the entry regexes may match
+LEAD_REGEX = re.compile(
+    r"""
+        ^
+        (?P<PERSON>\s*([*]\s*)?<B>)
+        |(?P<RELATION>\s*(Gift|Sambo|Relation|Förlovad|Trolovad|Partner|Särbo))
+        |(?P<UNION>Barn[:\s])
+    """,
+    re.VERBOSE,
+)
+# NOTE: more than any lead needs (of trimmed text)
+LEAD_LENGTH = 64
+ENTRY_REGEXES = {
+    "PERSON": FAMILY_PERSON_REGEX,
+    "RELATION": FAMILY_RELATION_REGEX,
+    "UNION": FAMILY_UNION_REGEX,
+}
+
+
+def unanchored(regex):
+    """
+    regex without its leading ^: unanchored(regex).match(text, pos) is regex.match(text[pos:]), without the slice
+    (as long as regex neither looks behind nor at word boundaries).
+    """
+    pattern = regex.pattern.lstrip()
+    assert pattern.startswith("^"), regex
+    return re.compile(pattern[1:], regex.flags)
+
+
+# where the rest of an unrecognized paragraph may be recognized from: a lead (LEAD_REGEX) or what IGNORE matches
+RESYNC_REGEX = re.compile(
+    r"""
+        (?P<PERSON>\s*([*]\s*)?<B>)
+        |(?P<RELATION>\s*(Gift|Sambo|Relation|Förlovad|Trolovad|Partner|Särbo))
+        |(?P<UNION>Barn[:\s])
+        |(?P<IGNORE><A\sNAME=)
+    """,
+    re.VERBOSE,
+)
+RESYNC_REGEXES = {
+    "PERSON": unanchored(FAMILY_PERSON_REGEX),
+    "RELATION": unanchored(FAMILY_RELATION_REGEX),
+    "UNION": unanchored(FAMILY_UNION_REGEX),
+    "IGNORE": unanchored(IGNORE),
+}
+# what must follow the lead for the regex to match (backtracking on false leads is costly without it)
+RESYNC_REQUIRES = {
+    "PERSON": "</B>",
+    "RELATION": "med",
+}
+
 
 def section_parts(sections: list, heading):
     for section in sections:
@@ -275,6 +307,14 @@ def section_parts(sections: list, heading):
                 logger.warning(f"empty line in {heading} at {line_no}: {line}")
 
 
+# the entries of a family section (split_section): the named groups of their regexes
+FamilyAdult = namedtuple("FamilyAdult", FAMILY_PERSON_REGEX.groupindex)
+FamilyChild = namedtuple("FamilyChild", FAMILY_PERSON_REGEX.groupindex)
+FamilyRelation = namedtuple("FamilyRelation", FAMILY_RELATION_REGEX.groupindex)
+FamilyUnion = namedtuple("FamilyUnion", FAMILY_UNION_REGEX.groupindex)
+FamilyUnionIds = namedtuple("FamilyUnionIds", ("parents", "children"))
+Family = namedtuple("Family", ("adults", "children", "unions", "relations", "unknowns"))
+
 RegistryDetail = namedtuple("RegistryDetail", ("detail",))
 RegistryLocation = namedtuple("RegistryLocation", ("location",))
 RegistryPerson = namedtuple("RegistryPerson", ("firstnames", "surnames", "birthday", "birthplace", "families"))
@@ -337,25 +377,90 @@ def refine_person_sections(sections: list) -> DefaultDict[int, List[RegistryPers
 Sections = namedtuple("Sections", ("family", "person", "location", "detail", "unknown", "source"))
 
 
-def find_sections(text) -> Sections:
-    sections = re.split("<HR WIDTH=500>", text)
+SECTION_SEPARATOR = "<HR WIDTH=500>"
+# the headings of the sections that are not family sections, by the field of Sections they are collected in
+SECTION_HEADINGS = {"detail": SAKREGISTER, "location": ORTREGISTER, "person": PERSONREGISTER}
+
+
+def classify_section(section: str) -> Tuple[str, Optional[str], str]:
+    """
+    the field of Sections section belongs in (or "unknown") and its family id (if a family section), and section.
+    """
+    for kind, heading in SECTION_HEADINGS.items():
+        if heading in section:
+            return kind, None, section
+    if m := FAMILY_REGEX.search(section):
+        return "family", m["ID"], section
+    return "unknown", None, section
+
+
+def iter_sections(path: pathlib.Path, encoding: Optional[str] = None) -> Iterator[Tuple[str, Optional[str], str]]:
+    """
+    classify_section of every section of the file at path, one at a time:
+    the file is memory-mapped, the separators and headings are found in its bytes and only each section is decoded
+    (with newlines translated as by read_text).
+    NOTE: for encodings that do not encode them as ascii (e.g. utf-16), the whole text is read and split instead.
+    """
+    encoding = encoding or locale.getpreferredencoding(False)
+    separator = SECTION_SEPARATOR.encode("ascii")
+    headings = {kind: heading.encode("ascii") for kind, heading in SECTION_HEADINGS.items()}
+    if any(
+        text.encode("ascii").decode(encoding, errors="replace") != text
+        for text in (SECTION_SEPARATOR, *SECTION_HEADINGS.values(), FAMILY_REGEX.pattern)
+    ):
+        yield from map(classify_section, pathlib.Path(path).read_text(encoding=encoding).split(SECTION_SEPARATOR))
+        return
+    family_regex = re.compile(FAMILY_REGEX.pattern.encode("ascii"), FAMILY_REGEX.flags & ~re.UNICODE)
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    def decode(data: bytes, final: bool) -> str:
+        return decoder.decode(data, final).replace("\r\n", "\n").replace("\r", "\n")
+
+    with open(path, "rb") as stream:
+        if not os.fstat(stream.fileno()).st_size:
+            yield classify_section("")
+            return
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while True:
+                end = mapped.find(separator, start)
+                last = end == -1
+                end = len(mapped) if last else end
+                for kind, heading in headings.items():
+                    if mapped.find(heading, start, end) != -1:
+                        yield kind, None, decode(mapped[start:end], last)
+                        break
+                else:
+                    if m := family_regex.search(mapped, start, end):
+                        yield "family", m["ID"].decode("ascii"), decode(mapped[start:end], last)
+                    else:
+                        yield "unknown", None, decode(mapped[start:end], last)
+                if last:
+                    break
+                start = end + len(separator)
+
+
+def collect_sections(sections: Iterable[Tuple[str, Optional[str], str]]) -> Sections:
+    """
+    the classified sections (classify_section) collected by kind, the family sections by their id.
+    """
     family_sections: Dict[int, str] = dict()
     person_sections: List[str] = list()
     detail_sections: List[str] = list()
     location_sections: List[str] = list()
     unknown_sections: List[str] = list()
-    for section in sections:
-        if SAKREGISTER in section:
+    for kind, fam_id, section in sections:
+        if kind == "detail":
             detail_sections.append(section)
-        elif ORTREGISTER in section:
+        elif kind == "location":
             location_sections.append(section)
-        elif PERSONREGISTER in section:
+        elif kind == "person":
             person_sections.append(section)
-        elif m := FAMILY_REGEX.search(section):
-            if m["ID"] in family_sections:
+        elif kind == "family":
+            if fam_id in family_sections:
                 raise ValueError(f"FAMILY: duplicate id: {section}")
-            elif m["ID"]:
-                family_sections[int(m["ID"])] = section
+            elif fam_id:
+                family_sections[int(fam_id)] = section
             else:
                 raise ValueError(f"FAMILY: missing id: {section}")
         else:
@@ -371,6 +476,17 @@ def find_sections(text) -> Sections:
     )
 
 
+def find_sections(text) -> Sections:
+    return collect_sections(map(classify_section, re.split(SECTION_SEPARATOR, text)))
+
+
+def read_sections(path: pathlib.Path, encoding: Optional[str] = None) -> Sections:
+    """
+    find_sections of the file at path, without reading it all into memory first (iter_sections).
+    """
+    return collect_sections(iter_sections(path, encoding))
+
+
 def index_sections(sections: Sections) -> DefaultDict[int, Sections]:
     details = refine_detail_sections(sections.detail)
     locations = refine_location_sections(sections.location)
@@ -398,48 +514,79 @@ def trim(part):
     return " ".join(subpart.strip() for subpart in part.split())
 
 
-def unrecognized(text):
-    return not any(
-        [
-            FAMILY_PERSON_REGEX.match(text),
-            FAMILY_UNION_REGEX.match(text),
-            FAMILY_RELATION_REGEX.match(text),
-            IGNORE.match(text),
-        ]
-    )
+def classify(text) -> Optional[str]:
+    """
+    the kind of entry (a key of ENTRY_REGEXES) text may be, None if it can not be any of them.
+    """
+    if match := LEAD_REGEX.match(text, 0, LEAD_LENGTH):
+        return match.lastgroup
+    return None
 
 
-def lookahead_match(*, part_no, parts, current, regex):
-    # check if there are more information in the following paragraph that belongs to the person
-    merge = None
-    merge_match = None
-    merge_lookahead = None
+def unrecognized(text):
+    if (kind := classify(text)) and ENTRY_REGEXES[kind].match(text):
+        return False
+    return not IGNORE.match(text)
 
-    if (part_no + 1 == len(parts)) and (match := regex.match(current)):
-        merge = current
-        merge_match = match
-        merge_lookahead = part_no + 1
+
+def resync(text) -> Optional[int]:
+    """
+    the first offset that text is recognized from (the least start for which unrecognized(text[start:]) is False),
+    None if there is none.
+    one scan: RESYNC_REGEX skips to the offsets where something may start,
+    and only the regex of what starts there is matched in place (if what it requires is still ahead).
+    """
+    last = {kind: text.rfind(required) for kind, required in RESYNC_REQUIRES.items()}
+    pos = 0
+    while match := RESYNC_REGEX.search(text, pos):
+        start = match.start()
+        kind = match.lastgroup
+        if last.get(kind, len(text)) >= match.end() and RESYNC_REGEXES[kind].match(text, start):
+            return start
+        pos = start + 1
+    return None
+
+
+def lookahead_matches(*, part_no, parts, recognized) -> Dict[str, Optional[tuple]]:
+    """
+    checks if there are more information in the following paragraphs that belongs to the entry at part_no,
+    for every kind of entry at once:
+    the merge is extended one paragraph at a time and classified by its lead,
+    so only the regex of its kind is tried (and none, once the lead can not change any more).
+    recognized(end) tells if the paragraphs from end on are recognized (memoize it per section).
+    returns the kind of entry mapped to (remains, value, nof_lookahead) or None.
+    """
+    current = parts[part_no]
+    found: Dict[str, Optional[tuple]] = dict.fromkeys(ENTRY_REGEXES)
+    if part_no + 1 == len(parts):
+        if (kind := classify(current)) and (match := ENTRY_REGEXES[kind].match(current)):
+            found[kind] = (current, match, part_no + 1)
     else:
+        pending = set(ENTRY_REGEXES)
+        merge = current
         for end in range(part_no + 1, len(parts)):
-            trial_merge = trim(" ".join((current, " ".join(parts[part_no + 1 : end]))))
-            remains = trim(" ".join(parts[end:]))
-            if match := regex.match(trial_merge):
-                merge = trial_merge
-                merge_match = match
-                merge_lookahead = end
-                if unrecognized(remains):
-                    continue
-                else:
-                    break
-    if merge and merge_match:
-        value = merge_match.groupdict()
-        remains = trim(merge[0 : merge_match.start()] + merge[merge_match.end() :])
-        nof_lookahead = merge_lookahead - (part_no + 1)
-        if nof_lookahead > 0:
-            logger.debug(f"MERGE {nof_lookahead} lookaheads:\n{value}")
-        return remains, value, nof_lookahead
-    else:
-        return None
+            if end > part_no + 1:
+                merge = f"{merge} {parts[end - 1]}"
+            kind = classify(merge)
+            if len(merge) >= LEAD_LENGTH:
+                pending &= {kind}
+            if kind in pending and (match := ENTRY_REGEXES[kind].match(merge)):
+                found[kind] = (merge, match, end)
+                if recognized(end):
+                    pending.discard(kind)
+            if not pending:
+                break
+    results: Dict[str, Optional[tuple]] = dict.fromkeys(ENTRY_REGEXES)
+    for kind, merged in found.items():
+        if merged:
+            merge, merge_match, merge_lookahead = merged
+            value = merge_match.groupdict()
+            remains = trim(merge[0 : merge_match.start()] + merge[merge_match.end() :])
+            nof_lookahead = merge_lookahead - (part_no + 1)
+            if nof_lookahead > 0:
+                logger.debug(f"MERGE {nof_lookahead} lookaheads:\n{value}")
+            results[kind] = (remains, value, nof_lookahead)
+    return results
 
 
 def split_section(fam_id, source):
@@ -457,6 +604,10 @@ def split_section(fam_id, source):
         assert FAMILY_REGEX.search(parts[0])
         start = 1
 
+    @functools.lru_cache(maxsize=None)
+    def recognized(end):
+        return not unrecognized(" ".join(parts[end:]))
+
     adults = list()
     children = list()
     unions = list()
@@ -479,14 +630,8 @@ def split_section(fam_id, source):
         else:
             break
         if current:
-            person = lookahead_match(part_no=part_no, parts=parts, current=current, regex=FAMILY_PERSON_REGEX)
-            relation = lookahead_match(part_no=part_no, parts=parts, current=current, regex=FAMILY_RELATION_REGEX)
-            union = lookahead_match(
-                part_no=part_no,
-                parts=parts,
-                current=current,
-                regex=FAMILY_UNION_REGEX,
-            )
+            matches = lookahead_matches(part_no=part_no, parts=parts, recognized=recognized)
+            person, relation, union = matches["PERSON"], matches["RELATION"], matches["UNION"]
             if person and not relation and not union:
                 # person entry
                 remains, value, nof_lookahead = person
@@ -497,10 +642,10 @@ def split_section(fam_id, source):
                 if any("CORRUPT" in fieldkey for fieldkey, fieldval in value.items() if fieldval):
                     logger.warning(f"CORRUPTION:{fam_id}:\n{value}\n")
                 if value["IS_CHILD"]:
-                    children.append((part_no, namedtuple("child", value.keys())(**value)))
+                    children.append((part_no, FamilyChild(**value)))
                     logger.debug(f"added child:{fam_id}:\n{children[-1]}\n")
                 else:
-                    adults.append((part_no, namedtuple("adult", value.keys())(**value)))
+                    adults.append((part_no, FamilyAdult(**value)))
                     logger.debug(f"added adult:{fam_id}:\n{adults[-1]}\n")
                 continue
             if relation and not person and not union:
@@ -510,7 +655,7 @@ def split_section(fam_id, source):
                     logger.warning(f"match has remains:{relation}")
                 for _ in range(0, nof_lookahead):
                     current_part = next(part_it, None)
-                relations.append((part_no, namedtuple("relation", value.keys())(**value)))
+                relations.append((part_no, FamilyRelation(**value)))
                 logger.debug(f"added relation:{fam_id}:\n{relations[-1]}\n")
                 continue
             if union and not person and not relation:
@@ -520,46 +665,87 @@ def split_section(fam_id, source):
                     logger.warning(f"match has remains:{union}")
                 for _ in range(0, nof_lookahead):
                     current_part = next(part_it, None)
-                unions.append((part_no, namedtuple("union", value.keys())(**value)))
+                unions.append((part_no, FamilyUnion(**value)))
                 logger.debug(f"added union:{fam_id}:\n{unions[-1]}\n")
                 continue
             if current.strip():
                 if IGNORE.match(current):
                     pass
                 else:
-                    for start in range(0, len(current)):
-                        if unrecognized(current[start:]):
-                            continue
-                        else:
-                            unknowns.append((part_no, current[0:start]))
-                            logger.warning(f"added unknown:{fam_id}:\n{unknowns[-1]}\ncontext:\n{current}\n")
-                            logger.debug(f"added unknown:{fam_id}:\n{unknowns[-1]}\n")
-                            remains = current[start:]
-                            break
-                    if current == remains:
-                        raise NotImplementedError()
-    family_values = {
-        "adults": adults,
-        "children": children,
-        "unions": unions,
-        "relations": relations,
-        "unknowns": unknowns,
-    }
-    return namedtuple("family", family_values.keys())(**family_values)
-
-
-def split_sections(text, registry) -> DefaultDict[int, Sections]:
-    indexed_sections = index_sections(find_sections(text))
+                    if (offset := resync(current)) == 0:
+                        # NOTE: recognized from its start, but not as an entry (see lookahead_matches), so kept whole
+                        unknowns.append((part_no, current))
+                        logger.warning(f"added unknown (not an entry):{fam_id}:\n{unknowns[-1]}\n")
+                    elif offset is not None:
+                        unknowns.append((part_no, current[0:offset]))
+                        logger.warning(f"added unknown:{fam_id}:\n{unknowns[-1]}\ncontext:\n{current}\n")
+                        logger.debug(f"added unknown:{fam_id}:\n{unknowns[-1]}\n")
+                        remains = current[offset:]
+    return Family(adults=adults, children=children, unions=unions, relations=relations, unknowns=unknowns)
+
+
+def split_family_sections(families: List[Tuple[int, str]]) -> List[Tuple[int, Family]]:
+    """
+    split_section of every (fam_id, family section) (a chunk of them, in a worker process).
+    """
+    return [(fam_id, split_section(fam_id, source)) for fam_id, source in families]
+
+
+def parser_version() -> str:
+    """
+    a hash of this module, so parse results (ParseCache) of other versions of the parser are not used.
+    """
+    return hashlib.sha256(pathlib.Path(__file__).read_bytes()).hexdigest()
+
+
+def split_sections(
+    text, registry, *, workers: Optional[int] = 1, chunk_size: int = 64, cache: Optional[ParseCache] = None
+) -> DefaultDict[int, Sections]:
+    """
+    the sections of text, with the family sections split (split_found_sections).
+    """
+    return split_found_sections(find_sections(text), workers=workers, chunk_size=chunk_size, cache=cache)
+
+
+def split_found_sections(
+    sections: Sections, *, workers: Optional[int] = 1, chunk_size: int = 64, cache: Optional[ParseCache] = None
+) -> DefaultDict[int, Sections]:
+    """
+    the sections found (find_sections, read_sections), indexed and with the family sections split (split_section),
+    in worker processes chunk_size at a time for more than one worker (None for one per cpu).
+    family sections found in cache are not split again, the others are added to it.
+    """
+    workers = workers or os.cpu_count() or 1
+    indexed_sections = index_sections(sections)
+    families: Dict[int, Family] = dict()
+    if cache is not None:
+        for fam_id, data in indexed_sections.items():
+            if (family := cache.get(data.family)) is not None:
+                families[fam_id] = family
+    pending = [(fam_id, data.family) for fam_id, data in indexed_sections.items() if fam_id not in families]
+    chunks = [pending[start : start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    with contextlib.ExitStack() as stack:
+        if workers == 1 or len(chunks) < 2:
+            split_chunks = map(split_family_sections, chunks)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            split_chunks = executor.map(split_family_sections, chunks)
+        for fam_id, family in itertools.chain.from_iterable(split_chunks):
+            if cache is not None:
+                cache.put(indexed_sections[fam_id].family, family)
+            families[fam_id] = family
     split_sections = defaultdict(Sections)
     for fam_id, data in indexed_sections.items():
         if fam_id in split_sections:
             raise ValueError(f"Parser failure: family already present! {data}")
         logger.debug(f"family:{data}")
         section = Sections(
-            family=split_section(fam_id, data.family),
-            person=indexed_sections[fam_id].person,
-            location=indexed_sections[fam_id].location,
-            detail=indexed_sections[fam_id].detail,
+            family=families[fam_id],
+            person=data.person,
+            location=data.location,
+            detail=data.detail,
             unknown=None,
             source=data.family,
         )
@@ -573,43 +759,34 @@ def partner_similarity(reg_person: RegistryPerson, union):
     return SequenceMatcher(None, v if (v := union.PARTNER_NAME) else "", reg_name).ratio()
 
 
-def person_similarity(reg_person: RegistryPerson, fam_person, weight=2.0):
-    score = (
-        SequenceMatcher(
-            None, v if (v := fam_person.BIRTHDAY) else "", "".join(v) if (v := reg_person.birthday) else ""
-        ).ratio()
-        * weight
-    )
-    score += (
-        SequenceMatcher(
-            None,
-            v if (v := fam_person.BIRTHDAY_CORRUPT) else "",
-            "".join(v) if (v := reg_person.birthday) else "",
-        ).ratio()
-        * weight
+# (family person field, registry person field, weighted) compared by person_similarities
+PERSON_SIMILARITY_FIELDS = (
+    ("BIRTHDAY", "birthday", True),
+    ("BIRTHDAY_CORRUPT", "birthday", True),
+    ("BIRTHPLACE", "birthplace", False),
+    ("FIRSTNAMES", "firstnames", False),
+    ("SECONDNAMES", "firstnames", False),
+    ("FIRSTNAMES", "surnames", False),
+    ("SECONDNAMES", "surnames", False),
+)
+# NOTE: of scores up to 9 (with the default weight), less than this is about half a name apart
+AMBIGUOUS_MARGIN = 0.5
+
+
+def person_similarities(reg_persons: List[RegistryPerson], fam_persons: list, weight=2.0) -> List[List[float]]:
+    """
+    the similarity of every family person (rows) to every registry person (columns), as one matrix (score_matrix).
+    """
+    return score_matrix(
+        [
+            (
+                [v if (v := getattr(fam_person, fam_field)) else "" for fam_person in fam_persons],
+                ["".join(v) if (v := getattr(reg_person, reg_field)) else "" for reg_person in reg_persons],
+                weight if weighted else 1.0,
+            )
+            for fam_field, reg_field, weighted in PERSON_SIMILARITY_FIELDS
+        ]
     )
-    score += SequenceMatcher(
-        None,
-        v if (v := fam_person.BIRTHPLACE) else "",
-        "".join(v) if (v := reg_person.birthplace) else "",
-    ).ratio()
-    score += SequenceMatcher(
-        None,
-        v if (v := fam_person.FIRSTNAMES) else "",
-        "".join(v) if (v := reg_person.firstnames) else "",
-    ).ratio()
-    score += SequenceMatcher(
-        None,
-        v if (v := fam_person.SECONDNAMES) else "",
-        "".join(v) if (v := reg_person.firstnames) else "",
-    ).ratio()
-    score += SequenceMatcher(
-        None, v if (v := fam_person.FIRSTNAMES) else "", "".join(v) if (v := reg_person.surnames) else ""
-    ).ratio()
-    score += SequenceMatcher(
-        None, v if (v := fam_person.SECONDNAMES) else "", "".join(v) if (v := reg_person.surnames) else ""
-    ).ratio()
-    return score
 
 
 def location_similarity(reg_location: RegistryLocation, fam_location):
@@ -681,7 +858,7 @@ def get_partners_by_marriage_numeral(*, fam_id, ids, union, section):
                 return tuple(
                     adult
                     for adult, adult_id in ids.items()
-                    if (adult_id in ids[(fam_id, relation)]) and (type(adult).__name__ == "adult")
+                    if (adult_id in ids[(fam_id, relation)]) and isinstance(adult, FamilyAdult)
                 )
             else:
                 continue
@@ -733,38 +910,126 @@ def get_children(*, section: Sections, part_before: int, part_after: Optional[in
     )
 
 
-def get_gedcom_individual(ids, fam_id, section, person):
-    indi_record = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD()
-    indi_record.INDI = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI(XREF_INDI(ids[person]))
+# the xref prefix of the entries that are individuals, all others (ids of relations and unions, family ids) are families
+INDIVIDUAL_ENTRIES = (RegistryPerson, FamilyAdult, FamilyChild)
+SUBMITTER_XREF = "U1"
+
+
+# the fields that identify an entry from one conversion to the next (the rest of its text may be corrected in between)
+# NOTE: the families a registry person is listed in tell persons of the same name and birthday apart
+IDENTIFYING_FIELDS = {
+    RegistryPerson: ("firstnames", "surnames", "birthday", "families"),
+    FamilyAdult: ("FIRSTNAMES", "SECONDNAMES", "BIRTHDAY"),
+    FamilyChild: ("FIRSTNAMES", "SECONDNAMES", "BIRTHDAY"),
+}
+
+
+def stable_key(key) -> str:
+    """
+    key as a string that is the same from one conversion to the next: the IDENTIFYING_FIELDS of an entry,
+    anything else as it is (the ids in relation and union keys are xrefs).
+    """
+    if (fields := IDENTIFYING_FIELDS.get(type(key))) is not None:
+        return f"{type(key).__name__}:{tuple(getattr(key, field) for field in fields)!r}"
+    return f"{type(key).__name__}:{key!r}"
+
+
+class Ids(dict):
+    """
+    the xrefs of parsed entries: short and sequential for each type (I1, I2, ... for individuals, F1, ... for families),
+    given the first time an entry is looked up (so in the order the conversion looks them up),
+    or as given in the id map (stable_key to xref) of a previous conversion, so they are kept from one to the next.
+    also keeps the registry persons of every xref, so finding them (registry_persons) does not search all entries.
+    """
+
+    def __init__(self, id_map: Optional[Dict[str, str]] = None):
+        super().__init__()
+        self.id_map: Dict[str, str] = dict(id_map or ())
+        self.last: DefaultDict[str, int] = defaultdict(int)
+        for xref in self.id_map.values():
+            if xref[1:].isdigit():
+                self.last[xref[0]] = max(self.last[xref[0]], int(xref[1:]))
+        # NOTE: dicts as ordered sets (the order the registry persons got their ids)
+        self.by_id: DefaultDict[str, Dict[RegistryPerson, None]] = defaultdict(dict)
+        # the number of entries given an xref for each stable key (entries may share their identifying fields)
+        self.occurrences: DefaultDict[str, int] = defaultdict(int)
+
+    def __missing__(self, key):
+        stable = stable_key(key)
+        self.occurrences[stable] += 1
+        if (occurrence := self.occurrences[stable]) > 1:
+            # NOTE: the entries alike in their identifying fields are told apart by the order they are looked up in
+            stable = f"{stable}#{occurrence}"
+        if (xref := self.id_map.get(stable)) is None:
+            prefix = "I" if isinstance(key, INDIVIDUAL_ENTRIES) else "F"
+            self.last[prefix] += 1
+            xref = f"{prefix}{self.last[prefix]}"
+            self.id_map[stable] = xref
+        self[key] = xref
+        return xref
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> "Ids":
+        """
+        Ids with the id map saved at path (if any).
+        """
+        return cls(json.loads(path.read_text(encoding="utf-8")) if path.exists() else None)
+
+    def save(self, path: pathlib.Path):
+        path.write_text(json.dumps(self.id_map, ensure_ascii=False, indent=0), encoding="utf-8")
+
+    def __setitem__(self, key, value):
+        moved = False
+        if isinstance(key, RegistryPerson):
+            if moved := key in self:
+                del self.by_id[self[key]][key]
+            self.by_id[value][key] = None
+        super().__setitem__(key, value)
+        if moved and len(persons := self.by_id[value]) > 1:
+            # NOTE: a person given another id keeps its place among the entries (rare, so they are searched for it)
+            position = {entry: no for no, entry in enumerate(self) if entry in persons}
+            self.by_id[value] = dict.fromkeys(sorted(persons, key=position.__getitem__))
+
+    def __delitem__(self, key):
+        if isinstance(key, RegistryPerson):
+            del self.by_id[self[key]][key]
+        super().__delitem__(key)
+
+    def registry_persons(self, person_id) -> List[RegistryPerson]:
+        """
+        the registry persons with the id person_id, in the order of the entries.
+        """
+        return list(self.by_id.get(person_id, ()))
+
+
+def get_gedcom_individual(ids, fam_id, section, person, sections):
+    indi_record = schema.LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD()
+    indi_record.INDI = schema.LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI(primitives.XREF_INDI(ids[person]))
     logger.debug(f"INDI using {ids[person]}")
 
-    for reg_person in (
-        reg_person
-        for reg_person, reg_person_id in ids.items()
-        if (reg_person_id == ids[person]) and isinstance(reg_person, RegistryPerson)
-    ):
+    for reg_person in ids.registry_persons(ids[person]):
         if reg_person.firstnames or reg_person.surnames:
             if not isinstance(indi_record.INDI.PERSONAL_NAME_STRUCTUREs, list):
                 indi_record.INDI.PERSONAL_NAME_STRUCTUREs = list()
 
             if reg_person.firstnames and reg_person.surnames:
-                name = PERSONAL_NAME_STRUCTURE()
-                name.NAME = PERSONAL_NAME_STRUCTURE.NAME(
+                name = schema.PERSONAL_NAME_STRUCTURE()
+                name.NAME = schema.PERSONAL_NAME_STRUCTURE.NAME(
                     " ".join(reg_person.firstnames) + "/" + " ".join(reg_person.surnames) + "/"
                 )
-                name.NAME.PERSONAL_NAME_PIECES = PERSONAL_NAME_PIECES()
-                name.NAME.PERSONAL_NAME_PIECES.GIVN = PERSONAL_NAME_PIECES.GIVN(" ".join(reg_person.firstnames))
-                name.NAME.PERSONAL_NAME_PIECES.SURN = PERSONAL_NAME_PIECES.SURN(" ".join(reg_person.surnames))
+                name.NAME.PERSONAL_NAME_PIECES = schema.PERSONAL_NAME_PIECES()
+                name.NAME.PERSONAL_NAME_PIECES.GIVN = schema.PERSONAL_NAME_PIECES.GIVN(" ".join(reg_person.firstnames))
+                name.NAME.PERSONAL_NAME_PIECES.SURN = schema.PERSONAL_NAME_PIECES.SURN(" ".join(reg_person.surnames))
             elif reg_person.firstnames:
-                name = PERSONAL_NAME_STRUCTURE()
-                name.NAME = PERSONAL_NAME_STRUCTURE.NAME(" ".join(reg_person.firstnames))
-                name.NAME.PERSONAL_NAME_PIECES = PERSONAL_NAME_PIECES()
-                name.NAME.PERSONAL_NAME_PIECES.GIVN = PERSONAL_NAME_PIECES.GIVN(" ".join(reg_person.firstnames))
+                name = schema.PERSONAL_NAME_STRUCTURE()
+                name.NAME = schema.PERSONAL_NAME_STRUCTURE.NAME(" ".join(reg_person.firstnames))
+                name.NAME.PERSONAL_NAME_PIECES = schema.PERSONAL_NAME_PIECES()
+                name.NAME.PERSONAL_NAME_PIECES.GIVN = schema.PERSONAL_NAME_PIECES.GIVN(" ".join(reg_person.firstnames))
             elif reg_person.surnames:
-                name = PERSONAL_NAME_STRUCTURE()
-                name.NAME = PERSONAL_NAME_STRUCTURE.NAME("/" + " ".join(reg_person.surnames) + "/")
-                name.NAME.PERSONAL_NAME_PIECES = PERSONAL_NAME_PIECES()
-                name.NAME.PERSONAL_NAME_PIECES.SURN = PERSONAL_NAME_PIECES.SURN(" ".join(reg_person.surnames))
+                name = schema.PERSONAL_NAME_STRUCTURE()
+                name.NAME = schema.PERSONAL_NAME_STRUCTURE.NAME("/" + " ".join(reg_person.surnames) + "/")
+                name.NAME.PERSONAL_NAME_PIECES = schema.PERSONAL_NAME_PIECES()
+                name.NAME.PERSONAL_NAME_PIECES.SURN = schema.PERSONAL_NAME_PIECES.SURN(" ".join(reg_person.surnames))
             else:
                 RuntimeError(reg_person)
 
@@ -775,10 +1040,10 @@ def get_gedcom_individual(ids, fam_id, section, person):
         if reg_person.birthday:
             if not isinstance(indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs, list):
                 indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs = list()
-            birth = INDIVIDUAL_EVENT_STRUCTUREs.BIRT()
-            birth.INDIVIDUAL_EVENT_DETAIL = INDIVIDUAL_EVENT_DETAIL()
-            birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
-            birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(reg_person.birthday)
+            birth = schema.INDIVIDUAL_EVENT_STRUCTUREs.BIRT()
+            birth.INDIVIDUAL_EVENT_DETAIL = schema.INDIVIDUAL_EVENT_DETAIL()
+            birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = schema.EVENT_DETAIL()
+            birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = schema.EVENT_DETAIL.DATE(reg_person.birthday)
             if person.BIRTHPLACE:
                 if section.location:
                     location = max(
@@ -787,31 +1052,31 @@ def get_gedcom_individual(ids, fam_id, section, person):
                             reg_location, fam_location
                         ),
                     )
-                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = PLACE_STRUCTURE()
-                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = PLACE_STRUCTURE.PLAC(
+                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = schema.PLACE_STRUCTURE()
+                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = schema.PLACE_STRUCTURE.PLAC(
                         ", ".join(location.location)
                     )
                 else:
-                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = PLACE_STRUCTURE()
-                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = PLACE_STRUCTURE.PLAC(
+                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = schema.PLACE_STRUCTURE()
+                    birth.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = schema.PLACE_STRUCTURE.PLAC(
                         person.BIRTHPLACE
                     )
             indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs.append(birth)
         if person.DEATHDAY or person.DEATHDAY_CORRUPT:
             if not isinstance(indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs, list):
                 indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs = list()
-            death = INDIVIDUAL_EVENT_STRUCTUREs.DEAT(NULL())
-            death.INDIVIDUAL_EVENT_DETAIL = INDIVIDUAL_EVENT_DETAIL()
-            death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
+            death = schema.INDIVIDUAL_EVENT_STRUCTUREs.DEAT(common.NULL())
+            death.INDIVIDUAL_EVENT_DETAIL = schema.INDIVIDUAL_EVENT_DETAIL()
+            death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = schema.EVENT_DETAIL()
             if person.DEATHDAY:
-                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(person.DEATHDAY)
+                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = schema.EVENT_DETAIL.DATE(person.DEATHDAY)
             elif person.DEATHDAY_CORRUPT:
-                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(person.DEATHDAY_CORRUPT)
+                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = schema.EVENT_DETAIL.DATE(person.DEATHDAY_CORRUPT)
             else:
                 raise RuntimeError()
             if person.DEATHPLACE:
-                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = PLACE_STRUCTURE()
-                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = PLACE_STRUCTURE.PLAC(
+                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = schema.PLACE_STRUCTURE()
+                death.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = schema.PLACE_STRUCTURE.PLAC(
                     person.DEATHPLACE
                 )
             indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs.append(death)
@@ -819,47 +1084,47 @@ def get_gedcom_individual(ids, fam_id, section, person):
             if not isinstance(indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs, list):
                 indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs = list()
             # TODO: classify event properly
-            event = INDIVIDUAL_EVENT_STRUCTUREs.EVEN(NULL())
-            event.INDIVIDUAL_EVENT_DETAIL = INDIVIDUAL_EVENT_DETAIL()
-            event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
+            event = schema.INDIVIDUAL_EVENT_STRUCTUREs.EVEN(common.NULL())
+            event.INDIVIDUAL_EVENT_DETAIL = schema.INDIVIDUAL_EVENT_DETAIL()
+            event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = schema.EVENT_DETAIL()
             if person.BIRTHEVENTDAY:
-                event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(person.BIRTHEVENTDAY)
+                event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = schema.EVENT_DETAIL.DATE(person.BIRTHEVENTDAY)
             indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs.append(event)
         if person.DEATHEVENT:
             if not isinstance(indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs, list):
                 indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs = list()
             # TODO: classify event properly
-            event = INDIVIDUAL_EVENT_STRUCTUREs.EVEN(NULL())
-            event.INDIVIDUAL_EVENT_DETAIL = INDIVIDUAL_EVENT_DETAIL()
-            event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
+            event = schema.INDIVIDUAL_EVENT_STRUCTUREs.EVEN(common.NULL())
+            event.INDIVIDUAL_EVENT_DETAIL = schema.INDIVIDUAL_EVENT_DETAIL()
+            event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = schema.EVENT_DETAIL()
             if person.DEATHEVENTDAY:
-                event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = EVENT_DETAIL.DATE(person.DEATHEVENTDAY)
+                event.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.DATE = schema.EVENT_DETAIL.DATE(person.DEATHEVENTDAY)
             indi_record.INDI.INDIVIDUAL_EVENT_STRUCTUREs.append(event)
         if person.DETAILS:
             if person.DETAILSPLACE:
                 # TODO: use "sakregister"
                 if not isinstance(indi_record.INDI.INDIVIDUAL_ATTRIBUTE_STRUCTUREs, list):
                     indi_record.INDI.INDIVIDUAL_ATTRIBUTE_STRUCTUREs = list()
-                fact = INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT(person.DETAILS)
-                fact.TYPE = INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT.TYPE("DETAILS")
-                fact.INDIVIDUAL_EVENT_DETAIL = INDIVIDUAL_EVENT_DETAIL()
-                fact.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = EVENT_DETAIL()
-                fact.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = PLACE_STRUCTURE()
-                fact.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = PLACE_STRUCTURE.PLAC(
+                fact = schema.INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT(person.DETAILS)
+                fact.TYPE = schema.INDIVIDUAL_ATTRIBUTE_STRUCTUREs.FACT.TYPE("DETAILS")
+                fact.INDIVIDUAL_EVENT_DETAIL = schema.INDIVIDUAL_EVENT_DETAIL()
+                fact.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL = schema.EVENT_DETAIL()
+                fact.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE = schema.PLACE_STRUCTURE()
+                fact.INDIVIDUAL_EVENT_DETAIL.EVENT_DETAIL.PLACE_STRUCTURE.PLAC = schema.PLACE_STRUCTURE.PLAC(
                     person.DETAILSPLACE
                 )
                 indi_record.INDI.INDIVIDUAL_ATTRIBUTE_STRUCTUREs.append(fact)
             else:
                 if not isinstance(indi_record.INDI.NOTE_STRUCTUREs, list):
                     indi_record.INDI.NOTE_STRUCTUREs = list()
-                note = NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT()
-                note.NOTE = NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE(person.DETAILS.strip())
+                note = schema.NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT()
+                note.NOTE = schema.NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE(person.DETAILS.strip())
                 indi_record.INDI.NOTE_STRUCTUREs.append(note)
         if person.NOTES and person.NOTES.strip():
             if not isinstance(indi_record.INDI.NOTE_STRUCTUREs, list):
                 indi_record.INDI.NOTE_STRUCTUREs = list()
-            note = NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT()
-            note.NOTE = NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE(person.NOTES.strip())
+            note = schema.NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT()
+            note.NOTE = schema.NOTE_STRUCTUREs.NOTE_STRUCTURE_USER_TEXT.NOTE(person.NOTES.strip())
             indi_record.INDI.NOTE_STRUCTUREs.append(note)
         child_to_family_links = list()
         spouse_to_family_links = list()
@@ -871,15 +1136,15 @@ def get_gedcom_individual(ids, fam_id, section, person):
                     for union_part_no, union in alt_section.family.unions:
                         if ids[person] in union.children:
                             # person participates as a child in a union
-                            child_to_family_link = CHILD_TO_FAMILY_LINK()
-                            child_to_family_link.FAMC = CHILD_TO_FAMILY_LINK.FAMC(ids[ids[(fam_id, union)]])
+                            child_to_family_link = schema.CHILD_TO_FAMILY_LINK()
+                            child_to_family_link.FAMC = schema.CHILD_TO_FAMILY_LINK.FAMC(ids[ids[(fam_id, union)]])
                             logger.debug(f"FAMC using {ids[ids[(fam_id, union)]]}")
                             child_to_family_links.append(child_to_family_link)
                             nof_unions += 1
                     if not nof_unions:
                         # person participates as a child, but not in any union
-                        child_to_family_link = CHILD_TO_FAMILY_LINK()
-                        child_to_family_link.FAMC = CHILD_TO_FAMILY_LINK.FAMC(ids[fam_id_alt])
+                        child_to_family_link = schema.CHILD_TO_FAMILY_LINK()
+                        child_to_family_link.FAMC = schema.CHILD_TO_FAMILY_LINK.FAMC(ids[fam_id_alt])
                         logger.debug(f"FAMC using {ids[fam_id_alt]}")
                         child_to_family_links.append(child_to_family_link)
                 if ids[person] in alt_section.family.adults:
@@ -887,15 +1152,15 @@ def get_gedcom_individual(ids, fam_id, section, person):
                     for union_part_no, union in alt_section.family.unions:
                         if ids[person] in union.children:
                             # person participates as an adult in a union
-                            spouse_to_family_link = SPOUSE_TO_FAMILY_LINK()
-                            spouse_to_family_link.FAMS = SPOUSE_TO_FAMILY_LINK.FAMS(ids[ids[(fam_id, union)]])
+                            spouse_to_family_link = schema.SPOUSE_TO_FAMILY_LINK()
+                            spouse_to_family_link.FAMS = schema.SPOUSE_TO_FAMILY_LINK.FAMS(ids[ids[(fam_id, union)]])
                             logger.debug(f"FAMS using {ids[ids[(fam_id, union)]]}")
                             spouse_to_family_links.append(spouse_to_family_link)
                             nof_unions += 1
                     if not nof_unions:
                         # person participates as an adult, but not in any union
-                        spouse_to_family_link = SPOUSE_TO_FAMILY_LINK()
-                        spouse_to_family_link.FAMS = SPOUSE_TO_FAMILY_LINK.FAMS(ids[fam_id_alt])
+                        spouse_to_family_link = schema.SPOUSE_TO_FAMILY_LINK()
+                        spouse_to_family_link.FAMS = schema.SPOUSE_TO_FAMILY_LINK.FAMS(ids[fam_id_alt])
                         logger.debug(f"FAMS using {ids[fam_id_alt]}")
                         spouse_to_family_links.append(spouse_to_family_link)
 
@@ -926,48 +1191,31 @@ def add_family_info(ids, sections):
         logger.debug(f"{fam_id},{section}")
 
         persons_in_fam_id = list()
-        persons_in_fam = list()
         parent_part_no, parent = section.family.adults[0]
-        for part_no, fam_person in section.family.adults:
-            persons_descending = [
-                person
-                for person in sorted(
-                    section.person,
-                    key=lambda person, fam_person=fam_person: person_similarity(person, fam_person),
-                )
-                if person not in persons_in_fam
-            ]
-            if persons_descending:
-                person = persons_descending.pop()
+        fam_persons = [fam_person for _, fam_person in section.family.adults + section.family.children]
+        # NOTE: equal registry persons are one person (they share an id)
+        reg_persons = list(dict.fromkeys(section.person))
+        # NOTE: the adults are matched before the children
+        matches = {
+            found.row: found
+            for found in match(person_similarities(reg_persons, fam_persons), priority=len(section.family.adults))
+        }
+        for row, fam_person in enumerate(fam_persons):
+            if found := matches.get(row):
+                person = reg_persons[found.column]
                 ids[fam_person] = ids[person]
                 logger.debug(
-                    f"added (shared) family person id:\n{fam_person}\n{ids[fam_person]}\nselected:\n{(person_similarity(person, fam_person),person)}\nothers:\n{[(person_similarity(person, fam_person),person) for person in persons_descending]}\nexcluded:\n{[(person_similarity(person, fam_person),person) for person in persons_in_fam]}\n"
+                    f"added (shared) family person id:\n{fam_person}\n{ids[fam_person]}\nselected:\n{(found.score, person)}\nmargin:{found.margin}\n"
                 )
-                persons_in_fam.append(person)
+                if found.margin is not None and found.margin < AMBIGUOUS_MARGIN:
+                    logger.warning(
+                        f"ambiguous match (margin {found.margin:.3f}):{fam_id}:\n{fam_person}\n{person}\nothers:\n{reg_persons}\n"
+                    )
                 persons_in_fam_id.append(ids[person])
-            else:
+            elif row < len(section.family.adults):
                 raise ValueError(f"Could not find matching person for {fam_person}")
-
-        if section.family.children:
-            for part_no, fam_person in section.family.children:
-                persons_descending = [
-                    person
-                    for person in sorted(
-                        section.person,
-                        key=lambda reg_person, fam_person=fam_person: person_similarity(reg_person, fam_person),
-                    )
-                    if person not in persons_in_fam
-                ]
-                if persons_descending:
-                    person = persons_descending.pop()
-                    ids[fam_person] = ids[person]
-                    logger.debug(
-                        f"added (shared) family person id:\n{fam_person}\n{ids[fam_person]}\nselected:\n{(person_similarity(person, fam_person),person)}\nothers:\n{[(person_similarity(person, fam_person),person) for person in persons_descending]}\nexcluded:\n{[(person_similarity(person, fam_person),person) for person in persons_in_fam]}\n"
-                    )
-                    persons_in_fam.append(person)
-                    persons_in_fam_id.append(ids[person])
-                else:
-                    logging.warning(f"Could not find matching person for {fam_person}")
+            else:
+                logging.warning(f"Could not find matching person for {fam_person}")
 
         if len(persons_in_fam_id) != len(set(persons_in_fam_id)):
             raise ValueError("persons not unique")
@@ -1000,7 +1248,7 @@ def add_family_info(ids, sections):
                     logger.debug(
                         f"added relation id id:\n{(fam_id,relation)}\n{ids[(fam_id,relation)]}\n{ids[ids[(fam_id,relation)]]}\n"
                     )
-                elif type(adult).__name__ == "adult":
+                elif isinstance(adult, FamilyAdult):
                     if (ids[parent]) == (ids[adult]):
                         logger.warning(f"Unexpected self-relationship:\n{parent}\nand\n{adult}\n")
                     ids[(fam_id, relation)] = (ids[parent], ids[adult])
@@ -1011,7 +1259,8 @@ def add_family_info(ids, sections):
                     )
                 elif type(adult) == str:
                     logger.warning(f"Unexpected relationship between\n{parent}\nand freeform\n{adult}\n")
-                    ids[(fam_id, relation)] = (ids[parent], ids[adult])
+                    # NOTE: no individual is written for freeform text, so it gets no xref to point to
+                    ids[(fam_id, relation)] = (ids[parent], None)
                     logger.debug(f"added relation id:\n{(fam_id,relation)}\n{ids[(fam_id,relation)]}")
                     ids[ids[(fam_id, relation)]]
                     logger.debug(
@@ -1040,7 +1289,7 @@ def add_family_info(ids, sections):
                     if not children:
                         logging.warning(f"SKIPPING union:no children found:\n{parents}")
                     else:
-                        ids[(fam_id, union)] = namedtuple("union_ids", ("parents", "children"))(
+                        ids[(fam_id, union)] = FamilyUnionIds(
                             parents=tuple((ids[adult]) for adult in parents),
                             children=tuple((ids[child]) for child in children),
                         )
@@ -1054,12 +1303,13 @@ def add_family_info(ids, sections):
 
 def get_gedcom_families(ids, fam_id, section):
     def add_partners(famrecord, input_partner_ids):
-        partner_ids = list(set(input_partner_ids))
-        if partner_ids and (husb := partner_ids.pop()):
-            famrecord.FAM.HUSB = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.HUSB(husb)
+        # NOTE: in the order given (a set would order them by hash, which differs from one conversion to the next)
+        partner_ids = list(dict.fromkeys(partner_id for partner_id in input_partner_ids if partner_id))
+        if partner_ids and (husb := partner_ids.pop(0)):
+            famrecord.FAM.HUSB = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.HUSB(husb)
             logger.debug(f"FAM.HUSB using {husb}")
-            if partner_ids and (wife := partner_ids.pop()):
-                famrecord.FAM.WIFE = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.WIFE(wife)
+            if partner_ids and (wife := partner_ids.pop(0)):
+                famrecord.FAM.WIFE = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.WIFE(wife)
                 logger.debug(f"FAM.WIFE using {wife}")
             if partner_ids:
                 unselected_partners = [key for key, value in ids.items() if value in partner_ids]
@@ -1071,15 +1321,17 @@ def get_gedcom_families(ids, fam_id, section):
     if not section.family.unions:
         if section.family.relations:
             for relation_part_no, relation in section.family.relations:
-                famrecord = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
-                famrecord.FAM = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM(XREF_FAM(ids[ids[(fam_id, relation)]]))
+                famrecord = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
+                famrecord.FAM = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM(
+                    primitives.XREF_FAM(ids[ids[(fam_id, relation)]])
+                )
                 logger.debug(f"FAM\n{(fam_id, relation)}\n{ids[(fam_id, relation)]}\n{ids[ids[(fam_id, relation)]]}")
                 add_partners(famrecord, ids[(fam_id, relation)])
                 yield famrecord
         else:
-            famrecord = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
-            famrecord.FAM = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM(XREF_FAM(fam_id))
-            logger.debug(f"FAM using {fam_id}")
+            famrecord = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
+            famrecord.FAM = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM(primitives.XREF_FAM(ids[fam_id]))
+            logger.debug(f"FAM using {ids[fam_id]}")
             yield famrecord
     else:
         for union_no, union in section.family.unions:
@@ -1087,29 +1339,35 @@ def get_gedcom_families(ids, fam_id, section):
                 logging.warning(f"SKIPPING: could not find parents in union:\n{union}")
             else:
                 union_id = ids[ids[(fam_id, union)]]
-                famrecord = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
-                famrecord.FAM = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM(XREF_FAM(union_id))
+                famrecord = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
+                famrecord.FAM = schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM(primitives.XREF_FAM(union_id))
                 logger.debug(f"FAM\n{(fam_id, union)}\n{ids[(fam_id, union)]}\n{ids[ids[(fam_id, union)]]}")
                 add_partners(famrecord, ids[(fam_id, union)].parents)
                 for child_id in ids[(fam_id, union)].children:
                     if not isinstance(famrecord.FAM.CHILs, list):
-                        famrecord.FAM.CHILs: LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.CHILs = list()
-                    famrecord.FAM.CHILs.append(CHIL(child_id))
+                        famrecord.FAM.CHILs: schema.LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.CHILs = list()
+                    famrecord.FAM.CHILs.append(schema.CHIL(child_id))
                     logger.debug(f"FAM.CHIL using {child_id}")
                 yield famrecord
                 # TODO: notes, details, locations, ...
 
 
-def parsed_to_gedcom(path: pathlib.Path, sections):
-    fam_records = set()
-    indi_records = set()
-    ids = defaultdict(uuid.uuid4)
+def parsed_to_gedcom(path: pathlib.Path, sections, *, id_map: Optional[pathlib.Path] = None, ids: Optional[Ids] = None):
+    """
+    writes the sections as GEDCOM next to path, with the xrefs of a previous conversion kept in id_map (if given).
+    """
+    import importlib.metadata
+
+    fam_records = list()
+    indi_records = list()
+    if ids is None:
+        ids = Ids.load(id_map) if id_map else Ids()
     add_reg_person_info(ids, sections)
     add_family_info(ids, sections)
 
     for fam_id, section in sections.items():
         for family in get_gedcom_families(ids, fam_id, section):
-            fam_records.add(family)
+            fam_records.append(family)
 
     already_added_id = set()
     for fam_id, section in sections.items():
@@ -1119,57 +1377,50 @@ def parsed_to_gedcom(path: pathlib.Path, sections):
                 logger.debug(f"GEDCOM: skipping adult that was already added:\n{adult}\n")
             else:
                 logger.debug(f"GEDCOM: adding adult:\n{adult}")
-                indi_records.add(get_gedcom_individual(ids, fam_id, section, adult))
+                indi_records.append(get_gedcom_individual(ids, fam_id, section, adult, sections))
                 already_added_id.add(ids[adult])
         for child_part_no, child in section.family.children:
             if ids[child] in already_added_id:
                 logger.debug(f"GEDCOM: skipping child that was already added:\n{child}\n")
             else:
                 logger.debug(f"GEDCOM: adding child:\n{child}\n")
-                indi_records.add(get_gedcom_individual(ids, fam_id, section, child))
+                indi_records.append(get_gedcom_individual(ids, fam_id, section, child, sections))
                 already_added_id.add(ids[child])
 
-    ex = LINEAGE_LINKED_GEDCOM_FILE()
-    ex.GEDCOM_HEADER = GEDCOM_HEADER()
-    ex.GEDCOM_HEADER.HEAD = GEDCOM_HEADER.HEAD()
-    ex.GEDCOM_HEADER.HEAD.GEDC = GEDCOM_HEADER.HEAD.GEDC()
-    ex.GEDCOM_HEADER.HEAD.GEDC.VERS = GEDCOM_HEADER.HEAD.GEDC.VERS("5.5.5")
-    ex.GEDCOM_HEADER.HEAD.GEDC.FORM = GEDCOM_HEADER.HEAD.GEDC.FORM("LINEAGE-LINKED")
-    ex.GEDCOM_HEADER.HEAD.GEDC.FORM.VERS = GEDCOM_HEADER.HEAD.GEDC.FORM.VERS("5.5.5")
-    ex.GEDCOM_HEADER.HEAD.CHAR = GEDCOM_HEADER.HEAD.CHAR("UTF-8")
-    ex.GEDCOM_FORM_HEADER_EXTENSION = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION()
-    ex.GEDCOM_FORM_HEADER_EXTENSION.SOUR = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR(
-        "genealogy.gedcomish"
-    )
-    ex.GEDCOM_FORM_HEADER_EXTENSION.SOUR.VERS = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.VERS(
+    ex = schema.LINEAGE_LINKED_GEDCOM_FILE()
+    ex.GEDCOM_HEADER = schema.GEDCOM_HEADER()
+    ex.GEDCOM_HEADER.HEAD = schema.GEDCOM_HEADER.HEAD()
+    ex.GEDCOM_HEADER.HEAD.GEDC = schema.GEDCOM_HEADER.HEAD.GEDC()
+    ex.GEDCOM_HEADER.HEAD.GEDC.VERS = schema.GEDCOM_HEADER.HEAD.GEDC.VERS("5.5.5")
+    ex.GEDCOM_HEADER.HEAD.GEDC.FORM = schema.GEDCOM_HEADER.HEAD.GEDC.FORM("LINEAGE-LINKED")
+    ex.GEDCOM_HEADER.HEAD.GEDC.FORM.VERS = schema.GEDCOM_HEADER.HEAD.GEDC.FORM.VERS("5.5.5")
+    ex.GEDCOM_HEADER.HEAD.CHAR = schema.GEDCOM_HEADER.HEAD.CHAR("UTF-8")
+    HEADER_EXTENSION = schema.GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION
+    ex.GEDCOM_FORM_HEADER_EXTENSION = HEADER_EXTENSION()
+    ex.GEDCOM_FORM_HEADER_EXTENSION.SOUR = HEADER_EXTENSION.SOUR("genealogy.gedcomish")
+    ex.GEDCOM_FORM_HEADER_EXTENSION.SOUR.VERS = HEADER_EXTENSION.SOUR.VERS(
         importlib.metadata.version(__package__.split(".")[0])
     )
-    ex.GEDCOM_FORM_HEADER_EXTENSION.SOUR.DATA = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SOUR.DATA(
-        path.parent.name + ": " + str(path.name)
-    )
-    ex.GEDCOM_FORM_HEADER_EXTENSION.DATE = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE(
-        datetime.datetime.now()
-    )
-    ex.GEDCOM_FORM_HEADER_EXTENSION.DATE.TIME = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.DATE.TIME(
-        datetime.datetime.now()
-    )
-    subm_id = XREF_SUBM(create=True)
-    ex.GEDCOM_FORM_HEADER_EXTENSION.SUBM = GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION.SUBM(subm_id)
-    ex.FORM_RECORDS = FORM_RECORDS()
-    ex.FORM_RECORDS.SUBMITTER_RECORD = SUBMITTER_RECORD()
-    ex.FORM_RECORDS.SUBMITTER_RECORD.SUBM = SUBMITTER_RECORD.SUBM(subm_id)
-    ex.FORM_RECORDS.SUBMITTER_RECORD.SUBM.NAME = SUBMITTER_RECORD.SUBM.NAME(socket.gethostname())
+    ex.GEDCOM_FORM_HEADER_EXTENSION.SOUR.DATA = HEADER_EXTENSION.SOUR.DATA(path.parent.name + ": " + str(path.name))
+    ex.GEDCOM_FORM_HEADER_EXTENSION.DATE = HEADER_EXTENSION.DATE(datetime.datetime.now())
+    ex.GEDCOM_FORM_HEADER_EXTENSION.DATE.TIME = HEADER_EXTENSION.DATE.TIME(datetime.datetime.now())
+    subm_id = primitives.XREF_SUBM(SUBMITTER_XREF)
+    ex.GEDCOM_FORM_HEADER_EXTENSION.SUBM = HEADER_EXTENSION.SUBM(subm_id)
+    ex.FORM_RECORDS = schema.FORM_RECORDS()
+    ex.FORM_RECORDS.SUBMITTER_RECORD = schema.SUBMITTER_RECORD()
+    ex.FORM_RECORDS.SUBMITTER_RECORD.SUBM = schema.SUBMITTER_RECORD.SUBM(subm_id)
+    ex.FORM_RECORDS.SUBMITTER_RECORD.SUBM.NAME = schema.SUBMITTER_RECORD.SUBM.NAME(socket.gethostname())
     ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs = list()
     ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs.extend(fam_records)
     ex.FORM_RECORDS.LINEAGE_LINKED_RECORDs.extend(indi_records)
-    ex.GEDCOM_TRAILER = GEDCOM_TRAILER()
-    ex.GEDCOM_TRAILER.TRLR = GEDCOM_TRAILER.TRLR()
-    lines = GEDCOM_LINES()
-    lines = ex(lines=lines, delta_level=0)
-    result = lines(0)
+    ex.GEDCOM_TRAILER = schema.GEDCOM_TRAILER()
+    ex.GEDCOM_TRAILER.TRLR = schema.GEDCOM_TRAILER.TRLR()
     outfile = path.with_suffix(".ged")
-    outfile.write_text(result, encoding="utf-8-sig")
+    with outfile.open("wb") as stream:
+        ex.write_to(stream, encoding="utf-8-sig")
     logger.info(f"GEDCOM output: {outfile}")
+    if id_map:
+        ids.save(id_map)
 
 
 if __name__ == "__main__":
@@ -1177,11 +1428,37 @@ if __name__ == "__main__":
         parser = argparse.ArgumentParser(description="Parse html file in holger-like format.")
         parser.add_argument("--holger", type=pathlib.Path, help="path to .htm file", required=True)
         parser.add_argument("--encoding", type=pathlib.Path, help="path to .htm file", required=False)
+        parser.add_argument(
+            "--workers", type=int, default=1, help="processes splitting the family sections (0 for one per cpu)"
+        )
+        parser.add_argument(
+            "--cache", type=pathlib.Path, help="directory of parsed family sections (reused when unchanged)"
+        )
+        parser.add_argument(
+            "--id-map", type=pathlib.Path, help="xrefs kept from one conversion to the next (default: none kept)"
+        )
+        parser.add_argument(
+            "--log-backend", choices=("sync", "queue"), default="sync", help="queue: log from listener threads"
+        )
+        parser.add_argument(
+            "--log-level",
+            action="append",
+            default=list(),
+            metavar="LOGGER=LEVEL",
+            help="level of a logger, e.g. gedcomish.common=WARNING (repeatable)",
+        )
         pargs = parser.parse_args()
-        sections = split_sections(
-            pargs.holger.read_text(encoding=str(pargs.encoding) if pargs.encoding else None), dict()
+        configure(backend=pargs.log_backend, levels=dict(level.split("=", 1) for level in pargs.log_level))
+        cache = ParseCache(pargs.cache, parser_version()) if pargs.cache else None
+        sections = split_found_sections(
+            read_sections(pargs.holger, str(pargs.encoding) if pargs.encoding else None),
+            workers=pargs.workers,
+            cache=cache,
         )
-        parsed_to_gedcom(pargs.holger, sections)
+        parsed_to_gedcom(pargs.holger, sections, id_map=pargs.id_map)
+        if cache is not None:
+            # NOTE: printed, so that the levels of the loggers do not hide it
+            print(cache.stats())
     except Exception as e:
         logger.error(e)
         raise
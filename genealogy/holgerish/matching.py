@@ -0,0 +1,181 @@
+import logging
+import math
+from collections import Counter, namedtuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .configure import configure
+from genealogy.gedcomish.lazy import lazy_import
+
+# NOTE: optional, the scores are computed the same way without it (only slower)
+numpy = lazy_import("numpy")
+
+configure(lazy=True)
+logger = logging.getLogger(__name__)
+
+Match = namedtuple("Match", ("row", "column", "score", "margin"))
+
+
+def ngrams(text: str, n: int = 2) -> Counter:
+    """
+    the character n-grams of text, padded with a space on both sides (so short texts have n-grams too).
+    """
+    if not text:
+        return Counter()
+    padded = f" {text} "
+    return Counter(padded[start : start + n] for start in range(len(padded) - n + 1))
+
+
+def _vocabulary(counts: Iterable[Counter]) -> Dict[str, int]:
+    vocabulary: Dict[str, int] = dict()
+    for count in counts:
+        for gram in count:
+            vocabulary.setdefault(gram, len(vocabulary))
+    return vocabulary
+
+
+def _similarities_numpy(left: List[Counter], right: List[Counter]):
+    vocabulary = _vocabulary(left + right)
+
+    def vectors(counts):
+        matrix = numpy.zeros((len(counts), len(vocabulary)))
+        for row, count in enumerate(counts):
+            for gram, nof in count.items():
+                matrix[row, vocabulary[gram]] = nof
+        norms = numpy.linalg.norm(matrix, axis=1)
+        return matrix / numpy.where(norms, norms, 1.0)[:, None], norms == 0
+
+    left_vectors, left_empty = vectors(left)
+    right_vectors, right_empty = vectors(right)
+    result = left_vectors @ right_vectors.T
+    result[numpy.logical_and.outer(left_empty, right_empty)] = 1.0
+    return result
+
+
+def _similarities_python(left: List[Counter], right: List[Counter]) -> List[List[float]]:
+    def norm(count):
+        return math.sqrt(sum(nof * nof for nof in count.values()))
+
+    left_norms = [norm(count) for count in left]
+    right_norms = [norm(count) for count in right]
+    return [
+        [
+            (sum(nof * r.get(gram, 0) for gram, nof in l.items()) / (l_norm * r_norm) if l_norm and r_norm else 0.0)
+            if l_norm or r_norm
+            else 1.0
+            for r, r_norm in zip(right, right_norms)
+        ]
+        for l, l_norm in zip(left, left_norms)
+    ]
+
+
+def score_matrix(pairs: Sequence[Tuple[Sequence[str], Sequence[str], float]], n: int = 2) -> List[List[float]]:
+    """
+    the weighted sum of text similarities of every left (row) and right (column) item,
+    given as (texts of the left items, texts of the right items, weight) for each pair of fields compared.
+    the similarity is the cosine of the character n-gram counts (1.0 for two empty texts, as SequenceMatcher.ratio).
+    computed as one matrix per pair of fields with numpy, if it is installed.
+    """
+    total = None
+    for left, right, weight in pairs:
+        left_counts = [ngrams(text, n) for text in left]
+        right_counts = [ngrams(text, n) for text in right]
+        if numpy is not None:
+            similarities = _similarities_numpy(left_counts, right_counts) * weight
+            total = similarities if total is None else total + similarities
+        else:
+            similarities = [
+                [similarity * weight for similarity in row] for row in _similarities_python(left_counts, right_counts)
+            ]
+            total = (
+                similarities
+                if total is None
+                else [[a + b for a, b in zip(row, other)] for row, other in zip(total, similarities)]
+            )
+    if total is None:
+        return list()
+    return total.tolist() if numpy is not None else total
+
+
+def assign(scores: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """
+    the (row, column) pairs of the optimal assignment (Hungarian algorithm):
+    as many pairs as possible (at most one per row and column) with the largest sum of scores.
+    """
+    nof_rows = len(scores)
+    nof_columns = len(scores[0]) if nof_rows else 0
+    if not nof_rows or not nof_columns:
+        return list()
+    if nof_rows > nof_columns:
+        transposed = [[scores[row][column] for row in range(nof_rows)] for column in range(nof_columns)]
+        return sorted((row, column) for column, row in assign(transposed))
+    # NOTE: rows and columns are numbered from 1, row 0 and column 0 are for the bookkeeping
+    row_potential = [0.0] * (nof_rows + 1)
+    column_potential = [0.0] * (nof_columns + 1)
+    row_of = [0] * (nof_columns + 1)
+    previous = [0] * (nof_columns + 1)
+    for row in range(1, nof_rows + 1):
+        row_of[0] = row
+        column = 0
+        least = [math.inf] * (nof_columns + 1)
+        used = [False] * (nof_columns + 1)
+        while True:
+            used[column] = True
+            current_row = row_of[column]
+            delta = math.inf
+            next_column = None
+            for other in range(1, nof_columns + 1):
+                if not used[other]:
+                    cost = -scores[current_row - 1][other - 1] - row_potential[current_row] - column_potential[other]
+                    if cost < least[other]:
+                        least[other] = cost
+                        previous[other] = column
+                    if least[other] < delta:
+                        delta = least[other]
+                        next_column = other
+            for other in range(nof_columns + 1):
+                if used[other]:
+                    row_potential[row_of[other]] += delta
+                    column_potential[other] -= delta
+                else:
+                    least[other] -= delta
+            column = next_column
+            if row_of[column] == 0:
+                break
+        while column:
+            row_of[column] = row_of[previous[column]]
+            column = previous[column]
+    return sorted((row_of[column] - 1, column - 1) for column in range(1, nof_columns + 1) if row_of[column])
+
+
+def margin(scores: Sequence[Sequence[float]], row: int, column: int) -> Optional[float]:
+    """
+    how much better row and column score with each other than with any other column or row (None if there is none).
+    """
+    others = [score for other, score in enumerate(scores[row]) if other != column]
+    others += [scores[other][column] for other in range(len(scores)) if other != row]
+    return scores[row][column] - max(others) if others else None
+
+
+def match(scores: Sequence[Sequence[float]], *, priority: int = 0) -> List[Match]:
+    """
+    the optimal assignment of rows to columns with the score and margin of every match.
+    the first priority rows are assigned before any of the others (if there are not columns enough for all).
+    """
+    if priority and scores and scores[0]:
+        highest = max(max(row) for row in scores)
+        lowest = min(min(row) for row in scores)
+        bonus = len(scores) * (highest - lowest) + 1.0
+        prioritized = [[score + bonus for score in row] if no < priority else row for no, row in enumerate(scores)]
+    else:
+        prioritized = scores
+    return [Match(row, column, scores[row][column], margin(scores, row, column)) for row, column in assign(prioritized)]
+
+
+__all__ = [
+    "Match",
+    "assign",
+    "margin",
+    "match",
+    "ngrams",
+    "score_matrix",
+]
@@ -0,0 +1,139 @@
+import datetime
+import io
+import logging
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.gedcom555ish import dates
+from gedcomish.gedcom555ish.dates import (
+    FIRST_DAY,
+    LAST_DAY,
+    Date,
+    DatePrecision,
+    date_index,
+    date_key,
+    date_keys,
+    gedcom_date_value,
+    parse_date,
+    parse_date_value,
+    select,
+)
+from gedcomish.gedcom555ish.primitives import DATE, DATE_EXACT, DATE_VALUE
+from gedcomish.gedcom555ish.reader import iter_nodes
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+
+def day(year, month, day):
+    return datetime.date(year, month, day).toordinal() + 1721425
+
+
+class TestDates:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("1822-10-02", "2 OCT 1822"),
+            ("1822-10", "OCT 1822"),
+            ("1822-xx-xx", "1822"),
+            ("abt  1822", "ABT 1822"),
+            ("CAL 2 oct 1822", "CAL 2 OCT 1822"),
+            ("EST 1822", "EST 1822"),
+            ("BEF 1822", "BEF 1822"),
+            ("AFT OCT 1822", "AFT OCT 1822"),
+            ("BET 1820 AND 1825", "BET 1820 AND 1825"),
+            ("FROM 1820 TO 1825", "FROM 1820 TO 1825"),
+            ("FROM 1820", "FROM 1820"),
+            ("TO 1825", "TO 1825"),
+            ("INT 2 OCT 1822 (andra oktober)", "INT 2 OCT 1822 (andra oktober)"),
+            ("(okänt)", "(okänt)"),
+            ("@#DJULIAN@ 11 FEB 1700", "@#DJULIAN@ 11 FEB 1700"),
+            ("@#DHEBREW@ TSH 5600", "@#DHEBREW@ TSH 5600"),
+            ("@#DFRENCH R@ 3 COMP 12", "@#DFRENCH R@ 3 COMP 12"),
+            ("1699/00", "1699/00"),
+            ("44 BC", "44 B.C."),
+        ],
+    )
+    def test_gedcom_date_value(self, text, expected):
+        assert gedcom_date_value(text) == expected
+        assert parse_date_value(text) is not None
+
+    @pytest.mark.parametrize(
+        "text",
+        ["1822-02-30", "30 FEB 1822", "BET 1820", "ABT 1820 AND 1825", "1699/01", "@#DHEBREW@ 44 B.C.", "omkring 1822"],
+    )
+    def test_not_a_date_value(self, text):
+        assert parse_date_value(text) is None
+        assert gedcom_date_value(text) == f"({text})"
+
+    def test_parse_date(self):
+        assert parse_date("1822-10-02") == Date("GREGORIAN", 1822, 10, 2, None, False)
+        assert parse_date("@#DJULIAN@ 44 B.C.") == Date("JULIAN", 44, None, None, None, True)
+        assert parse_date("ABT 1822") is None
+
+    def test_primitives(self):
+        assert str(DATE_VALUE("ABT 1822")) == "ABT 1822"
+        assert str(DATE_VALUE(FROM="1820-01", TO="1825-12")) == "FROM JAN 1820 TO DEC 1825"
+        assert str(DATE("1822-10")) == "OCT 1822"
+        assert str(DATE_EXACT("1822")) == "1 JAN 1822"
+
+
+class TestDateKeys:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("2 MAR 1850", (day(1850, 3, 2), day(1850, 3, 2), DatePrecision.DAY)),
+            ("1850-03", (day(1850, 3, 1), day(1850, 3, 31), DatePrecision.MONTH)),
+            ("1850", (day(1850, 1, 1), day(1850, 12, 31), DatePrecision.YEAR)),
+            ("ABT 1850", (day(1850, 1, 1), day(1850, 12, 31), DatePrecision.ABOUT)),
+            ("BET 1840 AND FEB 1860", (day(1840, 1, 1), day(1860, 2, 29), DatePrecision.BETWEEN)),
+            ("BET FEB 1860 AND 1840", (day(1840, 1, 1), day(1860, 2, 29), DatePrecision.BETWEEN)),
+            ("FROM 1860 TO 1840", (day(1840, 1, 1), day(1860, 12, 31), DatePrecision.BETWEEN)),
+            ("BEF 1850", (FIRST_DAY, day(1849, 12, 31), DatePrecision.BEFORE)),
+            ("AFT 1850", (day(1851, 1, 1), LAST_DAY, DatePrecision.AFTER)),
+            ("(okänt)", (LAST_DAY, FIRST_DAY, DatePrecision.UNKNOWN)),
+            # NOTE: the last julian day before the gregorian calendar was introduced
+            ("@#DJULIAN@ 4 OCT 1582", (day(1582, 10, 14), day(1582, 10, 14), DatePrecision.DAY)),
+            # NOTE: rosh hashanah and adar sheni of 5784
+            ("@#DHEBREW@ 1 TSH 5784", (day(2023, 9, 16), day(2023, 9, 16), DatePrecision.DAY)),
+            ("@#DHEBREW@ ADS 5784", (day(2024, 3, 11), day(2024, 4, 8), DatePrecision.MONTH)),
+            ("@#DFRENCH R@ 1 VEND 1", (day(1792, 9, 22), day(1792, 9, 22), DatePrecision.DAY)),
+        ],
+    )
+    def test_date_key(self, text, expected):
+        assert date_key(text) == expected
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_date_keys(self, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(dates, "numpy", None)
+        texts = ["1850", "BEF 1850", "1850", "(okänt)"]
+        lower, upper, precision = date_keys(texts)
+        assert [(lower[no], upper[no], precision[no]) for no in range(len(texts))] == [date_key(t) for t in texts]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_select(self, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(dates, "numpy", None)
+        text = "\n".join(
+            [
+                "0 @I1@ INDI\n1 BIRT\n2 DATE 1845\n1 DEAT\n2 DATE 1901",
+                "0 @I2@ INDI\n1 BIRT\n2 DATE BEF 1830",
+                "0 @I3@ INDI\n1 BIRT\n2 DATE BET 1855 AND 1870",
+                "0 @I4@ INDI\n1 BIRT\n2 DATE (okänt)",
+                "0 @I5@ INDI\n1 BIRT\n2 DATE BET 1880 AND 1850",
+            ]
+        )
+        index = date_index(iter_nodes(io.StringIO(text)))
+        assert list(index.lower) == sorted(index.lower)
+        lower, upper, _ = date_key("BET 1840 AND 1860")
+        assert sorted((index.xref_ids[no], index.tags[no]) for no in select(index, lower, upper)) == [
+            ("@I1@", "BIRT"),
+            ("@I3@", "BIRT"),
+            ("@I5@", "BIRT"),
+        ]
@@ -0,0 +1,67 @@
+import logging
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.common import Substructure, _changed_classes, _class_caches
+from gedcomish.gedcom555ish import reader
+from gedcomish.gedcom555ish.grammar import compile_grammar, is_current
+from gedcomish.gedcom555ish.grammar_table import GRAMMAR
+from gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
+    LINEAGE_LINKED_GEDCOM_FILE,
+    PERSONAL_NAME_STRUCTURE,
+    LINEAGE_LINKED_RECORDs,
+)
+from gedcomish.gedcom555ish.reader import reflect_routes, resolve, routes
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def reflected(monkeypatch):
+    """
+    routes reflected from here on are "reflected", the class attributes reassigned are forgotten afterwards.
+    """
+    monkeypatch.setattr(reader, "reflect_routes", lambda cls: "reflected")
+    for cache, _ in _class_caches:
+        cache.clear()
+    yield
+    _changed_classes.clear()
+    for cache, _ in _class_caches:
+        cache.clear()
+
+
+class TestGrammar:
+    def test_current(self):
+        # NOTE: regenerate with python -m gedcomish.gedcom555ish.grammar
+        assert is_current()
+        assert GRAMMAR == compile_grammar()
+
+    def test_routes(self):
+        for context in GRAMMAR:
+            assert routes(resolve(context)) == reflect_routes(resolve(context))
+
+    def test_rules(self):
+        (indi,) = GRAMMAR["LINEAGE_LINKED_GEDCOM_FILE"]["INDI"]
+        assert (indi.cardinality, indi.level_delta, indi.kind) == ((0, None), 0, "POINTER")
+        (name,) = GRAMMAR[indi.qualname]["NAME"]
+        assert name.steps == (
+            ("PERSONAL_NAME_STRUCTUREs", True, "PERSONAL_NAME_STRUCTURE"),
+            ("NAME", False, "PERSONAL_NAME_STRUCTURE.NAME"),
+        )
+        assert (name.cardinality, name.primitive, name.level_delta) == ((0, None), "NAME_PERSONAL", 1)
+        (sex,) = GRAMMAR[indi.qualname]["SEX"]
+        assert (sex.cardinality, sex.primitive) == ((0, 1), "SEX_VALUE")
+        assert [rule.kind for rule in GRAMMAR["INDIVIDUAL_EVENT_STRUCTUREs.BIRT"]["NOTE"]] == ["PRIMITIVE", "XREF"]
+
+    def test_unrelated_class(self, reflected):
+        class UNRELATED(Substructure, delta_level=0):
+            pass
+
+        assert routes(LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI) != "reflected"
+
+    def test_changed_class(self, reflected):
+        PERSONAL_NAME_STRUCTURE.__doc__ = PERSONAL_NAME_STRUCTURE.__doc__
+        assert routes(LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI) == "reflected"
+        assert routes(LINEAGE_LINKED_GEDCOM_FILE) != "reflected"
@@ -0,0 +1,82 @@
+import json
+import logging
+import os
+import pathlib
+import shutil
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.gedcom555ish.index import build_index, index_path, load_index, read_record, save_index
+from gedcomish.gedcom555ish.lineage_linked_gedcom_file import SUBMITTER_RECORD, LINEAGE_LINKED_RECORDs
+from gedcomish.gedcom555ish.reader import iter_records
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+HERE = pathlib.Path(__file__).resolve().parent
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "555SAMPLE.GED"
+    shutil.copyfile(HERE / "555SAMPLE.GED", path)
+    return path
+
+
+class TestIndex:
+    def test_offsets(self, sample):
+        index = build_index(sample)
+        assert sorted(index.records) == ["F1", "F2", "I1", "I2", "I3", "R1", "S1", "U1"]
+        data = sample.read_bytes()
+        for xref_id, span in index.records.items():
+            record = data[span.offset : span.offset + span.length]
+            assert record.startswith(f"0 @{xref_id}@ {span.tag}".encode())
+            assert record.endswith(b"\n")
+        assert index.records["I1"].tag == "INDI"
+
+    def test_read_record(self, sample):
+        index = load_index(sample)
+        indi = read_record(index, "@I3@")
+        assert isinstance(indi, LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD)
+        with sample.open("rb") as stream:
+            expected = next(
+                record
+                for record in iter_records(stream)
+                if isinstance(record, LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD) and record.INDI.args[0].id == "I3"
+            )
+        assert "".join(indi.iter_lines()) == "".join(expected.iter_lines())
+        assert isinstance(read_record(index, "U1"), SUBMITTER_RECORD)
+
+    def test_persisted(self, sample):
+        index = load_index(sample)
+        assert index_path(sample).exists()
+        # a valid persisted index is used as is
+        content = json.loads(index_path(sample).read_text())
+        content["records"]["X1"] = [0, 1, "INDI"]
+        index_path(sample).write_text(json.dumps(content))
+        assert "X1" in load_index(sample).records
+        # touching the file keeps it (same hash), unless verify finds it changed
+        os.utime(sample, ns=(index.mtime_ns + 10 ** 9, index.mtime_ns + 10 ** 9))
+        assert "X1" in load_index(sample).records
+
+    def test_invalidated(self, sample):
+        load_index(sample)
+        text = sample.read_text(encoding="utf-8-sig").replace("0 TRLR", "0 @I4@ INDI\n1 SEX F\n0 TRLR")
+        sample.write_text(text, encoding="utf-8-sig")
+        assert "I4" in load_index(sample).records
+        # same size, different content
+        sample.write_text(text.replace("1 SEX F", "1 SEX M"), encoding="utf-8-sig")
+        index = load_index(sample, verify=True)
+        assert "".join(read_record(index, "I4").iter_lines()) == "0 @I4@ INDI\n1 SEX M\n"
+
+    def test_not_saved(self, sample, monkeypatch, caplog):
+        def dump(content, fp):
+            fp.write("{")
+            raise TypeError("not serializable")
+
+        monkeypatch.setattr(json, "dump", dump)
+        with caplog.at_level(logging.WARNING):
+            save_index(build_index(sample))
+        assert "<index-not-saved:" in caplog.text
+        assert sorted(path.name for path in sample.parent.iterdir()) == [sample.name]
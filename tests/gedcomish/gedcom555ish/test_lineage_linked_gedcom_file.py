@@ -1,6 +1,7 @@
 import contextlib
 import datetime
 import inspect
+import io
 import logging
 import pathlib
 import tempfile
@@ -42,6 +43,7 @@ from gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
     TEXTs,
 )
 from gedcomish.gedcom555ish.primitives import *
+from gedcomish.gedcom555ish.reader import read_file
 
 gedcomish.configure.configure()
 logger = logging.getLogger(__name__)
@@ -396,6 +398,26 @@ class TestExampleFiles:
     def test_minimal555(self, case_insensitive, granularity):
         self.check_similarity(self.get_minimal555(), case_insensitive, granularity, "MINIMAL555.GED")
 
+    @pytest.mark.parametrize("name", ["555SAMPLE.GED", "MINIMAL555.GED"])
+    def test_streaming_matches_lines(self, name):
+        ex = self.get_555sample() if name == "555SAMPLE.GED" else self.get_minimal555()
+        expected = ex(lines=GEDCOM_LINES(), delta_level=0)(0)
+        assert "".join(ex.iter_lines()) == expected
+        with NamedTemporaryFile(suffix=".ged") as fp:
+            ex.write_to(fp, encoding="utf-8-sig")
+            fp.close()
+            assert pathlib.Path(fp.name).read_bytes() == expected.encode("utf-8-sig")
+        text = io.StringIO()
+        ex.write_to(text)
+        assert text.getvalue() == expected
+
+    @pytest.mark.parametrize("name", ["555SAMPLE.GED", "MINIMAL555.GED"])
+    def test_read_matches_model(self, name):
+        ex = self.get_555sample() if name == "555SAMPLE.GED" else self.get_minimal555()
+        path = pathlib.Path(inspect.getframeinfo(inspect.currentframe()).filename).resolve().parent / name
+        with path.open("rb") as stream:
+            assert "".join(read_file(stream).iter_lines()) == "".join(ex.iter_lines())
+
 
 def _address_structure():
     sure = ADDRESS_STRUCTURE()
@@ -851,7 +873,7 @@ class TestGenerateFull:
         # <<FAM_GROUP_RECORD>>
         ########################################################################
         fam = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD()
-        fam.FAM("XREF:FAM")
+        fam.FAM = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM("XREF:FAM")
         fam.FAM.FAMILY_EVENT_STRUCTUREs = list(_family_event_structures(M))
         fam.FAM.HUSB = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.HUSB("XREF:INDI")
         fam.FAM.WIFE = LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD.FAM.WIFE("XREF:INDI")
@@ -868,7 +890,7 @@ class TestGenerateFull:
         # <<INDIVIDUAL_RECORD>>
         ########################################################################
         indi = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD()
-        indi.INDI("XREF:INDI")
+        indi.INDI = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI("XREF:INDI")
         indi.INDI.PERSONAL_NAME_STRUCTUREs = M * [_personal_name_structure(M)]
         indi.INDI.SEX = LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI.SEX("SEX_VALUE")
         indi.INDI.INDIVIDUAL_EVENT_STRUCTUREs = list(_individual_event_structures(M))
@@ -0,0 +1,123 @@
+import gc
+import io
+import logging
+import os
+import pathlib
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
+    GEDCOM_FORM_HEADER_EXTENSIONs,
+    GEDCOM_HEADER,
+    GEDCOM_TRAILER,
+    SUBMITTER_RECORD,
+    LINEAGE_LINKED_RECORDs,
+)
+from gedcomish.gedcom555ish.reader import (
+    date_arguments,
+    iter_lines,
+    iter_records,
+    parse_parallel,
+    read_file,
+    split_ranges,
+)
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+HERE = pathlib.Path(__file__).resolve().parent
+
+
+class TestReader:
+    @pytest.mark.parametrize("name", ["555SAMPLE.GED", "MINIMAL555.GED"])
+    def test_round_trip(self, name):
+        with (HERE / name).open("rb") as stream:
+            written = "".join(read_file(stream).iter_lines())
+        original = (HERE / name).read_text(encoding="utf-8-sig")
+        assert set(written.casefold().splitlines()) == set(original.casefold().splitlines())
+        assert "".join(read_file(io.StringIO(written)).iter_lines()) == written
+
+    def test_one_record_at_a_time(self):
+        with (HERE / "555SAMPLE.GED").open("rb") as stream:
+            records = [record.__class__ for record in iter_records(stream)]
+        assert records == [
+            GEDCOM_HEADER,
+            GEDCOM_FORM_HEADER_EXTENSIONs.LINEAGE_LINKED_HEADER_EXTENSION,
+            SUBMITTER_RECORD,
+            *3 * [LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD],
+            *2 * [LINEAGE_LINKED_RECORDs.FAM_GROUP_RECORD],
+            LINEAGE_LINKED_RECORDs.SOURCE_RECORD,
+            LINEAGE_LINKED_RECORDs.REPOSITORY_RECORD,
+            GEDCOM_TRAILER,
+        ]
+
+    def test_stream_stays_open(self):
+        with (HERE / "555SAMPLE.GED").open("rb") as stream:
+            read_file(stream)
+            stream.seek(0)
+            records = iter_records(stream)
+            next(records)
+            del records
+            gc.collect()
+            assert not stream.closed
+            assert stream.read(0) == b""
+
+    def test_reads_lazily(self):
+        consumed = list()
+
+        def lines():
+            for line in (HERE / "555SAMPLE.GED").read_text(encoding="utf-8-sig").splitlines(keepends=True):
+                consumed.append(line)
+                yield line
+
+        records = iter_records(lines())
+        next(records)
+        # the header is done when the submitter record starts (plus one line to look for CONT/CONC)
+        assert consumed[-2:] == ["0 @U1@ SUBM\n", "1 NAME Reldon Poulson\n"]
+
+    def test_cont_conc(self):
+        text = "0 @N1@ NOTE first\n1 CONC  line\n1 CONT second line\n0 TRLR\n"
+        nodes = list(iter_lines(io.StringIO(text)))
+        assert [node.tag for node in nodes] == ["NOTE", "TRLR"]
+        assert nodes[0].line_value == f"first line{os.linesep}second line"
+        note, _ = iter_records(io.StringIO(text))
+        assert isinstance(note, LINEAGE_LINKED_RECORDs.NOTE_RECORD)
+        assert "".join(note.iter_lines()) == "0 @N1@ NOTE first line\n1 CONT second line\n"
+
+    def test_note_structures(self):
+        (indi,) = iter_records(io.StringIO("0 @I1@ INDI\n1 NOTE @N1@\n1 NOTE text\n"))
+        assert "".join(indi.iter_lines()) == "0 @I1@ INDI\n1 NOTE text\n1 NOTE @N1@\n"
+
+    def test_split_ranges(self):
+        data = (HERE / "555SAMPLE.GED").read_bytes()
+        ranges = split_ranges(HERE / "555SAMPLE.GED", 8)
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start and data[start - 1 : start + 2] == b"\n0 "
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parse_parallel(self, workers):
+        with (HERE / "555SAMPLE.GED").open("rb") as stream:
+            expected = ["".join(record.iter_lines()) for record in iter_records(stream)]
+        records = parse_parallel(HERE / "555SAMPLE.GED", workers, chunk_size=256)
+        assert ["".join(record.iter_lines()) for record in records] == expected
+
+    @pytest.mark.parametrize(
+        "text, exact, expected",
+        [
+            ("2 Oct 1822", False, (("1822-10-02",), {})),
+            ("DEC 1859", False, (("1859-12",), {})),
+            ("from 1900 to 1905", False, ((), {"FROM": "1900", "TO": "1905"})),
+            ("BEF 1828", False, ((), {"BEF": "1828"})),
+            ("2 OCT 2019", True, (("2019-10-02",), {})),
+            ("OCT 2019", True, None),
+            ("(sometime in spring)", False, None),
+            ("@#DJULIAN@ 1 JAN 1700", False, None),
+            ("BET 1 MAR 1850 AND 1851", False, ((), {"BET": "1850-03-01", "AND": "1851"})),
+            ("31 FEB 1850", False, None),
+            ("INT 1850 (about then)", False, None),
+        ],
+    )
+    def test_date_arguments(self, text, exact, expected):
+        assert date_arguments(text, exact=exact) == expected
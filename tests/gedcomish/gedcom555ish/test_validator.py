@@ -0,0 +1,77 @@
+import io
+import logging
+import pathlib
+
+import gedcomish.configure
+from gedcomish.gedcom555ish.primitives import DATE_VALUE, ENTRY_RECORDING_DATE, NAME_PERSONAL
+from gedcomish.gedcom555ish.reader import read_file
+from gedcomish.gedcom555ish.validator import (
+    SIZES,
+    SizeViolation,
+    TagViolation,
+    size_of,
+    validate,
+    validate_stream,
+    validate_tags,
+)
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+HERE = pathlib.Path(__file__).parent
+
+INVALID = f"""0 HEAD
+1 GEDC
+2 VERS 5.5.5
+2 FORM LINEAGE-LINKED
+3 VERS 5.5.5
+1 CHAR UTF-8
+0 @I1@ INDI
+1 NAME {'A' * 130}/Andersson/
+1 BIRT
+2 DATE ABT 1850 OR SOMEWHERE AROUND THEN OR LATER
+2 PLAC Skövde
+0 @I2@ INDI
+1 NAME Anna/Persdotter/
+1 DEAT
+2 PLAC {'P' * 121}
+0 TRLR
+"""
+
+
+class TestValidator:
+    def test_sizes(self):
+        assert SIZES[NAME_PERSONAL] == (1, 120)
+        assert size_of(ENTRY_RECORDING_DATE) == (1, 90)
+        assert size_of(DATE_VALUE) == (1, 35)
+
+    def test_valid(self):
+        with (HERE / "MINIMAL555.GED").open("rb") as stream:
+            assert list(validate_stream(stream)) == []
+
+    def test_every_violation(self):
+        expected = [
+            SizeViolation("@I1@", "DATE", "DATE_VALUE", 42, (1, 35), "ABT 1850 OR SOMEWHERE AROUND THEN OR LATER"),
+            SizeViolation("@I1@", "NAME", "NAME_PERSONAL", 141, (1, 120), f"{'A' * 130}/Andersson/"),
+            SizeViolation("@I2@", "PLAC", "PLACE_NAME", 121, (1, 120), "P" * 121),
+        ]
+        assert sorted(validate_stream(io.StringIO(INVALID))) == expected
+        assert sorted(validate(read_file(io.StringIO(INVALID)))) == expected
+
+    def test_long_name_is_written(self):
+        name = "Anna " * 80
+        text = INVALID.replace("1 NAME Anna/Persdotter/\n", f"1 NAME {name}\n2 GIVN Anna\n")
+        structure = read_file(io.StringIO(text))
+        lines = "".join(structure.iter_lines()).splitlines()
+        assert "2 GIVN Anna" in lines
+        assert not any(line.startswith("2 CONC") for line in lines)
+        assert SizeViolation("@I2@", "NAME", "NAME_PERSONAL", len(name), (1, 120), name) in validate(structure)
+
+    def test_tags(self):
+        with (HERE / "555SAMPLE.GED").open("rb") as stream:
+            assert list(validate_tags(stream)) == []
+        text = INVALID.replace("1 BIRT\n", "1 SEX F\n1 SEX M\n1 BIRT\n2 FOO bar\n")
+        assert list(validate_tags(io.StringIO(text))) == [
+            TagViolation("@I1@", "LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD.INDI", "SEX", "repeated"),
+            TagViolation("@I1@", "INDIVIDUAL_EVENT_STRUCTUREs.BIRT", "FOO", "unknown"),
+        ]
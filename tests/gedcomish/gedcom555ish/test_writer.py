@@ -0,0 +1,42 @@
+import io
+import logging
+import pathlib
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.gedcom555ish.lineage_linked_gedcom_file import SUBMITTER_RECORD
+from gedcomish.gedcom555ish.reader import read_file
+from gedcomish.gedcom555ish.writer import split_records, write_parallel
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+HERE = pathlib.Path(__file__).resolve().parent
+
+
+@pytest.fixture(scope="module")
+def sample():
+    with (HERE / "555SAMPLE.GED").open("rb") as stream:
+        return read_file(stream)
+
+
+class TestWriter:
+    def test_split_records(self, sample):
+        shell, records, trailer = split_records(sample)
+        assert len(records) == 7
+        assert "".join(trailer.iter_lines()) == "0 TRLR\n"
+        lines = "".join(shell.iter_lines())
+        assert lines.startswith("0 HEAD\n") and "0 @U1@ SUBM\n" in lines and "INDI" not in lines
+        # the file itself is left as is
+        assert len(sample.FORM_RECORDS.LINEAGE_LINKED_RECORDs) == 7
+        assert isinstance(sample.FORM_RECORDS.SUBMITTER_RECORD, SUBMITTER_RECORD)
+
+    @pytest.mark.parametrize("workers, chunk_size", [(1, 1), (1, 1000), (2, 2)])
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig"])
+    def test_identical_to_serial(self, sample, workers, chunk_size, encoding):
+        serial = io.BytesIO()
+        sample.write_to(serial, encoding=encoding)
+        parallel = io.BytesIO()
+        write_parallel(sample, parallel, workers=workers, chunk_size=chunk_size, encoding=encoding)
+        assert parallel.getvalue() == serial.getvalue()
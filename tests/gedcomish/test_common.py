@@ -0,0 +1,244 @@
+import collections
+import gc
+import io
+import logging
+import pickle
+import threading
+import time
+import uuid
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.common import GEDCOM_LINES, Common, FieldKind, compile_plan, utf8_chunksplit
+from gedcomish.gedcom555ish.lineage_linked_gedcom_file import (
+    ADDRESS_STRUCTURE,
+    GEDCOM_HEADER,
+    LINEAGE_LINKED_RECORDs,
+    SUBMITTER_RECORD,
+)
+from gedcomish.gedcom555ish.primitives import DATE_VALUE, NAME_PERSONAL, SYSTEM_ID, USER_TEXT, XREF_SUBM
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+
+class TestMeta:
+    def test_keyword_overrides_inherited(self):
+        class BASE(Common, Size=(1, 2)):
+            pass
+
+        class DERIVED(BASE, Size=(3, 4)):
+            pass
+
+        assert (BASE.Size, DERIVED.Size) == ((1, 2), (3, 4))
+
+    def test_keyword_does_not_override_namespace(self):
+        with pytest.warns(Warning, match=r"\(defines Size:\(5, 6\) itself\)"):
+
+            class DEFINED(Common, Size=(3, 4)):
+                Size = (5, 6)
+
+        assert DEFINED.Size == (5, 6)
+
+
+class TestSerializationPlan:
+    def test_plan_is_compiled_once(self):
+        assert compile_plan(GEDCOM_HEADER.HEAD) is compile_plan(GEDCOM_HEADER.HEAD)
+
+    def test_plan_fields_follow_docstring_order(self):
+        plan = compile_plan(GEDCOM_HEADER.HEAD)
+        assert [field.name for field in plan.fields] == ["GEDC", "CHAR"]
+        assert plan.fields[0].kind == FieldKind.TAG
+        assert plan.fields[1].kind == FieldKind.PRIMITIVE
+        assert plan.fields[1].delta_level == 1
+
+    def test_plan_fields_describe_iterables(self):
+        fields = {field.name: field for field in compile_plan(ADDRESS_STRUCTURE).fields}
+        assert fields["PHONs"].iterable
+        assert fields["PHONs"].cls is ADDRESS_STRUCTURE.PHON
+        assert not fields["PHON"].iterable
+        fields = {field.name: field for field in compile_plan(LINEAGE_LINKED_RECORDs.INDIVIDUAL_RECORD).fields}
+        assert fields["INDI"].kind == FieldKind.POINTER
+
+    def test_plan_is_invalidated_by_class_attributes(self):
+        class ATTRIBUTED(ADDRESS_STRUCTURE):
+            pass
+
+        plan = compile_plan(ATTRIBUTED)
+        assert plan.value_names == tuple()
+        ATTRIBUTED.WWWs = [ADDRESS_STRUCTURE.WWW("www.gedcom.org")]
+        plan = compile_plan(ATTRIBUTED)
+        assert plan.value_names == ("WWWs",)
+        assert ATTRIBUTED()(lines=GEDCOM_LINES())(0) == "1 WWW www.gedcom.org\n"
+
+    def test_only_derived_plans_are_invalidated(self):
+        class PARENT(ADDRESS_STRUCTURE):
+            pass
+
+        class CHILD(PARENT):
+            pass
+
+        parent, child, submitter = compile_plan(PARENT), compile_plan(CHILD), compile_plan(SUBMITTER_RECORD)
+        PARENT.__doc__ = "PARENT"
+        assert compile_plan(SUBMITTER_RECORD) is submitter
+        assert compile_plan(CHILD) is not child
+        assert compile_plan(PARENT) is not parent
+
+    def test_cached_plans_render_identically(self):
+        subm = SUBMITTER_RECORD()
+        subm.SUBM = SUBMITTER_RECORD.SUBM("U1")
+        subm.SUBM.NAME = SUBMITTER_RECORD.SUBM.NAME("Reldon Poulson")
+        subm.SUBM.ADDRESS_STRUCTURE = ADDRESS_STRUCTURE()
+        subm.SUBM.ADDRESS_STRUCTURE.ADDR = ADDRESS_STRUCTURE.ADDR()
+        subm.SUBM.ADDRESS_STRUCTURE.ADDR.CITY = ADDRESS_STRUCTURE.ADDR.CITY("Billings")
+        expected = "0 @U1@ SUBM\n1 ADDR\n2 CITY Billings\n1 NAME Reldon Poulson\n"
+        assert subm(lines=GEDCOM_LINES())(0) == expected
+        assert subm(lines=GEDCOM_LINES())(0) == expected
+
+
+class TestWalk:
+    def test_nested_errors_propagate(self):
+        class BROKEN(ADDRESS_STRUCTURE):
+            def walk(self, *, lines, delta_level=0):
+                raise RuntimeError("broken")
+
+        structure = ADDRESS_STRUCTURE()
+        structure.broken = BROKEN()
+        with pytest.raises(RuntimeError, match="broken"):
+            list(structure.iter_lines())
+
+    def test_raw_stream_stays_open_on_error(self, tmp_path):
+        class BROKEN(ADDRESS_STRUCTURE):
+            def walk(self, *, lines, delta_level=0):
+                raise RuntimeError("broken")
+
+        structure = ADDRESS_STRUCTURE()
+        structure.broken = BROKEN()
+        with io.FileIO(tmp_path / "broken.ged", "w") as raw:
+            with pytest.raises(RuntimeError, match="broken"):
+                structure.write_to(raw)
+            gc.collect()
+            assert not raw.closed
+
+
+class TestSlots:
+    def test_primitives_have_no_dict(self):
+        for primitive in [DATE_VALUE("1822-10-02"), NAME_PERSONAL("Anna"), XREF_SUBM("U1")]:
+            assert not hasattr(primitive, "__dict__")
+        assert NAME_PERSONAL("Anna").kwargs == dict()
+        assert DATE_VALUE(FROM="1900", TO="1905").kwargs == {"FROM": "1900", "TO": "1905"}
+
+    def test_kwargs_are_not_lost(self):
+        name = NAME_PERSONAL("Anna")
+        with pytest.raises(TypeError):
+            name.kwargs["TYPE"] = "birth"
+        name.kwargs = {"TYPE": "birth"}
+        name.kwargs["LANG"] = "Swedish"
+        assert name.kwargs == {"TYPE": "birth", "LANG": "Swedish"}
+
+    def test_substructures_have_dict(self):
+        subm = SUBMITTER_RECORD()
+        subm.SUBM = SUBMITTER_RECORD.SUBM("U1")
+        assert vars(subm) == {"SUBM": subm.SUBM}
+
+    @pytest.mark.parametrize(
+        "date, expected",
+        [(DATE_VALUE("1822-10-02"), "2 OCT 1822"), (DATE_VALUE(FROM="1900", TO="1905"), "FROM 1900 TO 1905")],
+    )
+    def test_dates_render_and_pickle(self, date, expected):
+        assert str(date) == expected
+        assert str(pickle.loads(pickle.dumps(date))) == expected
+
+
+class TestGedcomLines:
+    def test_levels_are_resolved_at_render(self):
+        lines = GEDCOM_LINES()
+        lines.add_primitives(0, "HEAD")
+        lines.add_primitives(1, "SOUR", SYSTEM_ID("GS"))
+        lines.add_primitives(0, "SUBM", xref_id=XREF_SUBM("U1"))
+        assert lines(0) == "0 HEAD\n1 SOUR GS\n0 @U1@ SUBM\n"
+        assert lines(2) == "2 HEAD\n3 SOUR GS\n2 @U1@ SUBM\n"
+
+    def test_tags_are_interned(self):
+        lines = GEDCOM_LINES()
+        lines.add_primitives(0, "NOTE", USER_TEXT("first\nsecond"))
+        lines.add_primitives(0, "NOTE", USER_TEXT("third"))
+        assert len(lines) == 3
+        assert lines.tags[0] == lines.tags[2] != lines.tags[1]
+        assert lines(0) == "0 NOTE first\n1 CONT second\n0 NOTE third\n"
+
+    def test_tags_are_interned_once_across_threads(self, monkeypatch):
+        class SlowList(list):
+            # NOTE: lets another thread in between looking a tag up and entering it
+            def append(self, item):
+                time.sleep(0.0001)
+                super().append(item)
+
+        tags = [f"_T{uuid.uuid4().hex[:8].upper()}" for _ in range(100)]
+        barrier = threading.Barrier(8)
+        found = collections.defaultdict(set)
+
+        def intern():
+            lines = GEDCOM_LINES()
+            barrier.wait()
+            for tag in tags:
+                lines.append(level_delta=0, tag=tag)
+            for tag, tag_id in zip(tags, lines.tags):
+                found[tag].add(tag_id)
+
+        tag_names = GEDCOM_LINES.tag_names
+        monkeypatch.setattr(GEDCOM_LINES, "tag_names", SlowList(tag_names))
+        threads = [threading.Thread(target=intern) for _ in range(8)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            tag_names[:] = GEDCOM_LINES.tag_names
+        assert all(found[tag] == {GEDCOM_LINES.tag_ids[tag]} for tag in tags)
+        assert all(tag_names[GEDCOM_LINES.tag_ids[tag]] == tag for tag in tags)
+        assert len(tag_names) == len(GEDCOM_LINES.tag_ids)
+
+    def test_drain_clears(self):
+        lines = GEDCOM_LINES()
+        lines.add_primitives(0, "TRLR")
+        assert list(lines.drain(0)) == ["0 TRLR\n"]
+        assert len(lines) == 0
+        assert lines(0) == ""
+
+
+class TestChunksplit:
+    @pytest.mark.parametrize("text", ["", "Skövde", "åäö" * 200, "他出生于斯德哥尔摩" * 100, "a" * 1000, "aå生😀" * 150])
+    @pytest.mark.parametrize("safe_chunksize", [4, 7, 241])
+    def test_chunks_fit_and_join(self, text, safe_chunksize):
+        chunks = list(utf8_chunksplit(text, safe_chunksize))
+        assert "".join(chunks) == text
+        assert all(0 < len(chunk.encode("utf-8")) <= safe_chunksize for chunk in chunks)
+        # every chunk but the last is as long as possible
+        assert all(
+            len(chunk.encode("utf-8")) + len(next_chunk[0].encode("utf-8")) > safe_chunksize
+            for chunk, next_chunk in zip(chunks, chunks[1:])
+        )
+
+    def test_character_larger_than_chunk(self):
+        with pytest.raises(ValueError):
+            list(utf8_chunksplit("😀", 3))
+
+    def test_long_text_is_concatenated(self):
+        text = "Född i Åmål. " * 100
+        lines = GEDCOM_LINES()
+        lines.add_primitives(0, "NOTE", USER_TEXT(text))
+        rendered = lines(0).splitlines()
+        assert rendered[0].startswith("0 NOTE ")
+        assert all(line.startswith("1 CONC ") for line in rendered[1:])
+        assert all(len(line.encode("utf-8")) <= 255 for line in rendered)
+        assert "".join([rendered[0][len("0 NOTE ") :]] + [line[len("1 CONC ") :] for line in rendered[1:]]) == text
+
+    def test_short_field_is_never_concatenated(self, caplog):
+        lines = GEDCOM_LINES()
+        with caplog.at_level(logging.WARNING, logger="gedcomish.common"):
+            lines.add_primitives(0, "NAME", NAME_PERSONAL("Anna " * 100))
+        assert len(lines) == 1
+        assert "<no-conc:NAME:" in caplog.text
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+
+import gedcomish.configure
+from gedcomish.configure import BoundedQueueHandler, PendingConfiguration, configure, loggers
+
+gedcomish.configure.configure()
+logger = logging.getLogger(__name__)
+
+
+class Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = list()
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestConfigure:
+    def test_levels(self):
+        try:
+            configure(levels={"gedcomish.common": "WARNING"})
+            assert logging.getLogger("gedcomish.common").level == logging.WARNING
+            assert logging.getLogger("genealogy.gedcomish.common").level == logging.WARNING
+        finally:
+            configure()
+
+    def test_queue(self):
+        collect = Collect()
+        try:
+            logging.getLogger("test_queue").addHandler(collect)
+            listeners = configure(backend="queue", maxsize=2)
+            queued = logging.getLogger("test_queue")
+            assert all(isinstance(handler, BoundedQueueHandler) for handler in queued.handlers)
+            for no in range(10):
+                queued.warning(f"record {no}")
+            for listener in listeners:
+                listener.stop()
+            assert [record.getMessage() for record in collect.records] == [f"record {no}" for no in range(10)]
+        finally:
+            logging.getLogger("test_queue").handlers = list()
+            configure()
+
+    def test_queue_undone(self):
+        try:
+            logging.getLogger("test_queue_undone").addHandler(Collect())
+            for listener in configure(backend="queue", maxsize=2):
+                listener.stop()
+            configure()
+            handlers = [handler for logger in loggers() for handler in logger.handlers]
+            assert not any(isinstance(handler, BoundedQueueHandler) for handler in handlers)
+            # NOTE: would wait for room on a queue no listener empties
+            for no in range(10):
+                logging.getLogger("test_queue_undone").warning(f"record {no}")
+            assert len(logging.getLogger("test_queue_undone").handlers[0].records) == 10
+        finally:
+            logging.getLogger("test_queue_undone").handlers = list()
+            configure()
+
+    def test_package(self):
+        try:
+            logging.getLogger("holgerish.html").handlers = list()
+            configure(package="holgerish")
+            assert logging.getLogger("holgerish.html").handlers
+            files = [getattr(handler, "baseFilename", "") for handler in logging.getLogger().handlers]
+            assert any("level-holgerish" in name for name in files)
+        finally:
+            configure()
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            configure(backend="async")
+
+    def test_lazy(self):
+        root = logging.getLogger()
+        try:
+            root.handlers = list()
+            assert configure(lazy=True) == []
+            assert [type(handler) for handler in root.handlers] == [PendingConfiguration]
+            collect = Collect()
+            logging.getLogger("test_lazy").addHandler(collect)
+            logging.getLogger("test_lazy").warning("first record")
+            assert root.handlers and not any(isinstance(handler, PendingConfiguration) for handler in root.handlers)
+            assert [record.getMessage() for record in collect.records] == ["first record"]
+            handlers = list(root.handlers)
+            configure(lazy=True)
+            assert root.handlers == handlers
+        finally:
+            logging.getLogger("test_lazy").handlers = list()
+            configure()
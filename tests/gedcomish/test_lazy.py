@@ -0,0 +1,18 @@
+import json
+import sys
+
+from gedcomish.lazy import lazy_import
+
+
+class TestLazyImport:
+    def test_imported(self):
+        assert lazy_import("json") is json
+
+    def test_missing(self):
+        assert lazy_import("no_such_module") is None
+
+    def test_lazy(self):
+        sys.modules.pop("csv", None)
+        csv = lazy_import("csv")
+        assert csv is sys.modules["csv"]
+        assert csv.QUOTE_ALL == 1
@@ -0,0 +1,36 @@
+import logging
+
+import holgerish.configure
+from holgerish.cache import ParseCache
+
+holgerish.configure.configure()
+logger = logging.getLogger(__name__)
+
+
+class TestParseCache:
+    def test_hits_and_misses(self, tmp_path):
+        cache = ParseCache(tmp_path, "1")
+        assert cache.get("text") is None
+        cache.put("text", {"parsed": ["text"]})
+        assert cache.get("text") == {"parsed": ["text"]}
+        assert cache.get("other text") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.stats() == f"parse cache {tmp_path}: 1 hits, 2 misses (33.3% hits)"
+        assert [path.suffix for path in tmp_path.rglob("*") if path.is_file()] == [".pickle"]
+
+    def test_version(self, tmp_path):
+        ParseCache(tmp_path, "1").put("text", "parsed by 1")
+        cache = ParseCache(tmp_path, "2")
+        assert cache.get("text") is None
+        cache.put("text", "parsed by 2")
+        assert cache.get("text") == "parsed by 2"
+        assert ParseCache(tmp_path, "1").get("text") == "parsed by 1"
+
+    def test_unreadable(self, tmp_path):
+        cache = ParseCache(tmp_path, "1")
+        cache.put("text", "parsed")
+        cache.path("text").write_bytes(b"not a pickle")
+        assert cache.get("text") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+        cache.put("text", "parsed again")
+        assert cache.get("text") == "parsed again"
@@ -0,0 +1,395 @@
+import logging
+import os
+import pickle
+import random
+import re
+import subprocess
+import sys
+
+import pytest
+
+import holgerish.configure
+from holgerish import html
+from holgerish.cache import ParseCache
+from holgerish.html import (
+    FAMILY_PERSON_REGEX,
+    Family,
+    FamilyAdult,
+    FamilyChild,
+    FamilyRelation,
+    FamilyUnion,
+    Ids,
+    PERSONREGISTER,
+    SECTION_SEPARATOR,
+    RegistryPerson,
+    add_family_info,
+    add_reg_person_info,
+    find_sections,
+    get_gedcom_families,
+    parser_version,
+    read_sections,
+    resync,
+    split_found_sections,
+    split_section,
+    stable_key,
+    unrecognized,
+)
+
+holgerish.configure.configure()
+logger = logging.getLogger(__name__)
+
+# a family section as Holger exports it, with two adult entries broken over two paragraphs (<BR>)
+SECTION = (
+    "<A NAME=12><P>"
+    "<CENTER><FONT SIZE=5>Familj 12</FONT></CENTER><P>"
+    "<B>Andersson, Anders</B>, född 1820-05-06 i Skövde, död 1880-01-02 i Hova.<BR>"
+    "Bosatt i Skövde.<P>"
+    "Gift 1845-05-06 i Skövde med<P>"
+    "<B>Persdotter, Anna Maria</B>, född 1822-03-04<BR>"
+    "i Hova. Bosatt i Skövde.<P>"
+    "Barn:<P>"
+    "* <B>Andersson, Per</B>, född 1846-07-08 i Skövde, se familj <A HREF=#13>13</A>.<P>"
+    "* <B>Andersson, Karin</B>, född 1848-09-10 i Skövde.<P>"
+)
+
+
+def family_section(fam_id: int) -> str:
+    return SECTION.replace("NAME=12", f"NAME={fam_id}").replace("Familj 12", f"Familj {fam_id}")
+
+
+ADULTS = (("Andersson, Anders", "1820-05-06"), ("Persdotter, Anna Maria", "1822-03-04"))
+# families 1 to 5 (as SECTION) and a person register of their adults
+EXPORT = SECTION_SEPARATOR.join(
+    [
+        *(family_section(fam_id) for fam_id in range(1, 6)),
+        "<BR>".join(
+            [
+                PERSONREGISTER,
+                *(
+                    f"<B>{name}</B> f {birthday} i Skövde <A HREF=#{fam_id}>{fam_id}</A>"
+                    for fam_id in range(1, 6)
+                    for name, birthday in ADULTS
+                ),
+            ]
+        )
+        + "<BR>",
+    ]
+)
+
+# free text (with false leads: Giftermålet, Barnen, <I>, anchors) to put in front of the tails
+WORDS = (
+    "enligt husförhörslängden flyttade familjen till Göteborg men återkom efter några år och tog över gården "
+    "Giftermålet Barnen Sambon Relationen Partnern * <I> i Skövde 1852 <A HREF=#12>12</A>"
+).split()
+# what may follow a note: entries, an anchor or nothing
+TAILS = (
+    "<B>Andersson, Per</B>, född 1846-07-08 i Skövde.",
+    "* <B>Andersson, Karin</B>, född 1848-09-10 i Skövde, död 1880-01-02 i Hova.",
+    "Gift 1845-05-06 i Skövde med",
+    "Barn:",
+    "<A NAME=13>",
+    "",
+)
+
+
+def corpus(length: int, size: int = 30):
+    """
+    size paragraphs of about length characters of free text, each followed by one of TAILS.
+    """
+    rng = random.Random(length)
+    for no in range(size):
+        words = list()
+        while sum(len(word) + 1 for word in words) < length:
+            words.append(rng.choice(WORDS))
+        yield " ".join((" ".join(words), TAILS[no % len(TAILS)])).strip()
+
+
+def previous_resync(text):
+    """
+    the scan resync replaces.
+    """
+    for start in range(0, len(text)):
+        if not unrecognized(text[start:]):
+            return start
+    return None
+
+
+def names(entries):
+    return [(part_no, entry.FIRSTNAMES, entry.SECONDNAMES.strip()) for part_no, entry in entries]
+
+
+class TestSplitSection:
+    def test_entries(self):
+        family = split_section(12, SECTION)
+        assert names(family.adults) == [(2, "Andersson", "Anders"), (5, "Persdotter", "Anna Maria")]
+        assert names(family.children) == [(8, "Andersson", "Per"), (9, "Andersson", "Karin")]
+        assert family.unions == [(7, FamilyUnion(None, None, None))]
+        assert family.relations == [(4, FamilyRelation("Gift", " 1845-05-06", None, "Skövde", None))]
+        assert family.unknowns == []
+
+    def test_merged_paragraphs(self):
+        family = split_section(12, SECTION)
+        (_, husband), (_, wife) = family.adults
+        assert (husband.DEATHPLACE, husband.HOMEPLACE) == ("Hova", "Skövde")
+        assert (wife.BIRTHDAY, wife.BIRTHPLACE, wife.HOMEPLACE) == ("1822-03-04", "Hova", "Skövde")
+        (_, per), (_, karin) = family.children
+        assert (per.IS_CHILD, per.FAMILIES_SUFFIX_DIRECTION, per.FAMILIES_SUFFIX) == ("*", "se", " <A HREF=#13>13</A>")
+        assert (karin.BIRTHPLACE, karin.NOTES) == ("Skövde", "")
+
+    def test_entry_types(self):
+        section = SECTION.replace("Barn:<P>", "Barn i 2:a giftet:<P>Barn med Anna:<P>")
+        family = split_section(12, section)
+        assert [type(entry) for _, entry in family.adults + family.children] == [FamilyAdult] * 2 + [FamilyChild] * 2
+        assert FamilyAdult._fields == FamilyChild._fields == tuple(FAMILY_PERSON_REGEX.groupindex)
+        (_, per), _ = family.children
+        assert per._asdict() == {
+            **dict.fromkeys(FamilyChild._fields),
+            "IS_CHILD": "*",
+            "FIRSTNAMES": "Andersson",
+            "SECONDNAMES": " Per",
+            "BIRTHDAY": "1846-07-08",
+            "BIRTHPLACE": "Skövde",
+            "FAMILIES_SUFFIX_DIRECTION": "se",
+            "FAMILIES_SUFFIX": " <A HREF=#13>13</A>",
+            "NOTES": "",
+        }
+        assert family.unions == [
+            (7, FamilyUnion(MARRIAGE_NUMERAL=" 2:a ", UNKNOWN_PARTNER_BIOLOGICAL_PARENTAL_ROLE=None, PARTNER_NAME=None)),
+            (8, FamilyUnion(MARRIAGE_NUMERAL=None, UNKNOWN_PARTNER_BIOLOGICAL_PARENTAL_ROLE=None, PARTNER_NAME="Anna")),
+        ]
+        # NOTE: module level types, so families can be sent to and from worker processes
+        assert pickle.loads(pickle.dumps(family)) == family
+
+
+class TestResync:
+    @pytest.mark.parametrize("length", [10, 100, 500])
+    def test_corpus(self, length):
+        texts = list(corpus(length))
+        assert [resync(text) for text in texts] == [previous_resync(text) for text in texts]
+        assert sum(resync(text) is not None for text in texts) >= len(texts) * 4 // len(TAILS)
+
+    def test_parts_after_unknown(self):
+        # NOTE: the previous scan reused start (the first part after the header) for its offset, skipping later parts
+        section = (
+            "<A NAME=12><P>"
+            "<CENTER><FONT SIZE=5>Familj 12</FONT></CENTER><P>"
+            "Enligt husförhörslängden flyttade familjen till Göteborg men återkom. Barn:<P>"
+            "<B>Andersson, Anders</B>, född 1820-05-06 i Skövde.<P>"
+            "* <B>Andersson, Per</B>, född 1846-07-08 i Skövde.<P>"
+            "* <B>Andersson, Karin</B>, född 1848-09-10 i Skövde.<P>"
+        )
+        family = split_section(12, section)
+        assert family.unknowns == [
+            (2, "Enligt husförhörslängden flyttade familjen till Göteborg men återkom. "),
+            (2, "Barn:"),
+        ]
+        assert names(family.adults) == [(3, "Andersson", "Anders")]
+        assert names(family.children) == [(4, "Andersson", "Per"), (5, "Andersson", "Karin")]
+
+    def test_recognized_but_not_an_entry(self, monkeypatch):
+        # NOTE: resync and lookahead_matches agree on real text, so resync is made to disagree
+        note = "Enligt husförhörslängden flyttade familjen till Göteborg men återkom."
+        monkeypatch.setattr(html, "resync", lambda text: 0)
+        family = split_section(12, SECTION.replace("<B>Andersson, Anders</B>", f"{note}<P><B>Andersson, Anders</B>"))
+        assert family.unknowns == [(2, note)]
+        assert names(family.adults) == [(3, "Andersson", "Anders"), (6, "Persdotter", "Anna Maria")]
+
+
+def previous_registry_persons(ids, person_id):
+    """
+    the search Ids.registry_persons replaces.
+    """
+    return [entry for entry, entry_id in ids.items() if entry_id == person_id and isinstance(entry, RegistryPerson)]
+
+
+class TestIds:
+    def test_registry_persons(self):
+        rng = random.Random(0)
+        reg_persons = [RegistryPerson(f"Per{no}", "Andersson", None, "Skövde", (no % 7,)) for no in range(40)]
+        fam_persons = [FamilyAdult(*(f"{field}{no}" for field in FamilyAdult._fields)) for no in range(20)]
+        ids = Ids()
+        for _ in range(400):
+            reg_person, other = rng.choice(reg_persons), rng.choice(reg_persons)
+            operation = rng.random()
+            if operation < 0.4:
+                ids[reg_person]
+            elif operation < 0.6:
+                ids[rng.choice(fam_persons)] = ids[reg_person]
+            elif operation < 0.9:
+                # NOTE: merged with another, the order of the entries is kept
+                ids[reg_person] = ids[other]
+            elif reg_person in ids:
+                del ids[reg_person]
+        assert {reg_person for reg_person in reg_persons if reg_person in ids}
+        for person_id in set(ids.values()):
+            assert ids.registry_persons(person_id) == previous_registry_persons(ids, person_id)
+        assert ids.registry_persons("I0") == []
+
+
+    def test_sequential(self):
+        ids = Ids()
+        reg_person = RegistryPerson(("Anders",), ("Andersson",), "1820-05-06", ("Skövde",), (1,))
+        adult = split_section(12, SECTION).adults[1][1]
+        keys = [reg_person, adult, (1, "relation"), 2, reg_person]
+        assert [ids[key] for key in keys] == ["I1", "I2", "F1", "F2", "I1"]
+        ids[adult] = ids[reg_person]
+        assert ids[adult] == "I1"
+        assert ids.registry_persons("I1") == [reg_person]
+
+    def test_load_save(self, tmp_path):
+        path = tmp_path / "export.ids.json"
+        assert Ids.load(path) == dict()
+        ids = Ids()
+        reg_persons = [RegistryPerson((f"Per{no}",), ("Andersson",), None, None, (no,)) for no in range(3)]
+        for reg_person in reg_persons[0:2]:
+            ids[reg_person]
+        ids[1]
+        ids.save(path)
+        loaded = Ids.load(path)
+        # NOTE: the xrefs of the map are kept, new ones continue after the highest of each prefix
+        keys = [reg_persons[1], reg_persons[2], 2, reg_persons[0]]
+        assert [loaded[key] for key in keys] == ["I2", "I3", "F2", "I1"]
+
+    def test_stable_key(self):
+        reg_person = RegistryPerson(("Anders",), ("Andersson",), "1820-05-06", ("Skövde",), (1,))
+        adult = split_section(12, SECTION).adults[0][1]
+        # NOTE: the rest of the text of an entry may be corrected without it getting another xref
+        assert stable_key(reg_person._replace(birthplace=("Hova",))) == stable_key(reg_person)
+        assert stable_key(adult._replace(HOMEPLACE="Hova", NOTES="Soldat.")) == stable_key(adult)
+        assert stable_key(reg_person._replace(birthday="1820-05-07")) != stable_key(reg_person)
+        assert stable_key(adult._replace(BIRTHDAY="1820-05-07")) != stable_key(adult)
+        assert stable_key(FamilyChild(*adult)) != stable_key(adult)
+
+    def test_alike_entries(self, tmp_path):
+        path = tmp_path / "export.ids.json"
+        adult = split_section(12, SECTION).adults[0][1]
+        alike = [adult._replace(HOMEPLACE=place) for place in ("Skövde", "Hova", "Mariestad")]
+        ids = Ids()
+        assert [ids[entry] for entry in alike] == ["I1", "I2", "I3"]
+        ids.save(path)
+        loaded = Ids.load(path)
+        assert [loaded[entry] for entry in alike] == ["I1", "I2", "I3"]
+
+    def test_by_id_reassigned(self):
+        ids = Ids()
+        first, second = (RegistryPerson((name,), ("Andersson",), None, None, (1,)) for name in ("Anders", "Per"))
+        assert (ids[first], ids[second]) == ("I1", "I2")
+        ids[second] = "I1"
+        assert (ids.registry_persons("I1"), ids.registry_persons("I2")) == ([first, second], [])
+        ids[first] = "I2"
+        assert (ids.registry_persons("I1"), ids.registry_persons("I2")) == ([second], [first])
+        del ids[first]
+        assert ids.registry_persons("I2") == []
+
+    def test_freeform_partner(self):
+        section = split_found_sections(find_sections(EXPORT))[1]
+        (_, adult), _ = section.family.adults
+        # NOTE: married to someone only described in text (an unknown), not to an entry
+        family = Family(
+            adults=[(2, adult)],
+            children=[],
+            unions=[],
+            relations=[(3, FamilyRelation("Gift", None, None, None, None))],
+            unknowns=[(4, "en kvinna från Hova.")],
+        )
+        sections = {1: section._replace(family=family)}
+        ids = Ids()
+        add_reg_person_info(ids, sections)
+        add_family_info(ids, sections)
+        (famrecord,) = get_gedcom_families(ids, 1, sections[1])
+        assert "".join(famrecord.iter_lines()) == "0 @F1@ FAM\n1 HUSB @I1@\n"
+
+    def test_conversions(self, tmp_path):
+        # NOTE: in processes of their own, with other hash seeds, the second with the families in reverse order
+        first, second = tmp_path / "first", tmp_path / "second"
+        sections = EXPORT.split(SECTION_SEPARATOR)
+        texts = {first: EXPORT, second: SECTION_SEPARATOR.join([*reversed(sections[0:-1]), sections[-1]])}
+        for seed, (directory, text) in enumerate(texts.items()):
+            directory.mkdir()
+            (directory / "export.htm").write_text(text, encoding="utf-8")
+            subprocess.run(
+                [sys.executable, "-m", "genealogy.holgerish.html", "--holger", "export.htm", "--encoding", "utf-8"]
+                + ["--id-map", str(tmp_path / "export.ids.json")],
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "PYTHONHASHSEED": str(seed)},
+                check=True,
+                capture_output=True,
+            )
+
+        def records(directory):
+            text = (directory / "export.ged").read_text(encoding="utf-8-sig")
+            # NOTE: the records (the header has the time of the conversion)
+            return sorted(record for record in re.split(r"\n(?=0 )", text) if record.startswith("0 @"))
+
+        assert records(first) == records(second)
+        assert sum(record.startswith("0 @F") for record in records(first)) == 5
+
+    def test_id_map_opt_in(self, tmp_path):
+        (tmp_path / "export.htm").write_text(EXPORT, encoding="utf-8")
+        subprocess.run(
+            [sys.executable, "-m", "genealogy.holgerish.html", "--holger", "export.htm", "--encoding", "utf-8"],
+            cwd=tmp_path,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            check=True,
+            capture_output=True,
+        )
+        assert (tmp_path / "export.ged").exists()
+        assert not (tmp_path / "export.ids.json").exists()
+
+
+class TestSplitFoundSections:
+    def test_workers(self):
+        sections = find_sections(EXPORT)
+        expected = split_found_sections(sections, workers=1)
+        assert list(expected) == [1, 2, 3, 4, 5]
+        assert all(len(section.person) == 2 for section in expected.values())
+        assert all(section.family == split_section(12, SECTION) for section in expected.values())
+        found = split_found_sections(sections, workers=2, chunk_size=1)
+        assert list(found) == list(expected)
+        assert found == expected
+
+    def test_cache(self, tmp_path):
+        sections = find_sections(EXPORT)
+        expected = split_found_sections(sections)
+        cache = ParseCache(tmp_path, parser_version())
+        assert split_found_sections(sections, cache=cache) == expected
+        # NOTE: the five family sections are the same text but for their ids
+        assert (cache.hits, cache.misses) == (0, 5)
+        assert split_found_sections(sections, workers=2, chunk_size=1, cache=cache) == expected
+        assert (cache.hits, cache.misses) == (5, 5)
+
+    def test_cache_stats_printed(self, tmp_path):
+        (tmp_path / "export.htm").write_text(EXPORT, encoding="utf-8")
+        stats = list()
+        for _ in range(2):
+            completed = subprocess.run(
+                [sys.executable, "-m", "genealogy.holgerish.html", "--holger", "export.htm", "--encoding", "utf-8"]
+                + ["--cache", "cache", "--log-level", "__main__=ERROR"],
+                cwd=tmp_path,
+                env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            stats.append(completed.stdout.splitlines()[-1])
+        assert stats == [
+            "parse cache cache: 0 hits, 5 misses (0.0% hits)",
+            "parse cache cache: 5 hits, 0 misses (100.0% hits)",
+        ]
+
+
+class TestReadSections:
+    @pytest.mark.parametrize("encoding", ["latin-1", "utf-8", "utf-16"])
+    def test_encodings(self, tmp_path, encoding):
+        path = tmp_path / "export.htm"
+        # NOTE: with windows newlines, translated by both
+        path.write_text(EXPORT.replace("<P>", "<P>\n"), encoding=encoding, newline="\r\n")
+        text = path.read_text(encoding=encoding)
+        assert "\r" not in text
+        assert read_sections(path, encoding) == find_sections(text)
+        assert list(read_sections(path, encoding).family) == [1, 2, 3, 4, 5]
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "export.htm"
+        path.write_bytes(b"")
+        assert read_sections(path, "latin-1") == find_sections("")
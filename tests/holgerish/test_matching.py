@@ -0,0 +1,77 @@
+import itertools
+import logging
+import random
+
+import pytest
+
+import holgerish.configure
+from holgerish import matching
+from holgerish.matching import assign, margin, match, ngrams, score_matrix
+
+holgerish.configure.configure()
+logger = logging.getLogger(__name__)
+
+
+def brute_force(scores):
+    nof_rows, nof_columns = len(scores), len(scores[0])
+    size = min(nof_rows, nof_columns)
+    return max(
+        sum(scores[row][column] for row, column in zip(rows, columns))
+        for rows in itertools.combinations(range(nof_rows), size)
+        for columns in itertools.permutations(range(nof_columns), size)
+    )
+
+
+class TestMatching:
+    def test_ngrams(self):
+        assert ngrams("") == {}
+        assert ngrams("a") == {" a": 1, "a ": 1}
+        assert sum(ngrams("anna").values()) == 5
+
+    @pytest.mark.parametrize("shape", [(1, 1), (3, 3), (2, 5), (5, 2), (6, 6)])
+    def test_assign_is_optimal(self, shape):
+        rng = random.Random(sum(shape))
+        for _ in range(20):
+            scores = [[rng.choice([0.0, 0.5, 1.0, rng.random()]) for _ in range(shape[1])] for _ in range(shape[0])]
+            pairs = assign(scores)
+            assert len(pairs) == min(shape)
+            assert len({row for row, _ in pairs}) == len({column for _, column in pairs}) == len(pairs)
+            assert sum(scores[row][column] for row, column in pairs) == pytest.approx(brute_force(scores))
+
+    def test_assign_is_not_greedy(self):
+        # NOTE: greedy (row by row) would give row 0 column 0 and row 1 column 1, 1.0 + 0.0
+        assert assign([[1.0, 0.9], [0.8, 0.0]]) == [(0, 1), (1, 0)]
+
+    def test_match_priority(self):
+        scores = [[0.1], [0.9]]
+        assert [(found.row, found.column) for found in match(scores)] == [(1, 0)]
+        assert [(found.row, found.column) for found in match(scores, priority=1)] == [(0, 0)]
+        assert match(scores, priority=1)[0].score == 0.1
+
+    def test_margin(self):
+        scores = [[3.0, 1.0], [2.5, 0.5]]
+        assert margin(scores, 0, 0) == 0.5
+        assert margin([[1.0]], 0, 0) is None
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_score_matrix(self, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(matching, "numpy", None)
+        scores = score_matrix(
+            [(["Anna", "", "Per"], ["Anna", "", "Pehr"], 2.0), (["x", "y", "z"], ["x", "y", "z"], 1.0)]
+        )
+        assert len(scores) == 3 and all(len(row) == 3 for row in scores)
+        assert scores[0][0] == pytest.approx(3.0)
+        assert scores[1][1] == pytest.approx(3.0)
+        assert scores[0][1] == pytest.approx(0.0)
+        assert 1.0 < scores[2][2] < 3.0
+        assert scores[2][2] > scores[2][0]
+
+    def test_score_matrix_numpy_as_python(self, monkeypatch):
+        pytest.importorskip("numpy")
+        pairs = [(["Anna Maria", "Per", "", "Lisa"], ["Maria", "Pehr", "Lisa", ""], 1.0)]
+        expected = score_matrix(pairs)
+        monkeypatch.setattr(matching, "numpy", None)
+        assert score_matrix(pairs) == [pytest.approx(row) for row in expected]